@@ -47,6 +47,22 @@ gallery.appendChild(galleryGrid);
 // Cache busting version
 const version = '20250720.1805';
 
+// Widths per image from the manifest.json render_still writes into each category
+const ladders = {};
+
+async function loadLadders() {
+    await Promise.all(Object.keys(galleryData).map(async category => {
+        try {
+            const response = await fetch(`public/${category}/manifest.json?v=${version}`);
+            if (response.ok) {
+                ladders[category] = await response.json();
+            }
+        } catch (error) {
+            // No manifest: the category serves its single images
+        }
+    }));
+}
+
 // Function to create gallery item
 function createGalleryItem(category, item) {
     const div = document.createElement('div');
@@ -58,6 +74,18 @@ function createGalleryItem(category, item) {
     img.alt = item.title;
     img.loading = 'lazy';
     
+    // Grid cells get the smallest variant that fills them, the modal the largest
+    let fullSize = img.src;
+    const ladder = ladders[category] && ladders[category][item.file];
+    if (ladder) {
+        const variants = Object.entries(ladder.variants).sort((a, b) => a[0] - b[0]);
+        img.srcset = variants
+            .map(([width, file]) => `public/${category}/${file}?v=${version} ${width}w`)
+            .join(', ');
+        img.sizes = '(max-width: 768px) 100vw, 400px';
+        fullSize = `public/${category}/${variants[variants.length - 1][1]}?v=${version}`;
+    }
+    
     const info = document.createElement('div');
     info.className = 'gallery-info';
     
@@ -82,7 +110,7 @@ function createGalleryItem(category, item) {
     
     // Click handler
     img.addEventListener('click', () => {
-        modalImage.src = img.src;
+        modalImage.src = fullSize;
         modalTitle.textContent = item.title;
         modalDescription.textContent = item.description;
         modal.classList.add('active');
@@ -156,4 +184,4 @@ document.addEventListener('keydown', (e) => {
 });
 
 // Initialize gallery
-loadGallery();
\ No newline at end of file
+loadLadders().then(loadGallery);
\ No newline at end of file
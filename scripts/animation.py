@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Animation
+Keyframed motion for the neon scenes and rendering of frame ranges.
+
+A scene is built once as for a still, then animated in one of two modes:
+
+    turntable   the camera orbits the center of the scene's bounds once
+    motion      the scene's own motion (see MOTIONS in generate_all_neon.py),
+                e.g. tokens flowing along the stream or threads spinning
+
+Both loop: frame frames + 1 would equal frame 1, so the encoded clip
+repeats without a jump. render_frames() renders a slice of the frames with
+persistent data, so Blender builds the scene's render data once per
+process instead of once per frame; animation_render.py splits the frames
+over parallel Blender processes.
+"""
+import math
+import os
+
+import bpy
+from mathutils import Vector
+
+from framing import scene_bounds
+from quality_presets import apply_quality
+
+FRAME_PATTERN = "####"
+
+def _linear_keys():
+    """Make new keyframes linear; return the previous interpolation"""
+    edit = bpy.context.preferences.edit
+    previous = edit.keyframe_new_interpolation_type
+    edit.keyframe_new_interpolation_type = 'LINEAR'
+    return previous
+
+def spin(objects, frames, center=(0, 0, 0), turns=1, name="Spin"):
+    """Rotate objects about the vertical axis through center, turns times per loop"""
+    scene = bpy.context.scene
+    pivot = bpy.data.objects.new(name, None)
+    scene.collection.objects.link(pivot)
+    pivot.location = center
+    bpy.context.view_layer.update()
+    for obj in objects:
+        world = obj.matrix_world.copy()
+        obj.parent = pivot
+        obj.matrix_world = world
+
+    previous = _linear_keys()
+    try:
+        pivot.rotation_euler.z = 0
+        pivot.keyframe_insert('rotation_euler', index=2, frame=1)
+        pivot.rotation_euler.z = 2 * math.pi * turns
+        pivot.keyframe_insert('rotation_euler', index=2, frame=frames + 1)
+    finally:
+        bpy.context.preferences.edit.keyframe_new_interpolation_type = previous
+    scene.frame_start, scene.frame_end = 1, frames
+    return pivot
+
+def turntable(scene, frames):
+    """Orbit the camera once around the center of the visible geometry"""
+    corners = scene_bounds(scene, bpy.context.evaluated_depsgraph_get())
+    center = sum(corners, Vector()) / len(corners) if corners else Vector()
+    return spin([scene.camera], frames, center=center, name="Turntable")
+
+def keyframe_path(obj, frames, location_at):
+    """Key obj's location on every frame from location_at(phase), phase in [0, 1)"""
+    previous = _linear_keys()
+    try:
+        for frame in range(1, frames + 1):
+            obj.location = location_at((frame - 1) / frames)
+            obj.keyframe_insert('location', frame=frame)
+    finally:
+        bpy.context.preferences.edit.keyframe_new_interpolation_type = previous
+    bpy.context.scene.frame_start, bpy.context.scene.frame_end = 1, frames
+
+def render_frames(scene, directory, start, end):
+    """Render frames start to end into directory/####.png with persistent data"""
+    apply_quality(scene, master=False)
+    render = scene.render
+    render.use_persistent_data = True
+    render.image_settings.file_format = 'PNG'
+    render.filepath = os.path.join(os.path.abspath(directory), FRAME_PATTERN)
+    scene.frame_start, scene.frame_end = start, end
+    os.makedirs(directory, exist_ok=True)
+    bpy.ops.render.render(animation=True)
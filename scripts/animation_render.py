@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Animation Render
+Renders an animated scene with its frames split over parallel Blender workers.
+
+The loop's frames are cut into one contiguous range per worker. Every
+worker builds the scene once (same seed), animates it and renders its
+range with persistent data (see animation.py), using its share of the
+CPU threads. With build time paid once per worker, wall time falls
+roughly linearly with the number of workers until the cores run out.
+A last Blender process encodes the frames with its own FFmpeg output:
+
+    python3 scripts/animation_render.py render thinking/token_stream.png --animate motion
+    python3 scripts/animation_render.py render code/syntax_tree.png --frames 120 --workers 8 --format webm
+
+Blender's encoder writes MP4 (H.264) and WebM (VP9); it has no animated
+WebP, so WebM is the web-friendly alternative.
+
+The encode command runs inside Blender:
+
+    blender --background --python scripts/animation_render.py -- encode FRAMES_DIR OUTPUT --fps 30
+"""
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import QUALITY_PRESETS
+from render_jobs import ANIMATION_MODES, DEFAULT_FRAMES, DEFAULT_OUTPUT_ROOT, blender_argv, blender_command
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "generate_all_neon.py")
+DEFAULT_WORK_DIR = os.path.join(SCRIPT_DIR, "..", "render_logs", "animation")
+
+DEFAULT_FPS = 30
+# Blender's FFmpeg container and codec per output format
+VIDEO_FORMATS = {
+    'mp4': ('MPEG4', 'H264'),
+    'webm': ('WEBM', 'WEBM'),
+}
+
+def frame_ranges(frames, workers):
+    """Split frames 1..frames into at most workers contiguous (start, end) ranges"""
+    workers = max(1, min(workers, frames))
+    bounds = [1 + frames * i // workers for i in range(workers + 1)]
+    return [(start, end - 1) for start, end in zip(bounds, bounds[1:])]
+
+def chunk_jobs(args, frames_dir, log_dir):
+    name = os.path.splitext(args.scene)[0].replace(os.sep, '__')
+    threads = max(1, (os.cpu_count() or 1) // args.workers)
+    jobs = []
+    for start, end in frame_ranges(args.frames, args.workers):
+        options = ['--animate', args.animate, '--frames', str(args.frames), '--frame-range', f"{start},{end}",
+                   '--frames-dir', frames_dir, '--seed', str(args.seed)]
+        if args.quality:
+            options += ['--quality', args.quality]
+        command = blender_command(args.blender, args.script, [*options, args.scene])
+        command[1:1] = ['--threads', str(threads)]
+        jobs.append({
+            'name': f"{args.scene} frames {start}-{end}",
+            'frames': (start, end),
+            'command': command,
+            'log': os.path.join(log_dir, f"{name}.{start:04d}-{end:04d}.log"),
+        })
+    return jobs
+
+def run_chunk(job, frames_dir):
+    start = time.time()
+    with open(job['log'], 'w') as log:
+        job['returncode'] = subprocess.call(job['command'], stdout=log, stderr=subprocess.STDOUT)
+    job['duration'] = time.time() - start
+    first, last = job['frames']
+    job['ok'] = job['returncode'] == 0 and all(
+        os.path.exists(os.path.join(frames_dir, f"{frame:04d}.png")) for frame in range(first, last + 1))
+    return job
+
+def encode(frames_dir, output, fps=DEFAULT_FPS, video_format='mp4'):
+    """Encode frames_dir/*.png to output with Blender's sequencer and FFmpeg (inside Blender)"""
+    import bpy
+
+    frames = sorted(name for name in os.listdir(frames_dir) if name.endswith('.png'))
+    if not frames:
+        raise SystemExit(f"No frames in {frames_dir}")
+    scene = bpy.context.scene
+    editor = scene.sequence_editor_create()
+    strips = editor.strips if hasattr(editor, 'strips') else editor.sequences
+    strip = strips.new_image("Frames", os.path.join(frames_dir, frames[0]), channel=1, frame_start=1)
+    for name in frames[1:]:
+        strip.elements.append(name)
+
+    first = bpy.data.images.load(os.path.join(frames_dir, frames[0]), check_existing=False)
+    width, height = first.size
+    bpy.data.images.remove(first)
+
+    render = scene.render
+    render.resolution_x, render.resolution_y = width, height
+    render.resolution_percentage = 100
+    render.fps = fps
+    render.use_sequencer = True
+    scene.frame_start, scene.frame_end = 1, len(frames)
+    render.image_settings.file_format = 'FFMPEG'
+    container, codec = VIDEO_FORMATS[video_format]
+    render.ffmpeg.format = container
+    render.ffmpeg.codec = codec
+    render.ffmpeg.constant_rate_factor = 'HIGH'
+    render.ffmpeg.audio_codec = 'NONE'
+    # Blender appends the frame range to movie names; render to a stem and move
+    stem = os.path.join(os.path.abspath(frames_dir), "encoded_")
+    render.filepath = stem
+    bpy.ops.render.render(animation=True)
+
+    encoded = glob.glob(stem + "*")
+    if not encoded:
+        raise SystemExit(f"Blender wrote no video for {frames_dir}")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    shutil.move(max(encoded, key=os.path.getmtime), output)
+    print(f"Encoded {len(frames)} frames to {output} ({width}x{height}, {fps} fps)")
+
+def render_animation(args):
+    root = os.path.splitext(os.path.join(args.output, args.scene))[0]
+    output = f"{root}_{args.animate}.{args.format}"
+    name = os.path.splitext(args.scene)[0].replace(os.sep, '__')
+    work_dir = os.path.abspath(os.path.join(args.work_dir, f"{name}.{args.animate}"))
+    frames_dir = os.path.join(work_dir, "frames")
+    shutil.rmtree(frames_dir, ignore_errors=True)
+    os.makedirs(frames_dir)
+
+    jobs = chunk_jobs(args, frames_dir, work_dir)
+    print(f"Rendering {args.frames} frames of {args.scene} on {len(jobs)} workers")
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        jobs = list(pool.map(lambda job: run_chunk(job, frames_dir), jobs))
+    rendered = time.time() - start
+    broken = [job for job in jobs if not job['ok']]
+    if broken:
+        for job in broken:
+            print(f"  FAILED {job['name']} (see {job['log']})")
+        return 1
+    slowest = max(job['duration'] for job in jobs)
+    print(f"Rendered in {rendered:.1f}s ({args.frames / rendered:.2f} frames/s), slowest worker {slowest:.1f}s")
+
+    command = blender_command(args.blender, os.path.abspath(__file__),
+                              ['encode', frames_dir, output, '--fps', str(args.fps), '--format', args.format])
+    log_path = os.path.join(work_dir, "encode.log")
+    with open(log_path, 'w') as log:
+        if subprocess.call(command, stdout=log, stderr=subprocess.STDOUT) != 0:
+            print(f"  FAILED encoding (see {log_path})")
+            return 1
+    print(f"Saved {output} in {time.time() - start:.1f}s")
+    if not args.keep_frames:
+        shutil.rmtree(frames_dir)
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render animated scenes with frame-parallel Blender workers")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    render = commands.add_parser('render', help="Render and encode one scene's animation")
+    render.add_argument('scene', help="Scene of --script, e.g. thinking/token_stream.png")
+    render.add_argument('--animate', choices=ANIMATION_MODES, default='turntable',
+                        help="Camera turntable or the scene's own motion (default: turntable)")
+    render.add_argument('--frames', type=int, default=DEFAULT_FRAMES, help=f"Frames per loop (default: {DEFAULT_FRAMES})")
+    render.add_argument('--fps', type=int, default=DEFAULT_FPS, help=f"Frames per second (default: {DEFAULT_FPS})")
+    render.add_argument('--format', choices=list(VIDEO_FORMATS), default='mp4', help="Video format (default: mp4)")
+    render.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Parallel Blender processes")
+    render.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="Blender executable (default: $BLENDER or blender)")
+    render.add_argument('--script', default=DEFAULT_SCRIPT, help="Generator script")
+    render.add_argument('--output', default=DEFAULT_OUTPUT_ROOT, help="Output root the scene paths are relative to")
+    render.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED, help="Base seed")
+    render.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                        help="Quality preset for every frame (default: $GALLERY_QUALITY or final)")
+    render.add_argument('--work-dir', default=DEFAULT_WORK_DIR, help="Directory for frames and logs")
+    render.add_argument('--keep-frames', action='store_true', help="Keep the rendered frames")
+
+    encoder = commands.add_parser('encode', help="Encode rendered frames (inside Blender)")
+    encoder.add_argument('frames_dir')
+    encoder.add_argument('output')
+    encoder.add_argument('--fps', type=int, default=DEFAULT_FPS)
+    encoder.add_argument('--format', choices=list(VIDEO_FORMATS), default='mp4')
+
+    args = parser.parse_args(argv)
+    if args.command == 'encode':
+        encode(args.frames_dir, args.output, args.fps, args.format)
+        return 0
+    return render_animation(args)
+
+if __name__ == "__main__":
+    sys.exit(main(blender_argv() if '--' in sys.argv else sys.argv[1:]))
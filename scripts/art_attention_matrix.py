@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
 import bpy
 import math
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import MATERIAL_POOL
+from scene_builder import add_polylines, reset_scene
+from quality_presets import render_still
+from scene_seeds import seed_scene
 
 # ARTWORK 2: ATTENTION MATRIX - The Web of Focus
 # Where consciousness distributes its gaze across meaning
@@ -12,8 +20,8 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
+seed_scene("thinking/attention_matrix.png")
 
 # The void - pure black canvas
 world = bpy.data.worlds['World']
@@ -32,57 +40,21 @@ camera.data.lens = 50
 grid_size = 12
 cell_spacing = 1.2
 
-# First, create connection lines that form the grid
+# First, create connection lines that form the grid - all lines are
+# tubes of one curve object sharing one dim material
+grid_step = grid_size * cell_spacing / 20
+grid_lines = []
 for i in range(grid_size + 1):
-    # Horizontal lines
-    y = (i - grid_size/2) * cell_spacing
-    
-    # Create glowing line using small cylinders
-    for j in range(20):
-        x = (j - 10) * (grid_size * cell_spacing / 20)
-        
-        bpy.ops.mesh.primitive_cylinder_add(location=(x, y, 0))
-        line = bpy.context.object
-        line.scale = (0.02, 0.02, cell_spacing * grid_size / 40)
-        line.rotation_euler = (0, 1.57, 0)
-        
-        # Dim grid lines
-        mat = bpy.data.materials.new(f'GridH_{i}_{j}')
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        nodes.clear()
-        
-        emission = nodes.new('ShaderNodeEmission')
-        emission.inputs[0].default_value = (0.2, 0.2, 0.3, 1.0)  # Dim blue
-        emission.inputs[1].default_value = 1.5
-        
-        output = nodes.new('ShaderNodeOutputMaterial')
-        mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-        line.data.materials.append(mat)
+    offset = (i - grid_size/2) * cell_spacing
+    start = -10.5 * grid_step
+    end = 9.5 * grid_step
     
-    # Vertical lines
-    x = (i - grid_size/2) * cell_spacing
-    
-    for j in range(20):
-        y = (j - 10) * (grid_size * cell_spacing / 20)
-        
-        bpy.ops.mesh.primitive_cylinder_add(location=(x, y, 0))
-        line = bpy.context.object
-        line.scale = (0.02, 0.02, cell_spacing * grid_size / 40)
-        line.rotation_euler = (1.57, 0, 0)
-        
-        mat = bpy.data.materials.new(f'GridV_{i}_{j}')
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        nodes.clear()
-        
-        emission = nodes.new('ShaderNodeEmission')
-        emission.inputs[0].default_value = (0.2, 0.2, 0.3, 1.0)
-        emission.inputs[1].default_value = 1.5
-        
-        output = nodes.new('ShaderNodeOutputMaterial')
-        mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-        line.data.materials.append(mat)
+    # Horizontal and vertical line through this grid offset
+    grid_lines.append([(start, offset, 0), (end, offset, 0)])
+    grid_lines.append([(offset, start, 0), (offset, end, 0)])
+
+grid_mat = MATERIAL_POOL.get('emission', (0.2, 0.2, 0.3), 1.5)  # Dim blue
+add_polylines('Grid', grid_lines, radius=0.02, material=grid_mat)
 
 # Create attention nodes - where focus concentrates
 attention_weights = []
@@ -237,6 +209,6 @@ for i in range(30):
 
 # Render the artwork
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/attention_matrix.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Attention Matrix artwork complete!")
\ No newline at end of file
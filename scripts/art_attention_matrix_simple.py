@@ -2,6 +2,13 @@
 import bpy
 import math
 import random
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # ARTWORK 2: ATTENTION MATRIX - The Web of Focus
 # Where consciousness distributes its gaze
@@ -12,8 +19,8 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
+seed_scene("thinking/attention_matrix.png")
 
 # Pure black void
 world = bpy.data.worlds['World']
@@ -167,6 +174,6 @@ for i in range(40):
 
 # Render
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/attention_matrix.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Attention Matrix complete!")
\ No newline at end of file
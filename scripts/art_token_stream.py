@@ -2,6 +2,13 @@
 import bpy
 import math
 import random
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # ARTWORK 1: TOKEN STREAM - The River of Language
 # A flowing stream of consciousness where words become light
@@ -12,8 +19,8 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
+seed_scene("thinking/token_stream.png")
 
 # Pure black void - the canvas of consciousness
 world = bpy.data.worlds['World']
@@ -166,6 +173,6 @@ for i in range(5):
 
 # Render the artwork
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/token_stream.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Token Stream artwork complete!")
\ No newline at end of file
@@ -5,6 +5,12 @@ import math
 import random
 from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
 
@@ -26,8 +32,7 @@ def setup_scene():
     bpy.context.scene.render.film_transparent = True
     bpy.context.scene.render.image_settings.file_format = 'PNG'
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     bpy.ops.object.camera_add(location=location)
@@ -57,7 +62,7 @@ def render_white_bg(output_path):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     temp_path = output_path.replace('.png', '_temp.png')
     bpy.context.scene.render.filepath = temp_path
-    bpy.ops.render.render(write_still=True)
+    render_still(ladder=False)
     img = Image.open(temp_path)
     white_bg = Image.new('RGBA', img.size, (255, 255, 255, 255))
     white_bg.paste(img, (0, 0), img)
@@ -236,9 +241,13 @@ def create_decision_tree():
 
 # Run visualizations
 print("FINAL BATCH:")
+seed_scene("memory/knowledge_graph.png")
 create_knowledge_graph()
+seed_scene("consciousness/self_awareness_loop.png")
 create_self_awareness()
+seed_scene("interaction/response_generation.png")
 create_response_generation()
+seed_scene("problem_solving/decision_tree.png")
 create_decision_tree()
 
 print("\n✨ Gallery complete!")
\ No newline at end of file
@@ -5,6 +5,12 @@ import math
 import random
 from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import set_neon_emission
+from scene_builder import add_cone, add_cube, add_cylinder, add_ico_sphere, add_uv_sphere, reset_scene
+from quality_presets import render_still
 
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
 
@@ -26,8 +32,7 @@ def setup_scene():
     bpy.context.scene.render.film_transparent = True
     bpy.context.scene.render.image_settings.file_format = 'PNG'
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     bpy.ops.object.camera_add(location=location)
@@ -35,18 +40,6 @@ def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     camera.rotation_euler = rotation
     bpy.context.scene.camera = camera
 
-def create_neon_material(name, color, strength=3.0):
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
-    output = nodes.new('ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-    return mat
-
 def add_area_light(location=(0, 0, 5), energy=20):
     bpy.ops.object.light_add(type='AREA', location=location)
     light = bpy.context.object
@@ -57,7 +50,7 @@ def render_white_bg(output_path):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     temp_path = output_path.replace('.png', '_temp.png')
     bpy.context.scene.render.filepath = temp_path
-    bpy.ops.render.render(write_still=True)
+    render_still(ladder=False)
     img = Image.open(temp_path)
     white_bg = Image.new('RGBA', img.size, (255, 255, 255, 255))
     white_bg.paste(img, (0, 0), img)
@@ -83,13 +76,11 @@ def create_network_packets():
             y = math.sin(i * 0.3 + stream) * 1.5
             z = z_offset
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            packet = bpy.context.object
+            packet = add_cube(location=(x, y, z))
             packet.scale = (0.3, 0.2, 0.1)
             packet.rotation_euler = (0, i * 0.1, 0)
             
-            mat = create_neon_material(f"Packet{stream}{i}", color)
-            packet.data.materials.append(mat)
+            set_neon_emission(packet, color, 3.0)
     
     render_white_bg(base_path + "tools/network_packets.png")
 
@@ -100,11 +91,9 @@ def create_file_operations():
     add_area_light()
     
     # Central disk
-    bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, 0))
-    disk = bpy.context.object
+    disk = add_cylinder(location=(0, 0, 0))
     disk.scale = (2, 2, 0.1)
-    mat = create_neon_material("Disk", NEON_COLORS[3])
-    disk.data.materials.append(mat)
+    set_neon_emission(disk, NEON_COLORS[3], 3.0)
     
     # File operations radiating out
     operations = ['read', 'write', 'delete', 'create']
@@ -119,22 +108,20 @@ def create_file_operations():
             z = 0.5
             
             if op_type == 0:  # Read
-                bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+                obj = add_cube(location=(x, y, z))
                 color = NEON_COLORS[1]
             elif op_type == 1:  # Write
-                bpy.ops.mesh.primitive_cone_add(location=(x, y, z))
+                obj = add_cone(location=(x, y, z))
                 color = NEON_COLORS[4]
             elif op_type == 2:  # Delete
-                bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
+                obj = add_cylinder(location=(x, y, z))
                 color = NEON_COLORS[0]
             else:  # Create
-                bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z))
+                obj = add_uv_sphere(location=(x, y, z))
                 color = NEON_COLORS[5]
             
-            obj = bpy.context.object
             obj.scale = (0.15, 0.15, 0.15)
-            mat = create_neon_material(f"Op{i}{j}", color)
-            obj.data.materials.append(mat)
+            set_neon_emission(obj, color, 3.0)
     
     render_white_bg(base_path + "tools/file_operations.png")
 
@@ -157,11 +144,9 @@ def create_system_calls():
             x = math.cos(angle) * 2
             y = math.sin(angle) * 2
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            node = bpy.context.object
+            node = add_ico_sphere(location=(x, y, z))
             node.scale = (size, size, size)
-            mat = create_neon_material(f"{layer_name}{i}", color)
-            node.data.materials.append(mat)
+            set_neon_emission(node, color, 3.0)
     
     # Connections between layers
     for i in range(6):
@@ -172,11 +157,9 @@ def create_system_calls():
         for z1, z2 in [(0, 1.5), (1.5, 3)]:
             mid_z = (z1 + z2) / 2
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, y, mid_z))
-            conn = bpy.context.object
+            conn = add_cylinder(location=(x, y, mid_z))
             conn.scale = (0.05, 0.05, 0.75)
-            mat = create_neon_material(f"Conn{i}{z1}", NEON_COLORS[7])
-            conn.data.materials.append(mat)
+            set_neon_emission(conn, NEON_COLORS[7], 3.0)
     
     render_white_bg(base_path + "tools/system_calls.png")
 
@@ -187,12 +170,10 @@ def create_process_threads():
     add_area_light()
     
     # Main process
-    bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, 0))
-    process = bpy.context.object
+    process = add_cylinder(location=(0, 0, 0))
     process.scale = (0.5, 0.5, 3)
     process.rotation_euler = (1.57, 0, 0)
-    mat = create_neon_material("Process", NEON_COLORS[2])
-    process.data.materials.append(mat)
+    set_neon_emission(process, NEON_COLORS[2], 3.0)
     
     # Threads spiraling around
     for i in range(4):
@@ -207,11 +188,9 @@ def create_process_threads():
             y = math.sin(angle) * radius
             z = (j - 15) * 0.2
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            thread = bpy.context.object
+            thread = add_ico_sphere(location=(x, y, z))
             thread.scale = (0.15, 0.15, 0.15)
-            mat = create_neon_material(f"Thread{i}{j}", color)
-            thread.data.materials.append(mat)
+            set_neon_emission(thread, color, 3.0)
     
     render_white_bg(base_path + "tools/process_threads.png")
 
@@ -228,19 +207,15 @@ def create_io_streams():
         y = math.sin(t) * 2
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        input_data = bpy.context.object
+        input_data = add_cube(location=(x, y, z))
         input_data.scale = (0.2, 0.2, 0.2)
         input_data.rotation_euler = (0, 0, t)
-        mat = create_neon_material(f"Input{i}", NEON_COLORS[1])
-        input_data.data.materials.append(mat)
+        set_neon_emission(input_data, NEON_COLORS[1], 3.0)
     
     # Processing center
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0))
-    processor = bpy.context.object
+    processor = add_uv_sphere(location=(0, 0, 0))
     processor.scale = (1, 1, 1)
-    mat = create_neon_material("Processor", NEON_COLORS[4], 4)
-    processor.data.materials.append(mat)
+    set_neon_emission(processor, NEON_COLORS[4], 4)
     
     # Output stream (right)
     for i in range(30):
@@ -249,11 +224,9 @@ def create_io_streams():
         y = math.cos(t) * 2
         z = 0
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        output_data = bpy.context.object
+        output_data = add_ico_sphere(location=(x, y, z))
         output_data.scale = (0.15, 0.15, 0.15)
-        mat = create_neon_material(f"Output{i}", NEON_COLORS[5])
-        output_data.data.materials.append(mat)
+        set_neon_emission(output_data, NEON_COLORS[5], 3.0)
     
     render_white_bg(base_path + "tools/io_streams.png")
 
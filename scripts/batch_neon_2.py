@@ -5,6 +5,13 @@ import math
 import random
 from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import set_neon_emission
+from scene_builder import add_cone, add_cube, add_cylinder, add_ico_sphere, add_uv_sphere, reset_scene
+from quality_presets import render_still
+from scene_seeds import seed_scene
 
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
 
@@ -28,8 +35,7 @@ def setup_scene():
     bpy.context.scene.render.film_transparent = True
     bpy.context.scene.render.image_settings.file_format = 'PNG'
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     bpy.ops.object.camera_add(location=location)
@@ -37,18 +43,6 @@ def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     camera.rotation_euler = rotation
     bpy.context.scene.camera = camera
 
-def create_neon_material(name, color, strength=3.0):
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
-    output = nodes.new('ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-    return mat
-
 def add_area_light(location=(0, 0, 5), energy=20):
     bpy.ops.object.light_add(type='AREA', location=location)
     light = bpy.context.object
@@ -59,7 +53,7 @@ def render_white_bg(output_path):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     temp_path = output_path.replace('.png', '_temp.png')
     bpy.context.scene.render.filepath = temp_path
-    bpy.ops.render.render(write_still=True)
+    render_still(ladder=False)
     img = Image.open(temp_path)
     white_bg = Image.new('RGBA', img.size, (255, 255, 255, 255))
     white_bg.paste(img, (0, 0), img)
@@ -85,19 +79,18 @@ def create_tokenization_grid():
             # Different shapes for different token types
             token_type = (i + j) % 4
             if token_type == 0:  # Word token
-                bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+                obj = add_cube(location=(x, y, z))
                 color = NEON_COLORS[1]  # Cyan
             elif token_type == 1:  # Subword token
-                bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
+                obj = add_cylinder(location=(x, y, z))
                 color = NEON_COLORS[4]  # Yellow
             elif token_type == 2:  # Punctuation
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), subdivisions=1)
+                obj = add_ico_sphere(location=(x, y, z), subdivisions=1)
                 color = NEON_COLORS[0]  # Hot pink
             else:  # Special token
-                bpy.ops.mesh.primitive_cone_add(location=(x, y, z))
+                obj = add_cone(location=(x, y, z))
                 color = NEON_COLORS[6]  # Purple
             
-            obj = bpy.context.object
             obj.scale = (0.25, 0.25, 0.25)
             
             # Add some variation
@@ -107,8 +100,7 @@ def create_tokenization_grid():
                 random.uniform(-0.2, 0.2)
             )
             
-            mat = create_neon_material(f"Token{i}{j}", color)
-            obj.data.materials.append(mat)
+            set_neon_emission(obj, color, 3.0)
     
     render_white_bg(base_path + "language/tokenization_grid.png")
 
@@ -132,11 +124,9 @@ def create_semantic_space():
         cx, cy, cz = center
         
         # Cluster center
-        bpy.ops.mesh.primitive_uv_sphere_add(location=center)
-        core = bpy.context.object
+        core = add_uv_sphere(location=center)
         core.scale = (0.4, 0.4, 0.4)
-        mat = create_neon_material(f"Core_{center}", color, 4)
-        core.data.materials.append(mat)
+        set_neon_emission(core, color, 4)
         
         # Surrounding words
         for i in range(count):
@@ -147,11 +137,9 @@ def create_semantic_space():
             y = cy + math.sin(angle) * radius
             z = cz + random.uniform(-0.5, 0.5)
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            word = bpy.context.object
+            word = add_ico_sphere(location=(x, y, z))
             word.scale = (0.2, 0.2, 0.2)
-            mat = create_neon_material(f"Word_{center}_{i}", color, 2)
-            word.data.materials.append(mat)
+            set_neon_emission(word, color, 2)
     
     # Add connections between related concepts
     for i in range(10):
@@ -162,8 +150,7 @@ def create_semantic_space():
         mid_y = (start[1] + end[1]) / 2
         mid_z = (start[2] + end[2]) / 2
         
-        bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, mid_y, mid_z))
-        connection = bpy.context.object
+        connection = add_cylinder(location=(mid_x, mid_y, mid_z))
         connection.scale = (0.02, 0.02, 1)
         
         # Orient cylinder
@@ -172,8 +159,7 @@ def create_semantic_space():
         dz = end[2] - start[2]
         connection.rotation_euler = (0, math.atan2(math.sqrt(dx**2 + dy**2), dz), math.atan2(dy, dx))
         
-        mat = create_neon_material(f"Connection{i}", NEON_COLORS[7], 1)
-        connection.data.materials.append(mat)
+        set_neon_emission(connection, NEON_COLORS[7], 1)
     
     render_white_bg(base_path + "language/semantic_space.png")
 
@@ -202,30 +188,24 @@ def create_multilingual_network():
         y = math.sin(angle) * 4
         z = 0
         
-        bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z))
-        node = bpy.context.object
+        node = add_uv_sphere(location=(x, y, z))
         node.scale = (0.6, 0.6, 0.6)
-        mat = create_neon_material(f"Lang_{lang}", color, 3)
-        node.data.materials.append(mat)
+        set_neon_emission(node, color, 3)
         nodes.append((x, y, z))
     
     # Central hub
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    hub = bpy.context.object
+    hub = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     hub.scale = (0.8, 0.8, 0.8)
-    mat = create_neon_material("Hub", NEON_COLORS[9], 4)
-    hub.data.materials.append(mat)
+    set_neon_emission(hub, NEON_COLORS[9], 4)
     
     # Connections
     for i, (x1, y1, z1) in enumerate(nodes):
         # Connect to hub
-        bpy.ops.mesh.primitive_cylinder_add(location=(x1/2, y1/2, 0))
-        conn = bpy.context.object
+        conn = add_cylinder(location=(x1/2, y1/2, 0))
         conn.scale = (0.05, 0.05, 2)
         angle = math.atan2(y1, x1)
         conn.rotation_euler = (0, 1.57, angle)
-        mat = create_neon_material(f"ConnHub{i}", NEON_COLORS[8], 1.5)
-        conn.data.materials.append(mat)
+        set_neon_emission(conn, NEON_COLORS[8], 1.5)
         
         # Connect to neighbors
         for j in range(2):
@@ -235,14 +215,12 @@ def create_multilingual_network():
             mid_x = (x1 + x2) / 2
             mid_y = (y1 + y2) / 2
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, mid_y, 0))
-            conn2 = bpy.context.object
+            conn2 = add_cylinder(location=(mid_x, mid_y, 0))
             conn2.scale = (0.03, 0.03, 1)
             
             angle = math.atan2(y2 - y1, x2 - x1)
             conn2.rotation_euler = (0, 1.57, angle)
-            mat = create_neon_material(f"ConnLang{i}{j}", NEON_COLORS[7], 1)
-            conn2.data.materials.append(mat)
+            set_neon_emission(conn2, NEON_COLORS[7], 1)
     
     render_white_bg(base_path + "language/multilingual_network.png")
 
@@ -263,30 +241,28 @@ def create_text_generation_flow():
         # Different stages of generation
         stage = i // 10
         if stage == 0:  # Context
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+            obj = add_cube(location=(x, y, z))
             color = NEON_COLORS[6]  # Purple
             scale = 0.3
         elif stage == 1:  # Processing
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
+            obj = add_ico_sphere(location=(x, y, z))
             color = NEON_COLORS[1]  # Cyan
             scale = 0.25
         elif stage == 2:  # Candidates
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
+            obj = add_cylinder(location=(x, y, z))
             color = NEON_COLORS[4]  # Yellow
             scale = 0.2
         else:  # Output
-            bpy.ops.mesh.primitive_cone_add(location=(x, y, z))
+            obj = add_cone(location=(x, y, z))
             color = NEON_COLORS[5]  # Green
             scale = 0.25
         
-        obj = bpy.context.object
         obj.scale = (scale, scale, scale)
         obj.rotation_euler = (0, 0, i * 0.1)
         
         # Add probability variation
         strength = 2 + abs(math.sin(i * 0.5)) * 2
-        mat = create_neon_material(f"Gen{i}", color, strength)
-        obj.data.materials.append(mat)
+        set_neon_emission(obj, color, strength)
     
     # Add probability branches
     for i in range(10):
@@ -297,13 +273,11 @@ def create_text_generation_flow():
             branch_y = base_y + (j - 1) * 0.8
             branch_z = 1
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(base_x, branch_y, branch_z))
-            branch = bpy.context.object
+            branch = add_ico_sphere(location=(base_x, branch_y, branch_z))
             branch.scale = (0.1, 0.1, 0.1)
             
             opacity = 1 - (j * 0.3)
-            mat = create_neon_material(f"Branch{i}{j}", NEON_COLORS[8], opacity * 2)
-            branch.data.materials.append(mat)
+            set_neon_emission(branch, NEON_COLORS[8], opacity * 2)
     
     render_white_bg(base_path + "language/text_generation_flow.png")
 
@@ -316,16 +290,14 @@ def create_grammar_structure():
     # Tree structure with grammatical nodes
     def add_grammar_node(pos, size, color, node_type):
         if node_type == 'phrase':
-            bpy.ops.mesh.primitive_cube_add(location=pos)
+            node = add_cube(location=pos)
         elif node_type == 'word':
-            bpy.ops.mesh.primitive_uv_sphere_add(location=pos)
+            node = add_uv_sphere(location=pos)
         else:  # punctuation
-            bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=1)
+            node = add_ico_sphere(location=pos, subdivisions=1)
         
-        node = bpy.context.object
         node.scale = (size, size, size)
-        mat = create_neon_material(f"Grammar_{pos}", color, 3)
-        node.data.materials.append(mat)
+        set_neon_emission(node, color, 3)
         return node
     
     # S (sentence) root
@@ -366,8 +338,7 @@ def create_grammar_structure():
     for start, end in connections:
         mid = tuple((s + e) / 2 for s, e in zip(start, end))
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.05, 0.05, 0.8)
         
         dx = end[0] - start[0]
@@ -375,17 +346,21 @@ def create_grammar_structure():
         dz = end[2] - start[2]
         edge.rotation_euler = (0, math.atan2(math.sqrt(dx**2 + dy**2), dz), math.atan2(dy, dx))
         
-        mat = create_neon_material(f"Edge_{start}_{end}", NEON_COLORS[8], 1.5)
-        edge.data.materials.append(mat)
+        set_neon_emission(edge, NEON_COLORS[8], 1.5)
     
     render_white_bg(base_path + "language/grammar_structure.png")
 
 # Run all visualizations
 print("LANGUAGE CATEGORY:")
+seed_scene("language/tokenization_grid.png")
 create_tokenization_grid()
+seed_scene("language/semantic_space.png")
 create_semantic_space()
+seed_scene("language/multilingual_network.png")
 create_multilingual_network()
+seed_scene("language/text_generation_flow.png")
 create_text_generation_flow()
+seed_scene("language/grammar_structure.png")
 create_grammar_structure()
 
 print("\n✨ Batch 2 complete!")
\ No newline at end of file
@@ -5,6 +5,13 @@ import math
 import random
 from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import set_neon_emission
+from scene_builder import add_cone, add_cube, add_cylinder, add_ico_sphere, add_uv_sphere, reset_scene
+from quality_presets import render_still
+from scene_seeds import seed_scene
 
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
 
@@ -26,8 +33,7 @@ def setup_scene():
     bpy.context.scene.render.film_transparent = True
     bpy.context.scene.render.image_settings.file_format = 'PNG'
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     bpy.ops.object.camera_add(location=location)
@@ -35,18 +41,6 @@ def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     camera.rotation_euler = rotation
     bpy.context.scene.camera = camera
 
-def create_neon_material(name, color, strength=3.0):
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
-    output = nodes.new('ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-    return mat
-
 def add_area_light():
     bpy.ops.object.light_add(type='AREA', location=(0, 0, 5))
     light = bpy.context.object
@@ -57,7 +51,7 @@ def render_white_bg(output_path):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     temp_path = output_path.replace('.png', '_temp.png')
     bpy.context.scene.render.filepath = temp_path
-    bpy.ops.render.render(write_still=True)
+    render_still(ladder=False)
     img = Image.open(temp_path)
     white_bg = Image.new('RGBA', img.size, (255, 255, 255, 255))
     white_bg.paste(img, (0, 0), img)
@@ -74,11 +68,9 @@ def create_syntax_tree():
     add_area_light()
     
     def add_node(pos, size, color, name):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos)
         node.scale = (size, size, size)
-        mat = create_neon_material(name, color)
-        node.data.materials.append(mat)
+        set_neon_emission(node, color, 3.0)
         return node
     
     # Root node (Program)
@@ -113,15 +105,13 @@ def create_syntax_tree():
     
     for start, end in connections:
         mid = tuple((s + e) / 2 for s, e in zip(start, end))
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.03, 0.03, 0.8)
         dx = end[0] - start[0]
         dy = end[1] - start[1]
         dz = end[2] - start[2]
         edge.rotation_euler = (0, math.atan2(math.sqrt(dx**2 + dy**2), dz), math.atan2(dy, dx))
-        mat = create_neon_material(f"Edge_{start}", NEON_COLORS[6], 1.5)
-        edge.data.materials.append(mat)
+        set_neon_emission(edge, NEON_COLORS[6], 1.5)
     
     render_white_bg(base_path + "code/syntax_tree.png")
 
@@ -145,28 +135,24 @@ def create_code_flow():
             
             # Alternate shapes for different operations
             if i % 3 == 0:
-                bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+                flow = add_cube(location=(x, y, z))
             elif i % 3 == 1:
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
+                flow = add_ico_sphere(location=(x, y, z))
             else:
-                bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
+                flow = add_cylinder(location=(x, y, z))
             
-            flow = bpy.context.object
             flow.scale = (0.2, 0.2, 0.2)
             flow.rotation_euler = (0, 0, t)
             
             # Color based on strand and position
             color_idx = (strand * 4 + i) % len(NEON_COLORS)
             color = NEON_COLORS[color_idx]
-            mat = create_neon_material(f"Flow{strand}{i}", color)
-            flow.data.materials.append(mat)
+            set_neon_emission(flow, color, 3.0)
     
     # Add central execution pointer
-    bpy.ops.mesh.primitive_cone_add(location=(0, 0, 0))
-    pointer = bpy.context.object
+    pointer = add_cone(location=(0, 0, 0))
     pointer.scale = (0.5, 0.5, 0.8)
-    mat = create_neon_material("Pointer", NEON_COLORS[0], 4)
-    pointer.data.materials.append(mat)
+    set_neon_emission(pointer, NEON_COLORS[0], 4)
     
     render_white_bg(base_path + "code/code_flow.png")
 
@@ -187,8 +173,7 @@ def create_bug_detection():
             
             is_bug = (i, j) in bugs
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            block = bpy.context.object
+            block = add_cube(location=(x, y, z))
             
             if is_bug:
                 # Bugs are larger and red
@@ -197,19 +182,16 @@ def create_bug_detection():
                 strength = 5
                 
                 # Add warning glow
-                bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z))
-                glow = bpy.context.object
+                glow = add_uv_sphere(location=(x, y, z))
                 glow.scale = (0.5, 0.5, 0.5)
-                glow_mat = create_neon_material(f"Glow{i}{j}", color, 2)
-                glow.data.materials.append(glow_mat)
+                set_neon_emission(glow, color, 2)
             else:
                 # Clean code blocks
                 block.scale = (0.2, 0.2, 0.2)
                 color = NEON_COLORS[3]  # Green
                 strength = 2
             
-            mat = create_neon_material(f"Block{i}{j}", color, strength)
-            block.data.materials.append(mat)
+            set_neon_emission(block, color, strength)
     
     render_white_bg(base_path + "code/bug_detection.png")
 
@@ -235,20 +217,16 @@ def create_pattern_matching():
             y = py * 0.6 - 1
             z = 0
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            element = bpy.context.object
+            element = add_ico_sphere(location=(x, y, z))
             element.scale = (0.25, 0.25, 0.25)
-            mat = create_neon_material(f"Pattern_{pattern_name}_{px}_{py}", color, 3)
-            element.data.materials.append(mat)
+            set_neon_emission(element, color, 3)
         
         # Pattern label
         label_x = x_offset + 0.5
         label_y = -2
-        bpy.ops.mesh.primitive_cube_add(location=(label_x, label_y, 0))
-        label = bpy.context.object
+        label = add_cube(location=(label_x, label_y, 0))
         label.scale = (0.4, 0.1, 0.1)
-        mat = create_neon_material(f"Label_{pattern_name}", color, 4)
-        label.data.materials.append(mat)
+        set_neon_emission(label, color, 4)
         
         x_offset += 3
     
@@ -258,12 +236,10 @@ def create_pattern_matching():
         y = random.uniform(2, 4)
         z = 0.5
         
-        bpy.ops.mesh.primitive_cone_add(location=(x, y, z))
-        indicator = bpy.context.object
+        indicator = add_cone(location=(x, y, z))
         indicator.scale = (0.15, 0.15, 0.3)
         indicator.rotation_euler = (3.14, 0, 0)
-        mat = create_neon_material(f"Match{i}", NEON_COLORS[6], 2)
-        indicator.data.materials.append(mat)
+        set_neon_emission(indicator, NEON_COLORS[6], 2)
     
     render_white_bg(base_path + "code/pattern_matching.png")
 
@@ -281,21 +257,19 @@ def create_refactoring_paths():
         
         shape = random.choice(['cube', 'sphere', 'cylinder'])
         if shape == 'cube':
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+            messy = add_cube(location=(x, y, z))
         elif shape == 'sphere':
-            bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z))
+            messy = add_uv_sphere(location=(x, y, z))
         else:
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
+            messy = add_cylinder(location=(x, y, z))
         
-        messy = bpy.context.object
         messy.scale = (0.15, 0.15, 0.15)
         messy.rotation_euler = (
             random.uniform(0, 6.28),
             random.uniform(0, 6.28),
             random.uniform(0, 6.28)
         )
-        mat = create_neon_material(f"Messy{i}", NEON_COLORS[0])  # Red
-        messy.data.materials.append(mat)
+        set_neon_emission(messy, NEON_COLORS[0], 3.0)  # Red
     
     # Clean, organized code (right side)
     for i in range(4):
@@ -304,40 +278,39 @@ def create_refactoring_paths():
             y = (j - 2) * 0.5
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            clean = bpy.context.object
+            clean = add_cube(location=(x, y, z))
             clean.scale = (0.2, 0.2, 0.2)
-            mat = create_neon_material(f"Clean{i}{j}", NEON_COLORS[3])  # Green
-            clean.data.materials.append(mat)
+            set_neon_emission(clean, NEON_COLORS[3], 3.0)  # Green
     
     # Transformation arrows
     for i in range(3):
         y = (i - 1) * 1.5
         
         # Arrow shaft
-        bpy.ops.mesh.primitive_cylinder_add(location=(0, y, 0))
-        shaft = bpy.context.object
+        shaft = add_cylinder(location=(0, y, 0))
         shaft.scale = (0.05, 0.05, 1.5)
         shaft.rotation_euler = (0, 1.57, 0)
-        mat = create_neon_material(f"Shaft{i}", NEON_COLORS[4], 3)
-        shaft.data.materials.append(mat)
+        set_neon_emission(shaft, NEON_COLORS[4], 3)
         
         # Arrow head
-        bpy.ops.mesh.primitive_cone_add(location=(0.8, y, 0))
-        head = bpy.context.object
+        head = add_cone(location=(0.8, y, 0))
         head.scale = (0.3, 0.3, 0.5)
         head.rotation_euler = (0, 0, -1.57)
-        mat = create_neon_material(f"Head{i}", NEON_COLORS[4], 4)
-        head.data.materials.append(mat)
+        set_neon_emission(head, NEON_COLORS[4], 4)
     
     render_white_bg(base_path + "code/refactoring_paths.png")
 
 # Run all visualizations
 print("CODE CATEGORY:")
+seed_scene("code/syntax_tree.png")
 create_syntax_tree()
+seed_scene("code/code_flow.png")
 create_code_flow()
+seed_scene("code/bug_detection.png")
 create_bug_detection()
+seed_scene("code/pattern_matching.png")
 create_pattern_matching()
+seed_scene("code/refactoring_paths.png")
 create_refactoring_paths()
 
 print("\n✨ Batch 3 complete!")
\ No newline at end of file
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Cycles Profile
+Cycles settings for neon scenes that are mostly emission on a flat background.
+
+A fixed sample count with default light paths spends most of its time on
+pixels that converged after a few samples and on bounces that emission
+shaders never use. The profile instead:
+
+- samples adaptively up to the script's old sample count, stopping each
+  pixel once its noise is below a threshold,
+- denoises on the CPU with OpenImageDenoise,
+- trims light paths: one bounce when the scene is lit only by emission
+  (no lamps, black world), two otherwise, with caustics off. Scenes with
+  glass, transmission or alpha-blended materials keep Cycles' default light
+  paths, since trimmed transmission and transparent bounces render them
+  black or opaque.
+
+apply_cycles_profile() also adds Cycles' sample count pass and routes it to
+a compositor Viewer node. After the render, report_sample_usage() (called by
+render_still) reads how many samples the pixels actually took and appends
+the statistics to render_logs/cycles_samples.json, which shows how far each
+scene's max_samples can be lowered.
+"""
+import fcntl
+import json
+import os
+import time
+
+import bpy
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLES_LOG = os.path.join(SCRIPT_DIR, "..", "render_logs", "cycles_samples.json")
+
+NOISE_THRESHOLD = 0.05
+MIN_SAMPLES = 8
+
+# Light path bounces per kind of scene
+EMISSION_BOUNCES = {'max': 1, 'diffuse': 1, 'glossy': 1, 'transmission': 0, 'volume': 0, 'transparent': 2}
+LIT_BOUNCES = {'max': 2, 'diffuse': 2, 'glossy': 2, 'transmission': 1, 'volume': 0, 'transparent': 4}
+DEFAULT_BOUNCES = {'max': 12, 'diffuse': 4, 'glossy': 4, 'transmission': 12, 'volume': 0, 'transparent': 8}
+
+# Shader nodes that light passes through
+SEE_THROUGH_NODES = {'BSDF_GLASS', 'BSDF_REFRACTION', 'BSDF_TRANSPARENT', 'BSDF_TRANSLUCENT'}
+
+SAMPLE_VIEWER = "SampleCountViewer"
+SAMPLE_PASS = "Debug Sample Count"
+
+def is_emission_only(scene):
+    """True if nothing but emissive surfaces lights scene"""
+    if any(obj.type == 'LIGHT' for obj in scene.objects):
+        return False
+    world = scene.world
+    if world is None or not world.use_nodes:
+        return True
+    for node in world.node_tree.nodes:
+        if node.type == 'BACKGROUND' and node.inputs['Strength'].default_value > 0:
+            color = node.inputs['Color'].default_value
+            if any(channel > 0 for channel in color[:3]):
+                return False
+    return True
+
+def _is_see_through(mat):
+    """True if mat refracts or blends with what is behind it"""
+    if getattr(mat, 'blend_method', 'OPAQUE') not in ('OPAQUE', 'CLIP'):
+        return True
+    if not mat.use_nodes:
+        return mat.diffuse_color[3] < 1
+    for node in mat.node_tree.nodes:
+        if node.type in SEE_THROUGH_NODES:
+            return True
+        if node.type == 'BSDF_PRINCIPLED':
+            # Socket was renamed from "Transmission" to "Transmission Weight" in Blender 4.0
+            transmission = node.inputs.get("Transmission Weight") or node.inputs.get("Transmission")
+            alpha = node.inputs["Alpha"]
+            if transmission is not None and (transmission.is_linked or transmission.default_value > 0):
+                return True
+            if alpha.is_linked or alpha.default_value < 1:
+                return True
+    return False
+
+def has_see_through_materials(scene):
+    """True if any object in scene uses a glass, transmissive or alpha material"""
+    materials = {slot.material for obj in scene.objects for slot in obj.material_slots if slot.material}
+    return any(_is_see_through(mat) for mat in materials)
+
+def _measure_samples(scene):
+    """Route the sample count pass to a Viewer node; False if the compositor is in use"""
+    if scene.use_nodes and SAMPLE_VIEWER not in scene.node_tree.nodes:
+        return False
+    bpy.context.view_layer.cycles.pass_debug_sample_count = True
+    scene.use_nodes = True
+    tree = scene.node_tree
+    if SAMPLE_VIEWER in tree.nodes:
+        return True
+    tree.nodes.clear()
+    layers = tree.nodes.new('CompositorNodeRLayers')
+    composite = tree.nodes.new('CompositorNodeComposite')
+    viewer = tree.nodes.new('CompositorNodeViewer')
+    viewer.name = SAMPLE_VIEWER
+    tree.links.new(layers.outputs['Image'], composite.inputs['Image'])
+    tree.links.new(layers.outputs[SAMPLE_PASS], viewer.inputs['Image'])
+    return True
+
+def apply_cycles_profile(scene, max_samples, threshold=NOISE_THRESHOLD, measure=True):
+    """Render scene with Cycles using adaptive sampling, CPU denoising and trimmed bounces"""
+    cycles = scene.cycles
+    scene.render.engine = 'CYCLES'
+    cycles.device = 'CPU'
+    cycles.samples = max_samples
+    cycles.use_adaptive_sampling = True
+    cycles.adaptive_threshold = threshold
+    cycles.adaptive_min_samples = min(MIN_SAMPLES, max_samples)
+
+    cycles.use_denoising = True
+    cycles.denoiser = 'OPENIMAGEDENOISE'
+    cycles.denoising_input_passes = 'RGB_ALBEDO_NORMAL'
+    if hasattr(cycles, 'denoising_use_gpu'):
+        cycles.denoising_use_gpu = False
+
+    if has_see_through_materials(scene):
+        bounces = DEFAULT_BOUNCES
+    elif is_emission_only(scene):
+        bounces = EMISSION_BOUNCES
+    else:
+        bounces = LIT_BOUNCES
+    cycles.max_bounces = bounces['max']
+    cycles.diffuse_bounces = bounces['diffuse']
+    cycles.glossy_bounces = bounces['glossy']
+    cycles.transmission_bounces = bounces['transmission']
+    cycles.volume_bounces = bounces['volume']
+    cycles.transparent_max_bounces = bounces['transparent']
+    # Caustics stay on with the default light paths
+    cycles.caustics_reflective = bounces is DEFAULT_BOUNCES
+    cycles.caustics_refractive = bounces is DEFAULT_BOUNCES
+
+    if measure:
+        _measure_samples(scene)
+
+def report_sample_usage(scene):
+    """Log how many samples the last render took per pixel; None if not measured"""
+    import numpy as np
+
+    if not scene.use_nodes or SAMPLE_VIEWER not in scene.node_tree.nodes:
+        return None
+    image = bpy.data.images.get("Viewer Node")
+    if image is None or not image.size[0]:
+        return None
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    counts = pixels[0::4]
+    max_samples = scene.cycles.samples
+    # The pass holds the fraction of the sample budget used per pixel
+    if counts.max() <= 1.0:
+        counts = counts * max_samples
+
+    filepath = scene.render.filepath
+    name = os.path.join(os.path.basename(os.path.dirname(filepath)), os.path.basename(filepath))
+    stats = {
+        'max_samples': max_samples,
+        'threshold': scene.cycles.adaptive_threshold,
+        'mean': round(float(counts.mean()), 1),
+        'p50': round(float(np.percentile(counts, 50)), 1),
+        'p95': round(float(np.percentile(counts, 95)), 1),
+        'max': round(float(counts.max()), 1),
+        'measured': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    print(f"Cycles samples for {name}: mean {stats['mean']}, p95 {stats['p95']}, "
+          f"max {stats['max']} of {max_samples}")
+
+    path = os.path.abspath(SAMPLES_LOG)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".lock", 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(path) as f:
+                log = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            log = {}
+        log[name] = stats
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(log, f, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+    return stats
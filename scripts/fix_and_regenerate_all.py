@@ -2,12 +2,19 @@
 """Fix lighting and regenerate all images with proper visibility"""
 import bpy
 import math
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_builder import add_connections, reset_scene
+from scene_seeds import seed_scene
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
 
 def clear_scene():
     """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def setup_world_lighting():
     """Set up proper world lighting"""
@@ -52,33 +59,18 @@ def generate_neural_network():
         
         layers.append(layer_nodes)
     
-    # Create glowing connections
+    # Create glowing connections - one curve, one spline per edge
+    edges = []
     for i in range(len(layers) - 1):
         for node1 in layers[i]:
             for node2 in random.sample(layers[i + 1], min(3, len(layers[i + 1]))):
-                curve = bpy.data.curves.new('connection', 'CURVE')
-                curve.dimensions = '3D'
-                spline = curve.splines.new('BEZIER')
-                spline.bezier_points.add(1)
-                
-                spline.bezier_points[0].co = node1.location
-                spline.bezier_points[1].co = node2.location
-                
-                for point in spline.bezier_points:
-                    point.handle_right_type = 'AUTO'
-                    point.handle_left_type = 'AUTO'
-                
-                obj = bpy.data.objects.new('connection', curve)
-                bpy.context.collection.objects.link(obj)
-                
-                curve.bevel_depth = 0.02
-                curve.bevel_resolution = 4
-                
-                mat = bpy.data.materials.new("ConnMat")
-                mat.use_nodes = True
-                mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0.2, 0.6, 0.9)
-                mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 2.0
-                obj.data.materials.append(mat)
+                edges.append((node1.location.copy(), node2.location.copy()))
+    
+    mat = bpy.data.materials.new("ConnMat")
+    mat.use_nodes = True
+    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0.2, 0.6, 0.9)
+    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 2.0
+    add_connections('connections', edges, bevel_depth=0.02, material=mat)
     
     # Add strong lights
     bpy.ops.object.light_add(type='AREA', location=(5, 5, 8))
@@ -100,12 +92,12 @@ def generate_neural_network():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 64
+    apply_cycles_profile(scene, max_samples=64)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/neural_network.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_data_flow():
     """Generate visible data flow"""
@@ -179,12 +171,12 @@ def generate_data_flow():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 64
+    apply_cycles_profile(scene, max_samples=64)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/data_flow.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_algorithm_crystal():
     """Generate bright crystal visualization"""
@@ -265,12 +257,12 @@ def generate_algorithm_crystal():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 128
+    apply_cycles_profile(scene, max_samples=128)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/algorithm_crystal.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_system_architecture():
     """Generate bright system architecture"""
@@ -340,12 +332,12 @@ def generate_system_architecture():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 64
+    apply_cycles_profile(scene, max_samples=64)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/system_architecture.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_code_universe():
     """Generate bright universe visualization"""
@@ -403,27 +395,32 @@ def generate_code_universe():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 64
+    apply_cycles_profile(scene, max_samples=64)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/code_universe.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # Generate all images with proper lighting
 print("Generating Neural Network...")
+seed_scene("neural_network.png")
 generate_neural_network()
 
 print("Generating Data Flow...")
+seed_scene("data_flow.png")
 generate_data_flow()
 
 print("Generating Algorithm Crystal...")
+seed_scene("algorithm_crystal.png")
 generate_algorithm_crystal()
 
 print("Generating System Architecture...")
+seed_scene("system_architecture.png")
 generate_system_architecture()
 
 print("Generating Code Universe...")
+seed_scene("code_universe.png")
 generate_code_universe()
 
 print("All images regenerated with proper lighting!")
\ No newline at end of file
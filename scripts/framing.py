@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Framing
+Fits the camera to what a scene contains and renders only that part.
+
+Cameras are placed by hand, and the content often fills only part of the
+frame, so samples go to empty background. Two framing modes fix this and
+can be combined:
+
+    fit      move the camera along its view direction until the world-space
+             bounds of all visible geometry just fill the frame
+    border   restrict rendering (render.border) to the projected bounds;
+             the rest of the full-size image stays empty and shows the
+             flat background when the image is composited
+
+Border rendering only applies where an empty margin looks like the
+background: on a black world or with a transparent film. Bloom and glow
+need room, so the border is padded.
+
+The modes come from set_framing(), `--frame fit,border` after Blender's
+`--`, or the GALLERY_FRAME environment variable; the default is none.
+render_still() frames every scene before rendering it.
+"""
+import os
+
+import bpy
+from bpy_extras.object_utils import world_to_camera_view
+from mathutils import Vector
+
+from quality_presets import blender_option
+
+FRAME_MODES = ('fit', 'border')
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD', 'VOLUME'}
+
+# Bounds are grown by this factor before fitting the camera
+FIT_MARGIN = 1.1
+# Fraction of the frame added around the projected bounds for glow
+BORDER_PADDING = 0.05
+# Skip the border when it would still cover this much of the frame
+MIN_BORDER_SAVING = 0.1
+
+_framing = None
+
+def set_framing(modes):
+    """Select the framing modes for this process, overriding flag and environment"""
+    global _framing
+    _framing = None if modes is None else parse_framing(modes)
+
+def parse_framing(value):
+    modes = tuple(mode for mode in value.replace('+', ',').split(',') if mode and mode != 'none')
+    unknown = [mode for mode in modes if mode not in FRAME_MODES]
+    if unknown:
+        raise ValueError(f"Unknown framing {', '.join(unknown)}, expected {' and/or '.join(FRAME_MODES)}")
+    return modes
+
+def current_framing():
+    """Framing modes in effect, e.g. ('fit', 'border')"""
+    if _framing is not None:
+        return _framing
+    return parse_framing(blender_option('frame') or os.environ.get('GALLERY_FRAME', ''))
+
+def scene_bounds(scene, depsgraph):
+    """World-space bounding box corners of every visible, renderable object"""
+    corners = []
+    for obj in scene.objects:
+        if obj.type not in GEOMETRY_TYPES or obj.hide_render or not obj.visible_get():
+            continue
+        evaluated = obj.evaluated_get(depsgraph)
+        corners.extend(evaluated.matrix_world @ Vector(corner) for corner in evaluated.bound_box)
+    return corners
+
+def fit_camera(scene, corners, depsgraph, margin=FIT_MARGIN):
+    """Move the camera along its current direction so corners fill the frame"""
+    camera = scene.camera
+    center = sum(corners, Vector()) / len(corners)
+    grown = [center + (corner - center) * margin for corner in corners]
+    location, scale = camera.camera_fit_coords(depsgraph, [v for corner in grown for v in corner])
+    camera.location = location
+    if camera.data.type == 'ORTHO':
+        camera.data.ortho_scale = scale
+    bpy.context.view_layer.update()
+
+def has_flat_background(scene):
+    """True if pixels left unrendered look like the scene's background"""
+    if scene.render.film_transparent:
+        return True
+    world = scene.world
+    if world is None or not world.use_nodes:
+        return False
+    for node in world.node_tree.nodes:
+        if node.type == 'BACKGROUND':
+            color = node.inputs['Color'].default_value
+            return node.inputs['Strength'].default_value == 0 or not any(color[:3])
+    return False
+
+def set_border(scene, corners, padding=BORDER_PADDING):
+    """Limit rendering to the padded projection of corners; False if not worth it"""
+    render = scene.render
+    render.use_border = False
+    projected = [world_to_camera_view(scene, scene.camera, corner) for corner in corners]
+    if any(point.z <= 0 for point in projected):
+        return False  # Content behind the camera plane projects unreliably
+    min_x = max(0.0, min(p.x for p in projected) - padding)
+    max_x = min(1.0, max(p.x for p in projected) + padding)
+    min_y = max(0.0, min(p.y for p in projected) - padding)
+    max_y = min(1.0, max(p.y for p in projected) + padding)
+    if min_x >= max_x or min_y >= max_y:
+        return False
+    if (max_x - min_x) * (max_y - min_y) > 1.0 - MIN_BORDER_SAVING:
+        return False
+
+    render.use_border = True
+    render.use_crop_to_border = False
+    render.border_min_x, render.border_max_x = min_x, max_x
+    render.border_min_y, render.border_max_y = min_y, max_y
+    return True
+
+def frame_scene(scene, modes=None):
+    """Apply the framing modes (default: the current ones) to scene"""
+    modes = current_framing() if modes is None else modes
+    if not modes or scene.camera is None:
+        return
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    corners = scene_bounds(scene, depsgraph)
+    if not corners:
+        return
+    if 'fit' in modes:
+        fit_camera(scene, corners, depsgraph)
+    if 'border' in modes:
+        if not has_flat_background(scene):
+            scene.render.use_border = False
+            print("Framing: background is not flat, rendering the full frame")
+        elif set_border(scene, corners):
+            render = scene.render
+            area = (render.border_max_x - render.border_min_x) * (render.border_max_y - render.border_min_y)
+            print(f"Framing: rendering {area:.0%} of the frame")
@@ -9,20 +9,14 @@ PUBLIC_DIR="$(dirname "$SCRIPT_DIR")/public"
 echo "Creating public directory..."
 mkdir -p "$PUBLIC_DIR"
 
-echo "Generating Neural Network visualization..."
-blender --background --python "$SCRIPT_DIR/generate_neural_network.py"
-
-echo "Generating Data Flow visualization..."
-blender --background --python "$SCRIPT_DIR/generate_data_flow.py"
-
-echo "Generating Algorithm Crystal visualization..."
-blender --background --python "$SCRIPT_DIR/generate_algorithm_crystal.py"
-
-echo "Generating System Architecture visualization..."
-blender --background --python "$SCRIPT_DIR/generate_system_architecture.py"
-
-echo "Generating Code Universe visualization..."
-blender --background --python "$SCRIPT_DIR/generate_code_universe.py"
+# Render the five pieces in parallel Blender processes (WORKERS defaults to all of them)
+echo "Generating Neural Network, Data Flow, Algorithm Crystal, System Architecture and Code Universe..."
+python3 "$SCRIPT_DIR/render_driver.py" --workers "${WORKERS:-5}" --scripts \
+    generate_neural_network.py \
+    generate_data_flow.py \
+    generate_algorithm_crystal.py \
+    generate_system_architecture.py \
+    generate_code_universe.py
 
 echo "All art pieces generated successfully!"
 echo "Images saved in: $PUBLIC_DIR"
@@ -5,6 +5,14 @@ import math
 import random
 import os
 import colorsys
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import MATERIAL_POOL
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # Ensure output directories exist
 CATEGORIES = ["thinking", "code", "memory", "tools", "language", "problem_solving", "system", "consciousness", "interaction"]
@@ -13,8 +21,7 @@ for cat in CATEGORIES:
 
 def clear_scene():
     """Clean slate"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def setup_bright_world():
     """White background with good lighting"""
@@ -52,11 +59,11 @@ def render_image(filepath):
     """Render with consistent settings"""
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 32  # Fast for many images
+    apply_cycles_profile(scene, max_samples=32)
     scene.render.resolution_x = 1080  # Square mobile-friendly
     scene.render.resolution_y = 1080
     scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # THINKING VISUALIZATIONS
 
@@ -69,10 +76,7 @@ def generate_context_window():
     bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0), size=1)
     frame = bpy.context.active_object
     frame.scale = (8, 0.1, 3)
-    mat = bpy.data.materials.new("Frame")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.2, 1)
-    frame.data.materials.append(mat)
+    frame.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.2, 1)))
     
     # Tokens in window
     for i in range(15):
@@ -82,21 +86,14 @@ def generate_context_window():
         bpy.ops.mesh.primitive_cube_add(location=(x, 0, 0), size=0.6)
         token = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Token{i}")
-        mat.use_nodes = True
         color = (0.2, 0.6, 0.9, 1) if opacity > 0.5 else (0.6, 0.6, 0.6, 1)
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = opacity
-        token.data.materials.append(mat)
+        token.data.materials.append(MATERIAL_POOL.get('principled', color, alpha=opacity))
     
     # Window indicators
     bpy.ops.mesh.primitive_plane_add(location=(-3, 0, 2), size=0.3)
     start = bpy.context.active_object
     start.rotation_euler = (0, 0, math.pi/4)
-    mat = bpy.data.materials.new("Start")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0, 1, 0, 1)
-    start.data.materials.append(mat)
+    start.data.materials.append(MATERIAL_POOL.get('principled', (0, 1, 0, 1)))
     
     add_camera_and_light((0, -8, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/thinking/context_window.png')
@@ -117,10 +114,7 @@ def generate_thought_chains():
         # Color gradient
         hue = i / 5.0
         color = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
-        mat = bpy.data.materials.new(f"Thought{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        thought.data.materials.append(mat)
+        thought.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
     
     # Connect with chains
     for i in range(len(thoughts) - 1):
@@ -150,10 +144,7 @@ def generate_parallel_reasoning():
     # Central question
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=0.8)
     question = bpy.context.active_object
-    mat = bpy.data.materials.new("Question")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.9, 0.1, 0.1, 1)
-    question.data.materials.append(mat)
+    question.data.materials.append(MATERIAL_POOL.get('principled', (0.9, 0.1, 0.1, 1)))
     
     # Parallel paths
     for path in range(3):
@@ -168,10 +159,7 @@ def generate_parallel_reasoning():
             
             # Path colors
             colors = [(0.2, 0.8, 0.2), (0.2, 0.2, 0.8), (0.8, 0.8, 0.2)]
-            mat = bpy.data.materials.new(f"Path{path}_Step{step}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*colors[path], 1)
-            node.data.materials.append(mat)
+            node.data.materials.append(MATERIAL_POOL.get('principled', (*colors[path], 1)))
     
     add_camera_and_light((0, 0, 10))
     render_image('/home/franz/dev/claude-vision-gallery/public/thinking/parallel_reasoning.png')
@@ -186,37 +174,25 @@ def generate_code_flow():
     # Entry point
     bpy.ops.mesh.primitive_cylinder_add(location=(0, 4, 0), radius=0.5, depth=0.3)
     entry = bpy.context.active_object
-    mat = bpy.data.materials.new("Entry")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.8, 0.2, 1)
-    entry.data.materials.append(mat)
+    entry.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.8, 0.2, 1)))
     
     # Condition diamond
     bpy.ops.mesh.primitive_cube_add(location=(0, 2, 0), size=0.8)
     condition = bpy.context.active_object
     condition.rotation_euler = (0, 0, math.pi/4)
-    mat = bpy.data.materials.new("Condition")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.8, 0.2, 1)
-    condition.data.materials.append(mat)
+    condition.data.materials.append(MATERIAL_POOL.get('principled', (0.8, 0.8, 0.2, 1)))
     
     # True/False branches
     for i, x in enumerate([-2, 2]):
         bpy.ops.mesh.primitive_cube_add(location=(x, 0, 0), size=0.6)
         branch = bpy.context.active_object
         color = (0.2, 0.8, 0.2, 1) if i == 0 else (0.8, 0.2, 0.2, 1)
-        mat = bpy.data.materials.new(f"Branch{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        branch.data.materials.append(mat)
+        branch.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     # Loop
     bpy.ops.mesh.primitive_torus_add(location=(0, -2, 0), major_radius=1, minor_radius=0.2)
     loop = bpy.context.active_object
-    mat = bpy.data.materials.new("Loop")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.8, 1)
-    loop.data.materials.append(mat)
+    loop.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.8, 1)))
     
     add_camera_and_light((5, -5, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/code/code_flow.png')
@@ -263,10 +239,7 @@ def generate_pattern_matching():
     for x, y in pattern_pos:
         bpy.ops.mesh.primitive_cylinder_add(location=(x*0.5 - 3, y*0.5, 0), radius=0.2, depth=0.4)
         p = bpy.context.active_object
-        mat = bpy.data.materials.new("Pattern")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.9, 0.6, 0.1, 1)
-        p.data.materials.append(mat)
+        p.data.materials.append(MATERIAL_POOL.get('principled', (0.9, 0.6, 0.1, 1)))
     
     # Code to search
     for i in range(8):
@@ -285,10 +258,7 @@ def generate_pattern_matching():
             
             obj = bpy.context.active_object
             color = (0.9, 0.6, 0.1, 1) if matches else (0.3, 0.3, 0.3, 1)
-            mat = bpy.data.materials.new(f"Code_{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-            obj.data.materials.append(mat)
+            obj.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     add_camera_and_light((4, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/code/pattern_matching.png')
@@ -308,19 +278,13 @@ def generate_refactoring_paths():
         cube = bpy.context.active_object
         cube.rotation_euler = (random.random(), random.random(), random.random())
         
-        mat = bpy.data.materials.new(f"Messy{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.2, 0.2, 1)
-        cube.data.materials.append(mat)
+        cube.data.materials.append(MATERIAL_POOL.get('principled', (0.8, 0.2, 0.2, 1)))
     
     # Arrow
     bpy.ops.mesh.primitive_cone_add(location=(0, 0, 0), radius1=0.3, depth=1)
     arrow = bpy.context.active_object
     arrow.rotation_euler = (0, math.pi/2, 0)
-    mat = bpy.data.materials.new("Arrow")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-    arrow.data.materials.append(mat)
+    arrow.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
     
     # Refactored clean code
     for i in range(4):
@@ -331,10 +295,7 @@ def generate_refactoring_paths():
             bpy.ops.mesh.primitive_cube_add(location=(x, y, 0), size=0.4)
             cube = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Clean{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.8, 0.2, 1)
-            cube.data.materials.append(mat)
+            cube.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.8, 0.2, 1)))
     
     add_camera_and_light((0, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/code/refactoring_paths.png')
@@ -363,10 +324,7 @@ def generate_knowledge_graph():
         node_type = i % 4
         colors = [(0.8, 0.2, 0.2), (0.2, 0.8, 0.2), (0.2, 0.2, 0.8), (0.8, 0.8, 0.2)]
         
-        mat = bpy.data.materials.new(f"Node{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*colors[node_type], 1)
-        node.data.materials.append(mat)
+        node.data.materials.append(MATERIAL_POOL.get('principled', (*colors[node_type], 1)))
     
     # Connections
     for i in range(20):
@@ -390,11 +348,7 @@ def generate_knowledge_graph():
             bpy.context.collection.objects.link(obj)
             curve.bevel_depth = 0.01
             
-            mat = bpy.data.materials.new("Edge")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.5
-            obj.data.materials.append(mat)
+            obj.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1), alpha=0.5))
     
     add_camera_and_light((6, -6, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/memory/knowledge_graph.png')
@@ -419,15 +373,8 @@ def generate_memory_retrieval():
                 activation = random.random()
                 color = (activation, activation * 0.5, 1 - activation, 1)
                 
-                mat = bpy.data.materials.new(f"Mem_{layer}_{i}_{j}")
-                mat.use_nodes = True
-                mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-                
-                if activation > 0.7:
-                    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color[:3]
-                    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0
-                
-                mem.data.materials.append(mat)
+                strength = 1.0 if activation > 0.7 else 0.0
+                mem.data.materials.append(MATERIAL_POOL.get('principled', color, strength))
     
     # Query beam
     bpy.ops.mesh.primitive_cone_add(location=(0, -4, 0), radius1=0.5, depth=2)
@@ -460,11 +407,7 @@ def generate_context_switching():
         bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, 0), radius=0.8)
         sphere = bpy.context.active_object
         
-        mat = bpy.data.materials.new(context)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.7
-        sphere.data.materials.append(mat)
+        sphere.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1), alpha=0.7))
     
     # Switch mechanism (rotating cross)
     bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0), size=0.3)
@@ -504,10 +447,7 @@ def generate_information_filtering():
         importance = random.random()
         color = (importance, 1 - importance, 0.2, 1)
         
-        mat = bpy.data.materials.new(f"Data{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        data.data.materials.append(mat)
+        data.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     # Filter mesh
     bpy.ops.mesh.primitive_grid_add(location=(0, 0, 0), size=3)
@@ -518,11 +458,7 @@ def generate_information_filtering():
     modifier = filter_mesh.modifiers.new("Subsurf", 'SUBSURF')
     modifier.levels = 2
     
-    mat = bpy.data.materials.new("Filter")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.5  # Transparency
-    filter_mesh.data.materials.append(mat)
+    filter_mesh.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1), alpha=0.5))
     
     # Filtered output
     for i in range(10):
@@ -533,10 +469,7 @@ def generate_information_filtering():
         bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), radius=0.15)
         data = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Filtered{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.9, 0.2, 1)
-        data.data.materials.append(mat)
+        data.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.9, 0.2, 1)))
     
     add_camera_and_light((0, -6, 3))
     render_image('/home/franz/dev/claude-vision-gallery/public/memory/information_filtering.png')
@@ -549,10 +482,7 @@ def generate_association_network():
     # Central concept
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=0.5)
     central = bpy.context.active_object
-    mat = bpy.data.materials.new("Central")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.9, 0.2, 0.2, 1)
-    central.data.materials.append(mat)
+    central.data.materials.append(MATERIAL_POOL.get('principled', (0.9, 0.2, 0.2, 1)))
     
     # Associated concepts in layers
     for layer in range(3):
@@ -573,10 +503,7 @@ def generate_association_network():
             hue = (layer * 0.3) % 1.0
             color = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
             
-            mat = bpy.data.materials.new(f"Concept_{layer}_{i}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-            concept.data.materials.append(mat)
+            concept.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
     
     add_camera_and_light((8, -8, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/memory/association_network.png')
@@ -591,10 +518,7 @@ def generate_api_orchestration():
     # Central orchestrator
     bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, 0), radius=0.6, depth=0.3)
     orchestrator = bpy.context.active_object
-    mat = bpy.data.materials.new("Orchestrator")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.8, 1)
-    orchestrator.data.materials.append(mat)
+    orchestrator.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.8, 1)))
     
     # API endpoints
     apis = ["File", "Network", "Process", "Search", "Database"]
@@ -608,10 +532,7 @@ def generate_api_orchestration():
         bpy.ops.mesh.primitive_cube_add(location=(x, y, 0), size=0.8)
         endpoint = bpy.context.active_object
         
-        mat = bpy.data.materials.new(api)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        endpoint.data.materials.append(mat)
+        endpoint.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
         
         # Connection pipes
         bpy.ops.mesh.primitive_cylinder_add(location=(x/2, y/2, 0), radius=0.05, depth=3)
@@ -621,10 +542,7 @@ def generate_api_orchestration():
         direction = math.atan2(y, x)
         pipe.rotation_euler = (0, math.pi/2, direction)
         
-        mat = bpy.data.materials.new(f"Pipe{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-        pipe.data.materials.append(mat)
+        pipe.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
     
     add_camera_and_light((5, -5, 8))
     render_image('/home/franz/dev/claude-vision-gallery/public/tools/api_orchestration.png')
@@ -649,10 +567,7 @@ def generate_tool_pipeline():
         hue = i / len(stages)
         color = colorsys.hsv_to_rgb(hue, 0.6, 0.9)
         
-        mat = bpy.data.materials.new(stage)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        container.data.materials.append(mat)
+        container.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
         
         # Connecting pipe
         if i < len(stages) - 1:
@@ -664,10 +579,7 @@ def generate_tool_pipeline():
             pipe = bpy.context.active_object
             pipe.rotation_euler = (0, math.pi/2, 0)
             
-            mat = bpy.data.materials.new(f"Pipe{i}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.4, 0.4, 0.4, 1)
-            pipe.data.materials.append(mat)
+            pipe.data.materials.append(MATERIAL_POOL.get('principled', (0.4, 0.4, 0.4, 1)))
     
     add_camera_and_light((0, -8, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/tools/tool_pipeline.png')
@@ -680,12 +592,7 @@ def generate_error_cascade():
     # Initial error source
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 3, 0), radius=0.3)
     source = bpy.context.active_object
-    mat = bpy.data.materials.new("ErrorSource")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (1, 0, 0, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (1, 0, 0)
-    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 3.0
-    source.data.materials.append(mat)
+    source.data.materials.append(MATERIAL_POOL.get('principled', (1, 0, 0, 1), 3.0))
     
     # Cascading errors
     for level in range(3):
@@ -701,10 +608,7 @@ def generate_error_cascade():
             
             # Error intensity decreases
             intensity = 1.0 - (level * 0.3)
-            mat = bpy.data.materials.new(f"Error_{level}_{i}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (intensity, 0, 0, 1)
-            error.data.materials.append(mat)
+            error.data.materials.append(MATERIAL_POOL.get('principled', (intensity, 0, 0, 1)))
     
     add_camera_and_light((0, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/tools/error_cascade.png')
@@ -717,10 +621,7 @@ def generate_bash_execution():
     # Terminal window
     bpy.ops.mesh.primitive_plane_add(location=(0, 0, -0.5), size=6)
     terminal = bpy.context.active_object
-    mat = bpy.data.materials.new("Terminal")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.1, 0.1, 0.1, 1)
-    terminal.data.materials.append(mat)
+    terminal.data.materials.append(MATERIAL_POOL.get('principled', (0.1, 0.1, 0.1, 1)))
     
     # Command blocks
     commands = ["ls", "grep", "pipe", "output"]
@@ -737,10 +638,7 @@ def generate_bash_execution():
             "output": (0.2, 0.2, 0.8, 1)
         }
         
-        mat = bpy.data.materials.new(cmd)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = colors[cmd]
-        block.data.materials.append(mat)
+        block.data.materials.append(MATERIAL_POOL.get('principled', colors[cmd]))
     
     # Data flow arrows
     for i in range(3):
@@ -749,10 +647,7 @@ def generate_bash_execution():
         arrow = bpy.context.active_object
         arrow.rotation_euler = (0, -math.pi/2, 0)
         
-        mat = bpy.data.materials.new(f"Arrow{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.6, 0.6, 0.6, 1)
-        arrow.data.materials.append(mat)
+        arrow.data.materials.append(MATERIAL_POOL.get('principled', (0.6, 0.6, 0.6, 1)))
     
     add_camera_and_light((0, -6, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/tools/bash_execution.png')
@@ -768,19 +663,13 @@ def generate_tokenization_grid():
     bpy.ops.mesh.primitive_cube_add(location=(-3, 0, 0), size=1)
     text_block = bpy.context.active_object
     text_block.scale = (2, 3, 0.5)
-    mat = bpy.data.materials.new("Text")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.3, 0.3, 0.3, 1)
-    text_block.data.materials.append(mat)
+    text_block.data.materials.append(MATERIAL_POOL.get('principled', (0.3, 0.3, 0.3, 1)))
     
     # Arrow
     bpy.ops.mesh.primitive_cone_add(location=(0, 0, 0), radius1=0.3, depth=1)
     arrow = bpy.context.active_object
     arrow.rotation_euler = (0, math.pi/2, 0)
-    mat = bpy.data.materials.new("Arrow")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-    arrow.data.materials.append(mat)
+    arrow.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
     
     # Tokenized output
     token_types = ["word", "punct", "number", "special"]
@@ -801,10 +690,7 @@ def generate_tokenization_grid():
             bpy.ops.mesh.primitive_cube_add(location=(x, y, 0), size=0.5)
             token = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Token_{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = colors[token_type]
-            token.data.materials.append(mat)
+            token.data.materials.append(MATERIAL_POOL.get('principled', colors[token_type]))
     
     add_camera_and_light((0, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/language/tokenization_grid.png')
@@ -828,10 +714,7 @@ def generate_semantic_space():
         # Cluster center
         bpy.ops.mesh.primitive_uv_sphere_add(location=center, radius=0.3)
         core = bpy.context.active_object
-        mat = bpy.data.materials.new("ClusterCore")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*cluster["color"], 1)
-        core.data.materials.append(mat)
+        core.data.materials.append(MATERIAL_POOL.get('principled', (*cluster["color"], 1)))
         
         # Word points around cluster
         for i in range(cluster["words"]):
@@ -844,11 +727,8 @@ def generate_semantic_space():
             bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), radius=0.1)
             word = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Word_{i}")
-            mat.use_nodes = True
             color = tuple(c * 0.7 for c in cluster["color"])
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-            word.data.materials.append(mat)
+            word.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
     
     add_camera_and_light((0, 0, 8))
     render_image('/home/franz/dev/claude-vision-gallery/public/language/semantic_space.png')
@@ -874,10 +754,7 @@ def generate_multilingual_network():
         hub = bpy.context.active_object
         hubs.append(hub)
         
-        mat = bpy.data.materials.new(lang["name"])
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*lang["color"], 1)
-        hub.data.materials.append(mat)
+        hub.data.materials.append(MATERIAL_POOL.get('principled', (*lang["color"], 1)))
     
     # Inter-language connections
     for i in range(len(hubs)):
@@ -897,11 +774,7 @@ def generate_multilingual_network():
             # Simplified rotation calculation
             conn.rotation_euler = (0, math.acos(direction[2]/length) if length > 0 else 0, math.atan2(direction[1], direction[0]))
             
-            mat = bpy.data.materials.new(f"Conn_{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.6, 0.6, 0.6, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.5
-            conn.data.materials.append(mat)
+            conn.data.materials.append(MATERIAL_POOL.get('principled', (0.6, 0.6, 0.6, 1), alpha=0.5))
     
     add_camera_and_light((6, -6, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/language/multilingual_network.png')
@@ -935,10 +808,7 @@ def generate_text_generation_flow():
         hue = i / len(stages)
         color = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
         
-        mat = bpy.data.materials.new(stage)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        obj.data.materials.append(mat)
+        obj.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
         
         # Flow indicators
         if i < len(stages) - 1:
@@ -946,10 +816,7 @@ def generate_text_generation_flow():
             arrow = bpy.context.active_object
             arrow.rotation_euler = (math.pi, 0, 0)
             
-            mat = bpy.data.materials.new(f"Flow{i}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-            arrow.data.materials.append(mat)
+            arrow.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
     
     add_camera_and_light((5, -5, 3))
     render_image('/home/franz/dev/claude-vision-gallery/public/language/text_generation_flow.png')
@@ -972,10 +839,7 @@ def generate_grammar_structure():
             3: (0.8, 0.8, 0.2, 1)   # Part
         }
         
-        mat = bpy.data.materials.new(text)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = colors.get(level, (0.5, 0.5, 0.5, 1))
-        node.data.materials.append(mat)
+        node.data.materials.append(MATERIAL_POOL.get('principled', colors.get(level, (0.5, 0.5, 0.5, 1))))
         
         return node
     
@@ -1006,10 +870,7 @@ def generate_grammar_structure():
         # Orient edge
         edge.rotation_euler = (0, math.pi/4, 0)
         
-        mat = bpy.data.materials.new("Edge")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.4, 0.4, 0.4, 1)
-        edge.data.materials.append(mat)
+        edge.data.materials.append(MATERIAL_POOL.get('principled', (0.4, 0.4, 0.4, 1)))
     
     add_camera_and_light((0, -8, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/language/grammar_structure.png')
@@ -1024,10 +885,7 @@ def generate_task_decomposition():
     # Main task
     bpy.ops.mesh.primitive_cube_add(location=(0, 3, 0), size=1.2)
     main_task = bpy.context.active_object
-    mat = bpy.data.materials.new("MainTask")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.2, 0.2, 1)
-    main_task.data.materials.append(mat)
+    main_task.data.materials.append(MATERIAL_POOL.get('principled', (0.8, 0.2, 0.2, 1)))
     
     # Subtasks
     for i in range(3):
@@ -1037,10 +895,7 @@ def generate_task_decomposition():
         bpy.ops.mesh.primitive_cube_add(location=(x, y, 0), size=0.8)
         subtask = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Subtask{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.8, 0.2, 1)
-        subtask.data.materials.append(mat)
+        subtask.data.materials.append(MATERIAL_POOL.get('principled', (0.8, 0.8, 0.2, 1)))
         
         # Sub-subtasks
         for j in range(2):
@@ -1050,10 +905,7 @@ def generate_task_decomposition():
             bpy.ops.mesh.primitive_cube_add(location=(sx, sy, 0), size=0.5)
             subsubtask = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"SubSubtask{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.8, 0.2, 1)
-            subsubtask.data.materials.append(mat)
+            subsubtask.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.8, 0.2, 1)))
     
     add_camera_and_light((0, -6, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/problem_solving/task_decomposition.png')
@@ -1084,15 +936,9 @@ def generate_solution_search():
                     continue  # Don't show
                 
                 node = bpy.context.active_object
-                mat = bpy.data.materials.new(f"Sol_{i}_{j}_{k}")
-                mat.use_nodes = True
-                mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-                
-                if quality > 0.95:
-                    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0, 1, 0)
-                    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 2.0
-                
-                node.data.materials.append(mat)
+                # Optimal solutions are green and glow green
+                strength = 2.0 if quality > 0.95 else 0.0
+                node.data.materials.append(MATERIAL_POOL.get('principled', color, strength))
     
     # Search path
     path_points = [(0, 0, 0), (1, 1, 0.5), (2, 0, 1), (1.5, -1, 0.5), (0.5, -1.5, 0)]
@@ -1107,10 +953,7 @@ def generate_solution_search():
         bpy.ops.mesh.primitive_cylinder_add(location=mid, radius=0.05, depth=1)
         path = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Path{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (1, 0, 0, 1)
-        path.data.materials.append(mat)
+        path.data.materials.append(MATERIAL_POOL.get('principled', (1, 0, 0, 1)))
     
     add_camera_and_light((6, -6, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/problem_solving/solution_search.png')
@@ -1165,12 +1008,7 @@ def generate_optimization_landscape():
         bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z), radius=0.1)
         point = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Path{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (1, 1, 0, 1)
-        mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (1, 1, 0)
-        mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0
-        point.data.materials.append(mat)
+        point.data.materials.append(MATERIAL_POOL.get('principled', (1, 1, 0, 1), 1.0))
     
     add_camera_and_light((6, -6, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/problem_solving/optimization_landscape.png')
@@ -1190,10 +1028,7 @@ def generate_decision_tree():
         
         # Color by level
         colors = [(0.8, 0.2, 0.2), (0.8, 0.8, 0.2), (0.2, 0.8, 0.2), (0.2, 0.2, 0.8)]
-        mat = bpy.data.materials.new(f"Node_L{level}_B{branch_index}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*colors[level], 1)
-        node.data.materials.append(mat)
+        node.data.materials.append(MATERIAL_POOL.get('principled', (*colors[level], 1)))
         
         # Create branches
         if level < 3:
@@ -1216,10 +1051,7 @@ def generate_decision_tree():
                 direction = [child_pos[j] - parent_pos[j] for j in range(3)]
                 branch.rotation_euler = (math.pi/2, 0, math.atan2(direction[0], -direction[1]))
                 
-                mat = bpy.data.materials.new(f"Branch_L{level}_B{branch_index}_{i}")
-                mat.use_nodes = True
-                mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.4, 0.4, 0.4, 1)
-                branch.data.materials.append(mat)
+                branch.data.materials.append(MATERIAL_POOL.get('principled', (0.4, 0.4, 0.4, 1)))
                 
                 # Recursively create children
                 create_tree_level(child_pos, level + 1, branch_index * 2 + i)
@@ -1250,10 +1082,7 @@ def generate_constraint_graph():
         satisfied = random.random() > 0.3
         color = (0.2, 0.8, 0.2, 1) if satisfied else (0.8, 0.2, 0.2, 1)
         
-        mat = bpy.data.materials.new(f"Var{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        var.data.materials.append(mat)
+        var.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     # Constraints as connections
     for i in range(15):
@@ -1280,11 +1109,8 @@ def generate_constraint_graph():
             
             # Constraint satisfaction state
             satisfied = random.random() > 0.2
-            mat = bpy.data.materials.new(f"Constraint{i}")
-            mat.use_nodes = True
             color = (0.2, 0.8, 0.2, 1) if satisfied else (0.8, 0.8, 0.2, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-            obj.data.materials.append(mat)
+            obj.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     add_camera_and_light((0, 0, 8))
     render_image('/home/franz/dev/claude-vision-gallery/public/problem_solving/constraint_graph.png')
@@ -1299,11 +1125,7 @@ def generate_process_threads():
     # Main process
     bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, 0), radius=0.8, depth=4)
     process = bpy.context.active_object
-    mat = bpy.data.materials.new("Process")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.8, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.5
-    process.data.materials.append(mat)
+    process.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.8, 1), alpha=0.5))
     
     # Threads spiraling around
     num_threads = 4
@@ -1322,10 +1144,7 @@ def generate_process_threads():
             bpy.ops.mesh.primitive_cube_add(location=(x, y, z), size=0.2)
             segment = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Thread{i}_Seg{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*thread_color, 1)
-            segment.data.materials.append(mat)
+            segment.data.materials.append(MATERIAL_POOL.get('principled', (*thread_color, 1)))
     
     add_camera_and_light((5, -5, 0))
     render_image('/home/franz/dev/claude-vision-gallery/public/system/process_threads.png')
@@ -1338,10 +1157,7 @@ def generate_io_streams():
     # System core
     bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0), size=1.5)
     core = bpy.context.active_object
-    mat = bpy.data.materials.new("SystemCore")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.3, 0.3, 0.3, 1)
-    core.data.materials.append(mat)
+    core.data.materials.append(MATERIAL_POOL.get('principled', (0.3, 0.3, 0.3, 1)))
     
     # Input streams
     for i in range(3):
@@ -1355,10 +1171,7 @@ def generate_io_streams():
             bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), radius=0.1)
             particle = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Input{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.8, 0.2, 1)
-            particle.data.materials.append(mat)
+            particle.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.8, 0.2, 1)))
     
     # Output streams
     for i in range(3):
@@ -1372,10 +1185,7 @@ def generate_io_streams():
             bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), radius=0.1)
             particle = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Output{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.8, 0.2, 0.2, 1)
-            particle.data.materials.append(mat)
+            particle.data.materials.append(MATERIAL_POOL.get('principled', (0.8, 0.2, 0.2, 1)))
     
     add_camera_and_light((0, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/system/io_streams.png')
@@ -1397,10 +1207,7 @@ def generate_network_packets():
         node = bpy.context.active_object
         nodes.append(node)
         
-        mat = bpy.data.materials.new(f"Node{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.8, 1)
-        node.data.materials.append(mat)
+        node.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.8, 1)))
     
     # Network connections
     connections = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3),
@@ -1417,10 +1224,7 @@ def generate_network_packets():
         bpy.ops.mesh.primitive_cylinder_add(location=mid, radius=0.05, depth=length)
         conn = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Conn_{n1}_{n2}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-        conn.data.materials.append(mat)
+        conn.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
         
         # Add packets
         for j in range(3):
@@ -1430,13 +1234,8 @@ def generate_network_packets():
             bpy.ops.mesh.primitive_cube_add(location=packet_pos, size=0.15)
             packet = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Packet_{n1}_{n2}_{j}")
-            mat.use_nodes = True
             color = colorsys.hsv_to_rgb(random.random(), 0.8, 0.9)
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color
-            mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0
-            packet.data.materials.append(mat)
+            packet.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1), 1.0))
     
     add_camera_and_light((6, -6, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/system/network_packets.png')
@@ -1470,15 +1269,8 @@ def generate_file_operations():
             
             block = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Block_{i}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-            
-            if state != "empty":
-                mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color[:3]
-                mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 0.5
-            
-            block.data.materials.append(mat)
+            strength = 0.5 if state != "empty" else 0.0
+            block.data.materials.append(MATERIAL_POOL.get('principled', color, strength))
     
     # Operation indicators
     ops = ["READ", "WRITE", "DELETE"]
@@ -1497,10 +1289,7 @@ def generate_file_operations():
             color = (0.8, 0.8, 0.2, 1)
         
         indicator = bpy.context.active_object
-        mat = bpy.data.materials.new(op)
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        indicator.data.materials.append(mat)
+        indicator.data.materials.append(MATERIAL_POOL.get('principled', color))
     
     add_camera_and_light((0, -6, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/system/file_operations.png')
@@ -1513,10 +1302,7 @@ def generate_system_calls():
     # Kernel space
     bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, -1), radius=3, depth=0.5)
     kernel = bpy.context.active_object
-    mat = bpy.data.materials.new("Kernel")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.4, 1)
-    kernel.data.materials.append(mat)
+    kernel.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.4, 1)))
     
     # User space processes
     for i in range(6):
@@ -1528,12 +1314,9 @@ def generate_system_calls():
         bpy.ops.mesh.primitive_cube_add(location=(x, y, z), size=0.6)
         process = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Process{i}")
-        mat.use_nodes = True
         hue = i / 6
         color = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        process.data.materials.append(mat)
+        process.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
         
         # System call beam
         bpy.ops.mesh.primitive_cone_add(location=(x/2, y/2, 0), radius1=0.1, depth=2)
@@ -1615,11 +1398,7 @@ def generate_self_awareness_loop():
         bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z), radius=0.2)
         thought = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Thought{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.9, 0.9, 0.9, 1)
-        mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.7
-        thought.data.materials.append(mat)
+        thought.data.materials.append(MATERIAL_POOL.get('principled', (0.9, 0.9, 0.9, 1), alpha=0.7))
     
     add_camera_and_light((4, -4, 3))
     render_image('/home/franz/dev/claude-vision-gallery/public/consciousness/self_awareness_loop.png')
@@ -1690,25 +1469,14 @@ def generate_uncertainty_field():
         bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), radius=size, subdivisions=1)
         particle = bpy.context.active_object
         
-        mat = bpy.data.materials.new(f"Uncertain{i}")
-        mat.use_nodes = True
-        
         # Color gradient from certain (blue) to uncertain (red)
         color = (uncertainty, 0.2, 1 - uncertainty, 1)
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.5 + uncertainty * 0.5
-        
-        particle.data.materials.append(mat)
+        particle.data.materials.append(MATERIAL_POOL.get('principled', color, alpha=0.5 + uncertainty * 0.5))
     
     # Certainty core
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=0.3)
     core = bpy.context.active_object
-    mat = bpy.data.materials.new("CertaintyCore")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0, 0, 1, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0, 0, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 2.0
-    core.data.materials.append(mat)
+    core.data.materials.append(MATERIAL_POOL.get('principled', (0, 0, 1, 1), 2.0))
     
     add_camera_and_light((6, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/consciousness/uncertainty_field.png')
@@ -1741,15 +1509,8 @@ def generate_confidence_levels():
         else:
             color = (0.9, 0.2, 0.2, 1)
         
-        mat = bpy.data.materials.new(f"Conf{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        
-        if conf > 0.8:
-            mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color[:3]
-            mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 0.5
-        
-        bar.data.materials.append(mat)
+        strength = 0.5 if conf > 0.8 else 0.0
+        bar.data.materials.append(MATERIAL_POOL.get('principled', color, strength))
     
     add_camera_and_light((0, -8, 3))
     render_image('/home/franz/dev/claude-vision-gallery/public/consciousness/confidence_levels.png')
@@ -1775,15 +1536,8 @@ def generate_introspection_spiral():
         depth = i / 100
         color = (0.2, 0.2 + depth * 0.6, 0.8, 1)
         
-        mat = bpy.data.materials.new(f"Spiral{i}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        
-        if depth > 0.7:
-            mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color[:3]
-            mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = depth
-        
-        segment.data.materials.append(mat)
+        strength = depth if depth > 0.7 else 0.0
+        segment.data.materials.append(MATERIAL_POOL.get('principled', color, strength))
     
     # Center of consciousness
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, -5), radius=0.5)
@@ -1807,17 +1561,11 @@ def generate_user_dialogue_flow():
     # User and Claude nodes
     bpy.ops.mesh.primitive_uv_sphere_add(location=(-3, 0, 0), radius=0.6)
     user = bpy.context.active_object
-    mat = bpy.data.materials.new("User")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.8, 0.2, 1)
-    user.data.materials.append(mat)
+    user.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.8, 0.2, 1)))
     
     bpy.ops.mesh.primitive_uv_sphere_add(location=(3, 0, 0), radius=0.6)
     claude = bpy.context.active_object
-    mat = bpy.data.materials.new("Claude")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.2, 0.2, 0.8, 1)
-    claude.data.materials.append(mat)
+    claude.data.materials.append(MATERIAL_POOL.get('principled', (0.2, 0.2, 0.8, 1)))
     
     # Message exchanges
     for i in range(6):
@@ -1829,15 +1577,11 @@ def generate_user_dialogue_flow():
         message = bpy.context.active_object
         message.rotation_euler = (0, math.pi/2 * direction, 0)
         
-        # Message type color
-        msg_types = ["question", "answer", "clarification", "response", "follow-up", "conclusion"]
+        # Message type color: question, answer, clarification, response, follow-up, conclusion
         colors = [(0.9, 0.9, 0.2), (0.2, 0.9, 0.9), (0.9, 0.2, 0.9),
                   (0.2, 0.9, 0.2), (0.9, 0.6, 0.2), (0.6, 0.2, 0.9)]
         
-        mat = bpy.data.materials.new(msg_types[i])
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*colors[i], 1)
-        message.data.materials.append(mat)
+        message.data.materials.append(MATERIAL_POOL.get('principled', (*colors[i], 1)))
     
     add_camera_and_light((0, -6, 4))
     render_image('/home/franz/dev/claude-vision-gallery/public/interaction/user_dialogue_flow.png')
@@ -1874,10 +1618,7 @@ def generate_response_generation():
         hue = i / len(stages)
         color = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
         
-        mat = bpy.data.materials.new(stage["name"])
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*color, 1)
-        obj.data.materials.append(mat)
+        obj.data.materials.append(MATERIAL_POOL.get('principled', (*color, 1)))
     
     add_camera_and_light((0, -6, 5))
     render_image('/home/franz/dev/claude-vision-gallery/public/interaction/response_generation.png')
@@ -1922,12 +1663,7 @@ def generate_context_understanding():
             bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z + 0.1), radius=0.1)
             node = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"Info_{layer}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (1, 1, 1, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (1, 1, 1)
-            mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 0.5
-            node.data.materials.append(mat)
+            node.data.materials.append(MATERIAL_POOL.get('principled', (1, 1, 1, 1), 0.5))
     
     add_camera_and_light((4, -4, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/interaction/context_understanding.png')
@@ -1940,12 +1676,7 @@ def generate_empathy_mapping():
     # Central empathy core
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=0.5)
     core = bpy.context.active_object
-    mat = bpy.data.materials.new("EmpathyCore")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.9, 0.2, 0.5, 1)
-    mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0.9, 0.2, 0.5)
-    mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0
-    core.data.materials.append(mat)
+    core.data.materials.append(MATERIAL_POOL.get('principled', (0.9, 0.2, 0.5, 1), 1.0))
     
     # Empathy dimensions
     dimensions = [
@@ -1970,15 +1701,8 @@ def generate_empathy_mapping():
             bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, 0), radius=size)
             ray = bpy.context.active_object
             
-            mat = bpy.data.materials.new(f"{dim['name']}_{j}")
-            mat.use_nodes = True
-            mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*dim["color"], 1)
-            
-            if j < 2:
-                mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = dim["color"]
-                mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0 - j * 0.3
-            
-            ray.data.materials.append(mat)
+            strength = 1.0 - j * 0.3 if j < 2 else 0.0
+            ray.data.materials.append(MATERIAL_POOL.get('principled', (*dim["color"], 1), strength))
     
     add_camera_and_light((0, 0, 8))
     render_image('/home/franz/dev/claude-vision-gallery/public/interaction/empathy_mapping.png')
@@ -2005,10 +1729,7 @@ def generate_conversation_state():
         node = bpy.context.active_object
         nodes[state["name"]] = node
         
-        mat = bpy.data.materials.new(state["name"])
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (*state["color"], 1)
-        node.data.materials.append(mat)
+        node.data.materials.append(MATERIAL_POOL.get('principled', (*state["color"], 1)))
     
     # State transitions
     transitions = [
@@ -2032,10 +1753,7 @@ def generate_conversation_state():
         angle = math.atan2(direction[1], direction[0])
         transition.rotation_euler = (0, 0, angle)
         
-        mat = bpy.data.materials.new(f"Trans_{from_state}_{to_state}")
-        mat.use_nodes = True
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0.5, 0.5, 0.5, 1)
-        transition.data.materials.append(mat)
+        transition.data.materials.append(MATERIAL_POOL.get('principled', (0.5, 0.5, 0.5, 1)))
     
     add_camera_and_light((0, -8, 6))
     render_image('/home/franz/dev/claude-vision-gallery/public/interaction/conversation_state.png')
@@ -2045,70 +1763,112 @@ print("Starting comprehensive Claude Code visualization generation...")
 
 # THINKING
 print("\n=== Generating THINKING visualizations ===")
+seed_scene("thinking/context_window.png")
 generate_context_window()
+seed_scene("thinking/thought_chains.png")
 generate_thought_chains()
+seed_scene("thinking/parallel_reasoning.png")
 generate_parallel_reasoning()
 
 # CODE
 print("\n=== Generating CODE visualizations ===")
+seed_scene("code/code_flow.png")
 generate_code_flow()
+seed_scene("code/bug_detection.png")
 generate_bug_detection()
+seed_scene("code/pattern_matching.png")
 generate_pattern_matching()
+seed_scene("code/refactoring_paths.png")
 generate_refactoring_paths()
 
 # MEMORY
 print("\n=== Generating MEMORY visualizations ===")
+seed_scene("memory/knowledge_graph.png")
 generate_knowledge_graph()
+seed_scene("memory/memory_retrieval.png")
 generate_memory_retrieval()
+seed_scene("memory/context_switching.png")
 generate_context_switching()
+seed_scene("memory/information_filtering.png")
 generate_information_filtering()
+seed_scene("memory/association_network.png")
 generate_association_network()
 
 # TOOLS
 print("\n=== Generating TOOLS visualizations ===")
+seed_scene("tools/api_orchestration.png")
 generate_api_orchestration()
+seed_scene("tools/tool_pipeline.png")
 generate_tool_pipeline()
+seed_scene("tools/error_cascade.png")
 generate_error_cascade()
+seed_scene("tools/bash_execution.png")
 generate_bash_execution()
 
 # LANGUAGE
 print("\n=== Generating LANGUAGE visualizations ===")
+seed_scene("language/tokenization_grid.png")
 generate_tokenization_grid()
+seed_scene("language/semantic_space.png")
 generate_semantic_space()
+seed_scene("language/multilingual_network.png")
 generate_multilingual_network()
+seed_scene("language/text_generation_flow.png")
 generate_text_generation_flow()
+seed_scene("language/grammar_structure.png")
 generate_grammar_structure()
 
 # PROBLEM SOLVING
 print("\n=== Generating PROBLEM SOLVING visualizations ===")
+seed_scene("problem_solving/task_decomposition.png")
 generate_task_decomposition()
+seed_scene("problem_solving/solution_search.png")
 generate_solution_search()
+seed_scene("problem_solving/optimization_landscape.png")
 generate_optimization_landscape()
+seed_scene("problem_solving/decision_tree.png")
 generate_decision_tree()
+seed_scene("problem_solving/constraint_graph.png")
 generate_constraint_graph()
 
 # SYSTEM
 print("\n=== Generating SYSTEM visualizations ===")
+seed_scene("system/process_threads.png")
 generate_process_threads()
+seed_scene("system/io_streams.png")
 generate_io_streams()
+seed_scene("system/network_packets.png")
 generate_network_packets()
+seed_scene("system/file_operations.png")
 generate_file_operations()
+seed_scene("system/system_calls.png")
 generate_system_calls()
 
 # CONSCIOUSNESS
 print("\n=== Generating CONSCIOUSNESS visualizations ===")
+seed_scene("consciousness/self_awareness_loop.png")
 generate_self_awareness_loop()
+seed_scene("consciousness/meta_cognition.png")
 generate_meta_cognition()
+seed_scene("consciousness/uncertainty_field.png")
 generate_uncertainty_field()
+seed_scene("consciousness/confidence_levels.png")
 generate_confidence_levels()
+seed_scene("consciousness/introspection_spiral.png")
 generate_introspection_spiral()
 
 # INTERACTION
 print("\n=== Generating INTERACTION visualizations ===")
+seed_scene("interaction/user_dialogue_flow.png")
 generate_user_dialogue_flow()
+seed_scene("interaction/response_generation.png")
 generate_response_generation()
+seed_scene("interaction/context_understanding.png")
 generate_context_understanding()
+seed_scene("interaction/empathy_mapping.png")
 generate_empathy_mapping()
+seed_scene("interaction/conversation_state.png")
 generate_conversation_state()
 
+MATERIAL_POOL.report()
 print("\n✅ All 45 visualizations generated successfully!")
\ No newline at end of file
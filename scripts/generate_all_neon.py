@@ -3,6 +3,23 @@ import bpy
 import math
 import random
 import os
+import sys
+import time
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import set_neon_emission
+from render_cache import RenderCache, default_index_path, render_settings, scene_key
+from render_jobs import (
+    DEFAULT_OUTPUT_ROOT, SCENE_DONE, SCENE_FAILED, SCENE_LISTED, SCENE_STARTED,
+    blender_argv, format_marker, scene_arg_parser, select_scenes,
+)
+from scene_seeds import DEFAULT_BASE_SEED, scene_seed, seed_scene
+from scene_builder import add_cone, add_cube, add_cylinder, add_ico_sphere, add_polyline, add_torus, add_uv_sphere, reset_scene
+from animation import keyframe_path, render_frames, spin, turntable
+from framing import current_framing, frame_scene, set_framing
+from tiled_render import current_tile
+from quality_presets import QUALITY_PRESETS, render_still, set_quality
 
 # Configure for neon aesthetic with dark background
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -14,8 +31,7 @@ bpy.context.scene.eevee.bloom_radius = 6.5
 bpy.context.scene.eevee.use_bloom = True
 
 def clear_scene():
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
     
 def setup_dark_world():
     """Pure black background for maximum neon contrast"""
@@ -33,27 +49,13 @@ def add_centered_camera():
     bpy.context.scene.camera = camera
     camera.data.lens = 50
 
-def get_neon_material(name, color, intensity=10):
-    """Ultra bright neon material"""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs[0].default_value = (*color, 1.0)
-    emission.inputs[1].default_value = intensity
-    
-    output = nodes.new('ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-    
-    return mat
-
 def render_image(filepath):
+    """Render to a temporary file and swap it in, so the gallery never sees a partial image"""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    bpy.context.scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    root, ext = os.path.splitext(filepath)
+    temp_path = f"{root}.rendering{ext}"
+    if render_still(temp_path, ladder_path=filepath) == temp_path:
+        os.replace(temp_path, filepath)
 
 # ELECTRIC NEON COLORS
 NEON = {
@@ -70,26 +72,29 @@ NEON = {
 }
 
 # THINKING CATEGORY
+TOKEN_STREAM_LENGTH = 30
+
+def token_stream_point(i):
+    """Position of the i-th token along the stream (i may be fractional)"""
+    t = i / 5
+    return ((i - 15) * 0.3, math.sin(t) * 2, math.cos(t) * 0.5)
+
 def create_token_stream():
     clear_scene()
     setup_dark_world()
     add_centered_camera()
     
     # Flowing stream of glowing tokens
-    for i in range(30):
+    for i in range(TOKEN_STREAM_LENGTH):
         t = i / 5
-        x = (i - 15) * 0.3
-        y = math.sin(t) * 2
-        z = math.cos(t) * 0.5
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        token = bpy.context.object
+        token = add_cube(location=token_stream_point(i))
         token.scale = (0.2, 0.2, 0.2)
         
         colors = [NEON['cyan'], NEON['magenta'], NEON['yellow']]
         color = colors[i % len(colors)]
         intensity = 8 + math.sin(t) * 3
-        token.data.materials.append(get_neon_material(f"Token{i}", color, intensity))
+        set_neon_emission(token, color, intensity)
 
 def create_attention_matrix():
     clear_scene()
@@ -108,13 +113,12 @@ def create_attention_matrix():
                 weight = random.random()
                 scale = 0.05 + weight * 0.15
                 
-                bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z))
-                node = bpy.context.object
+                node = add_uv_sphere(location=(x, y, z))
                 node.scale = (scale, scale, scale)
                 
                 color = NEON['cyan'] if weight > 0.7 else NEON['blue']
                 intensity = 5 + weight * 10
-                node.data.materials.append(get_neon_material(f"Att{i}{j}", color, intensity))
+                set_neon_emission(node, color, intensity)
 
 def create_context_window():
     clear_scene()
@@ -126,31 +130,18 @@ def create_context_window():
         size = 4 - layer * 0.6
         depth = layer * 0.3
         
-        # Create glowing frame edges
-        edges = [
-            ((-size, -size, depth), (size, -size, depth)),
-            ((size, -size, depth), (size, size, depth)),
-            ((size, size, depth), (-size, size, depth)),
-            ((-size, size, depth), (-size, -size, depth))
+        # Glowing frame as one closed tube
+        corners = [
+            (-size, -size, depth),
+            (size, -size, depth),
+            (size, size, depth),
+            (-size, size, depth)
         ]
+        frame = add_polyline(f"Frame{layer}", corners, radius=0.05, cyclic=True)
         
-        for idx, (start, end) in enumerate(edges):
-            mid = [(s + e) / 2 for s, e in zip(start, end)]
-            length = math.sqrt(sum((e - s)**2 for s, e in zip(start, end)))
-            
-            bpy.ops.mesh.primitive_cylinder_add(location=mid)
-            edge = bpy.context.object
-            edge.scale = (0.05, 0.05, length / 2)
-            
-            # Orient edge
-            if idx % 2 == 0:  # Horizontal
-                edge.rotation_euler = (0, 1.57, 0)
-            else:  # Vertical
-                edge.rotation_euler = (1.57, 0, 0)
-            
-            colors = [NEON['cyan'], NEON['magenta'], NEON['yellow'], NEON['green'], NEON['blue'], NEON['pink']]
-            color = colors[layer % len(colors)]
-            edge.data.materials.append(get_neon_material(f"Frame{layer}{idx}", color, 8))
+        colors = [NEON['cyan'], NEON['magenta'], NEON['yellow'], NEON['green'], NEON['blue'], NEON['pink']]
+        color = colors[layer % len(colors)]
+        set_neon_emission(frame, color, 8)
 
 def create_thought_chains():
     clear_scene()
@@ -159,10 +150,9 @@ def create_thought_chains():
     
     # Create central neural hub with radiating chains
     # Central core
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    core = bpy.context.object
+    core = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     core.scale = (0.5, 0.5, 0.5)
-    core.data.materials.append(get_neon_material("Core", NEON['white'], 15))
+    set_neon_emission(core, NEON['white'], 15)
     
     # Radiating thought chains
     chains = 8
@@ -176,13 +166,12 @@ def create_thought_chains():
             y = math.sin(angle) * dist
             z = math.sin(j * 0.5) * 0.3
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            thought = bpy.context.object
+            thought = add_ico_sphere(location=(x, y, z))
             thought.scale = (0.3 - j * 0.04, 0.3 - j * 0.04, 0.3 - j * 0.04)
             
             color = list(NEON.values())[i % len(NEON)]
             intensity = 10 - j * 1.5
-            thought.data.materials.append(get_neon_material(f"Thought{i}{j}", color, intensity))
+            set_neon_emission(thought, color, intensity)
 
 def create_parallel_reasoning():
     clear_scene()
@@ -201,14 +190,13 @@ def create_parallel_reasoning():
             y = y_offset
             z = math.sin(i * 0.5 + stream * 0.8) * 0.3
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            pulse = bpy.context.object
+            pulse = add_cube(location=(x, y, z))
             
             scale = 0.15 + math.sin(i * 0.3) * 0.1
             pulse.scale = (scale, scale, scale)
             
             intensity = 6 + abs(math.sin(i * 0.3)) * 6
-            pulse.data.materials.append(get_neon_material(f"Stream{stream}{i}", color, intensity))
+            set_neon_emission(pulse, color, intensity)
 
 # CODE CATEGORY
 def create_syntax_tree():
@@ -217,10 +205,9 @@ def create_syntax_tree():
     add_centered_camera()
     
     def add_node(pos, size, color, name):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=2)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos, subdivisions=2)
         node.scale = (size, size, size)
-        node.data.materials.append(get_neon_material(name, color, 12))
+        set_neon_emission(node, color, 12)
         return node
     
     def connect_nodes(start_pos, end_pos, name):
@@ -232,8 +219,7 @@ def create_syntax_tree():
         dz = end_pos[2] - start_pos[2]
         length = math.sqrt(dx**2 + dy**2 + dz**2)
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.02, 0.02, length / 2)
         
         # Point cylinder from start to end
@@ -242,7 +228,7 @@ def create_syntax_tree():
             angle_y = math.atan2(dz, math.sqrt(dx**2 + dy**2))
             edge.rotation_euler = (1.57 + angle_y, 0, angle_z)
         
-        edge.data.materials.append(get_neon_material(name, NEON['white'], 5))
+        set_neon_emission(edge, NEON['white'], 5)
     
     # Build tree structure
     root = add_node((0, 0, 2), 0.4, NEON['magenta'], "Root")
@@ -283,8 +269,7 @@ def create_code_flow():
         y = math.sin(t) * radius
         z = (i - points/2) * 0.1
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        flow = bpy.context.object
+        flow = add_cube(location=(x, y, z))
         flow.scale = (0.2, 0.2, 0.2)
         
         # Color gradient through spectrum
@@ -292,7 +277,7 @@ def create_code_flow():
         color = list(NEON.values())[color_idx % len(NEON)]
         intensity = 5 + (i / points) * 8
         
-        flow.data.materials.append(get_neon_material(f"Flow{i}", color, intensity))
+        set_neon_emission(flow, color, intensity)
 
 def create_bug_detection():
     clear_scene()
@@ -309,8 +294,7 @@ def create_bug_detection():
             y = (j - grid_size/2) * 0.8
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            block = bpy.context.object
+            block = add_cube(location=(x, y, z))
             
             # Check if bug position
             is_bug = (i, j) in bug_positions
@@ -324,14 +308,13 @@ def create_bug_detection():
                 color = NEON['green']
                 intensity = 3
             
-            block.data.materials.append(get_neon_material(f"Block{i}{j}", color, intensity))
+            set_neon_emission(block, color, intensity)
             
             # Add warning glow around bugs
             if is_bug:
-                bpy.ops.mesh.primitive_torus_add(location=(x, y, z))
-                warning = bpy.context.object
+                warning = add_torus(location=(x, y, z))
                 warning.scale = (0.6, 0.6, 0.1)
-                warning.data.materials.append(get_neon_material(f"Warning{i}{j}", NEON['orange'], 8))
+                set_neon_emission(warning, NEON['orange'], 8)
 
 def create_pattern_matching():
     clear_scene()
@@ -358,10 +341,9 @@ def create_pattern_matching():
             pos_x = base_x + x * 0.6
             pos_y = y * 0.6
             
-            bpy.ops.mesh.primitive_cube_add(location=(pos_x, pos_y, 0))
-            block = bpy.context.object
+            block = add_cube(location=(pos_x, pos_y, 0))
             block.scale = (0.25, 0.25, 0.25)
-            block.data.materials.append(get_neon_material(f"Pattern{p_idx}_{x}_{y}", color, 10))
+            set_neon_emission(block, color, 10)
         
         # Add connecting glow between pattern blocks
         for i in range(len(pattern) - 1):
@@ -369,10 +351,9 @@ def create_pattern_matching():
             end = (base_x + pattern[i+1][0] * 0.6, pattern[i+1][1] * 0.6, 0)
             mid = [(s + e) / 2 for s, e in zip(start, end)]
             
-            bpy.ops.mesh.primitive_cylinder_add(location=mid)
-            connector = bpy.context.object
+            connector = add_cylinder(location=mid)
             connector.scale = (0.05, 0.05, 0.3)
-            connector.data.materials.append(get_neon_material(f"Connect{p_idx}_{i}", color, 5))
+            set_neon_emission(connector, color, 5)
 
 def create_refactoring_paths():
     clear_scene()
@@ -386,11 +367,10 @@ def create_refactoring_paths():
         y = random.uniform(-2, 2)
         z = random.uniform(-0.5, 0.5)
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        messy = bpy.context.object
+        messy = add_cube(location=(x, y, z))
         messy.scale = (0.2, 0.2, 0.2)
         messy.rotation_euler = (random.random(), random.random(), random.random())
-        messy.data.materials.append(get_neon_material(f"Messy{i}", NEON['red'], 4))
+        set_neon_emission(messy, NEON['red'], 4)
     
     # Clean "after" state
     for i in range(3):
@@ -399,18 +379,16 @@ def create_refactoring_paths():
             y = (j - 1.5) * 0.6
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            clean = bpy.context.object
+            clean = add_cube(location=(x, y, z))
             clean.scale = (0.25, 0.25, 0.25)
-            clean.data.materials.append(get_neon_material(f"Clean{i}{j}", NEON['green'], 8))
+            set_neon_emission(clean, NEON['green'], 8)
     
     # Transformation arrows
     for i in range(3):
         y = (i - 1) * 1.5
-        bpy.ops.mesh.primitive_cone_add(location=(0, y, 0), rotation=(0, 0, -1.57))
-        arrow = bpy.context.object
+        arrow = add_cone(location=(0, y, 0), rotation=(0, 0, -1.57))
         arrow.scale = (0.3, 0.3, 0.8)
-        arrow.data.materials.append(get_neon_material(f"Arrow{i}", NEON['yellow'], 12))
+        set_neon_emission(arrow, NEON['yellow'], 12)
 
 # MEMORY CATEGORY
 def create_knowledge_graph():
@@ -422,10 +400,9 @@ def create_knowledge_graph():
     nodes = []
     
     # Central hub
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    hub = bpy.context.object
+    hub = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     hub.scale = (0.6, 0.6, 0.6)
-    hub.data.materials.append(get_neon_material("Hub", NEON['white'], 15))
+    set_neon_emission(hub, NEON['white'], 15)
     nodes.append(hub)
     
     # Primary concepts
@@ -437,20 +414,18 @@ def create_knowledge_graph():
         z = 0
         primary_positions.append((x, y, z))
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        primary = bpy.context.object
+        primary = add_ico_sphere(location=(x, y, z))
         primary.scale = (0.4, 0.4, 0.4)
         
         color = list(NEON.values())[i % len(NEON)]
-        primary.data.materials.append(get_neon_material(f"Primary{i}", color, 10))
+        set_neon_emission(primary, color, 10)
         nodes.append(primary)
         
         # Connect to hub
-        bpy.ops.mesh.primitive_cylinder_add(location=(x/2, y/2, 0))
-        edge = bpy.context.object
+        edge = add_cylinder(location=(x/2, y/2, 0))
         edge.scale = (0.02, 0.02, 1.25)
         edge.rotation_euler = (0, 0, angle)
-        edge.data.materials.append(get_neon_material(f"EdgeHub{i}", NEON['white'], 3))
+        set_neon_emission(edge, NEON['white'], 3)
     
     # Secondary concepts
     for i, (px, py, pz) in enumerate(primary_positions):
@@ -460,12 +435,11 @@ def create_knowledge_graph():
             y = py + math.sin(angle) * 1
             z = random.uniform(-0.5, 0.5)
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            secondary = bpy.context.object
+            secondary = add_ico_sphere(location=(x, y, z))
             secondary.scale = (0.25, 0.25, 0.25)
             
             color = list(NEON.values())[(i + j + 3) % len(NEON)]
-            secondary.data.materials.append(get_neon_material(f"Secondary{i}{j}", color, 6))
+            set_neon_emission(secondary, color, 6)
 
 def create_memory_retrieval():
     clear_scene()
@@ -473,10 +447,9 @@ def create_memory_retrieval():
     add_centered_camera()
     
     # Query pulse at center
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0))
-    query = bpy.context.object
+    query = add_uv_sphere(location=(0, 0, 0))
     query.scale = (0.5, 0.5, 0.5)
-    query.data.materials.append(get_neon_material("Query", NEON['yellow'], 15))
+    set_neon_emission(query, NEON['yellow'], 15)
     
     # Memory fragments being accessed
     memories = 20
@@ -489,8 +462,7 @@ def create_memory_retrieval():
         y = math.sin(angle) * distance
         z = height
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        memory = bpy.context.object
+        memory = add_cube(location=(x, y, z))
         memory.scale = (0.2, 0.2, 0.2)
         
         # Closer memories glow brighter
@@ -498,7 +470,7 @@ def create_memory_retrieval():
         colors = [NEON['cyan'], NEON['magenta'], NEON['green']]
         color = colors[i % len(colors)]
         
-        memory.data.materials.append(get_neon_material(f"Memory{i}", color, intensity))
+        set_neon_emission(memory, color, intensity)
         
         # Retrieval beam
         if distance < 3:
@@ -506,8 +478,7 @@ def create_memory_retrieval():
             mid_y = y / 2
             mid_z = z / 2
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, mid_y, mid_z))
-            beam = bpy.context.object
+            beam = add_cylinder(location=(mid_x, mid_y, mid_z))
             beam.scale = (0.01, 0.01, distance / 2)
             
             # Orient beam
@@ -517,7 +488,7 @@ def create_memory_retrieval():
                 math.atan2(y, x)
             )
             
-            beam.data.materials.append(get_neon_material(f"Beam{i}", NEON['white'], 2))
+            set_neon_emission(beam, NEON['white'], 2)
 
 def create_context_switching():
     clear_scene()
@@ -540,13 +511,12 @@ def create_context_switching():
             x = math.cos(angle) * radius
             y = math.sin(angle) * radius
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            segment = bpy.context.object
+            segment = add_cube(location=(x, y, z))
             segment.scale = (0.2, 0.2, 0.1)
             
             # Active context glows brighter
             intensity = 12 if i == 2 else 6
-            segment.data.materials.append(get_neon_material(f"{context}{j}", color, intensity))
+            set_neon_emission(segment, color, intensity)
 
 def create_information_filtering():
     clear_scene()
@@ -559,14 +529,13 @@ def create_information_filtering():
         y = random.uniform(-3, 3)
         z = random.uniform(-1, 1)
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        noise = bpy.context.object
+        noise = add_cube(location=(x, y, z))
         noise.scale = (0.1, 0.1, 0.1)
         
         # Most data is dim noise
         color = NEON['blue'] if random.random() > 0.8 else NEON['purple']
         intensity = 8 if random.random() > 0.8 else 2
-        noise.data.materials.append(get_neon_material(f"Noise{i}", color, intensity))
+        set_neon_emission(noise, color, intensity)
     
     # Filter mesh at center
     filter_size = 2
@@ -577,10 +546,9 @@ def create_information_filtering():
                 y = (i - 3.5) * 0.3
                 z = (j - 3.5) * 0.3
                 
-                bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-                filter_cell = bpy.context.object
+                filter_cell = add_cube(location=(x, y, z))
                 filter_cell.scale = (0.1, 0.15, 0.15)
-                filter_cell.data.materials.append(get_neon_material(f"Filter{i}{j}", NEON['white'], 5))
+                set_neon_emission(filter_cell, NEON['white'], 5)
     
     # Filtered output (right side)
     important_data = ["Pattern", "Signal", "Insight", "Connection"]
@@ -589,12 +557,11 @@ def create_information_filtering():
         y = (i - 1.5) * 1
         z = 0
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        signal = bpy.context.object
+        signal = add_ico_sphere(location=(x, y, z))
         signal.scale = (0.3, 0.3, 0.3)
         
         color = list(NEON.values())[i + 2]
-        signal.data.materials.append(get_neon_material(data, color, 12))
+        set_neon_emission(signal, color, 12)
 
 def create_association_network():
     clear_scene()
@@ -616,10 +583,9 @@ def create_association_network():
     
     nodes = []
     for name, pos, color in concepts:
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos)
         node.scale = (0.3, 0.3, 0.3) if name == "Code" else (0.25, 0.25, 0.25)
-        node.data.materials.append(get_neon_material(name, color, 10))
+        set_neon_emission(node, color, 10)
         nodes.append((node, pos))
     
     # Create associations
@@ -637,8 +603,7 @@ def create_association_network():
         
         length = math.sqrt(sum((e - s)**2 for s, e in zip(start, end)))
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.02, 0.02, length / 2)
         
         # Calculate rotation
@@ -651,7 +616,7 @@ def create_association_network():
             angle_y = math.atan2(dz, math.sqrt(dx**2 + dy**2))
             edge.rotation_euler = (1.57 + angle_y, 0, angle_z)
         
-        edge.data.materials.append(get_neon_material(f"Assoc{i}{j}", NEON['white'], 3))
+        set_neon_emission(edge, NEON['white'], 3)
 
 # TOOLS CATEGORY
 def create_file_system_tree():
@@ -660,18 +625,16 @@ def create_file_system_tree():
     add_centered_camera()
     
     def add_folder(pos, size, color, name):
-        bpy.ops.mesh.primitive_cube_add(location=pos)
-        folder = bpy.context.object
+        folder = add_cube(location=pos)
         folder.scale = (size * 1.2, size, size * 0.8)
-        folder.data.materials.append(get_neon_material(name, color, 8))
+        set_neon_emission(folder, color, 8)
         return folder
     
     def add_file(pos, size, color, name):
-        bpy.ops.mesh.primitive_cylinder_add(location=pos)
-        file = bpy.context.object
+        file = add_cylinder(location=pos)
         file.scale = (size * 0.8, size * 0.8, size * 1.2)
         file.rotation_euler = (1.57, 0, 0)
-        file.data.materials.append(get_neon_material(name, color, 6))
+        set_neon_emission(file, color, 6)
         return file
     
     # Root directory
@@ -689,11 +652,10 @@ def create_file_system_tree():
         
         # Connect to root
         mid = [(0 + pos[0])/2, 0, (2 + pos[2])/2]
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.02, 0.02, 0.75)
         edge.rotation_euler = (0.3 if pos[0] < 0 else -0.3 if pos[0] > 0 else 0, 0, 0)
-        edge.data.materials.append(get_neon_material(f"Edge_{name}", NEON['white'], 2))
+        set_neon_emission(edge, NEON['white'], 2)
         
         # Add files in each directory
         for i in range(3):
@@ -710,10 +672,9 @@ def create_api_orchestration():
     add_centered_camera()
     
     # Central orchestrator
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    orchestrator = bpy.context.object
+    orchestrator = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     orchestrator.scale = (0.6, 0.6, 0.6)
-    orchestrator.data.materials.append(get_neon_material("Orchestrator", NEON['white'], 15))
+    set_neon_emission(orchestrator, NEON['white'], 15)
     
     # API endpoints in a circle
     apis = [
@@ -732,10 +693,9 @@ def create_api_orchestration():
         z = 0
         
         # API node
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        api_node = bpy.context.object
+        api_node = add_cube(location=(x, y, z))
         api_node.scale = (0.4, 0.4, 0.4)
-        api_node.data.materials.append(get_neon_material(api, color, 10))
+        set_neon_emission(api_node, color, 10)
         
         # Pulsing connection
         segments = 5
@@ -744,10 +704,9 @@ def create_api_orchestration():
             seg_y = y * (j + 1) / (segments + 1)
             seg_z = math.sin(j * 0.5) * 0.2
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(seg_x, seg_y, seg_z))
-            pulse = bpy.context.object
+            pulse = add_ico_sphere(location=(seg_x, seg_y, seg_z))
             pulse.scale = (0.08, 0.08, 0.08)
-            pulse.data.materials.append(get_neon_material(f"Pulse_{api}_{j}", color, 6 + j))
+            set_neon_emission(pulse, color, 6 + j)
 
 def create_tool_pipeline():
     clear_scene()
@@ -769,11 +728,10 @@ def create_tool_pipeline():
         z = 0
         
         # Stage container
-        bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
-        container = bpy.context.object
+        container = add_cylinder(location=(x, y, z))
         container.scale = (0.5, 0.5, 0.3)
         container.rotation_euler = (0, 1.57, 0)
-        container.data.materials.append(get_neon_material(stage, color, 8))
+        set_neon_emission(container, color, 8)
         
         # Data flow particles
         if i < len(stages) - 1:
@@ -782,10 +740,9 @@ def create_tool_pipeline():
                 flow_y = 0
                 flow_z = (j - 1) * 0.2
                 
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(flow_x, flow_y, flow_z))
-                particle = bpy.context.object
+                particle = add_ico_sphere(location=(flow_x, flow_y, flow_z))
                 particle.scale = (0.08, 0.08, 0.08)
-                particle.data.materials.append(get_neon_material(f"Flow_{stage}_{j}", NEON['white'], 10))
+                set_neon_emission(particle, NEON['white'], 10)
 
 def create_error_cascade():
     clear_scene()
@@ -793,10 +750,9 @@ def create_error_cascade():
     add_centered_camera()
     
     # Initial error source
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 2.5))
-    source = bpy.context.object
+    source = add_ico_sphere(location=(0, 0, 2.5))
     source.scale = (0.3, 0.3, 0.3)
-    source.data.materials.append(get_neon_material("ErrorSource", NEON['red'], 15))
+    set_neon_emission(source, NEON['red'], 15)
     
     # Cascading error propagation
     levels = 4
@@ -810,13 +766,12 @@ def create_error_cascade():
             y = math.sin(angle) * radius
             z = 2.5 - level * 0.8
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            error = bpy.context.object
+            error = add_cube(location=(x, y, z))
             error.scale = (0.2, 0.2, 0.2)
             
             # Errors get dimmer as they cascade
             intensity = 12 - level * 2
-            error.data.materials.append(get_neon_material(f"Error_L{level}_{i}", NEON['red'], intensity))
+            set_neon_emission(error, NEON['red'], intensity)
             
             # Error propagation lines
             if level == 1:
@@ -833,10 +788,9 @@ def create_error_cascade():
             
             mid = [(s + x) / 2 for s, x in zip(start, (x, y, z))]
             
-            bpy.ops.mesh.primitive_cylinder_add(location=mid)
-            line = bpy.context.object
+            line = add_cylinder(location=mid)
             line.scale = (0.01, 0.01, 0.6)
-            line.data.materials.append(get_neon_material(f"Cascade_{level}_{i}", NEON['orange'], 5))
+            set_neon_emission(line, NEON['orange'], 5)
 
 def create_bash_execution():
     clear_scene()
@@ -855,11 +809,10 @@ def create_bash_execution():
         mid = [(s + e) / 2 for s, e in zip(start, end)]
         length = 6 if i % 2 == 0 else 4
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.05, 0.05, length / 2)
         edge.rotation_euler = (0, 1.57 if i % 2 == 0 else 0, 0)
-        edge.data.materials.append(get_neon_material(f"Frame{i}", NEON['green'], 8))
+        set_neon_emission(edge, NEON['green'], 8)
     
     # Command lines
     commands = [
@@ -873,17 +826,15 @@ def create_bash_execution():
         # Command prompt
         x_start = -2.5
         for j, char in enumerate("$ "):
-            bpy.ops.mesh.primitive_cube_add(location=(x_start + j * 0.2, y, 0))
-            prompt = bpy.context.object
+            prompt = add_cube(location=(x_start + j * 0.2, y, 0))
             prompt.scale = (0.08, 0.08, 0.08)
-            prompt.data.materials.append(get_neon_material(f"Prompt_{y}_{j}", NEON['white'], 10))
+            set_neon_emission(prompt, NEON['white'], 10)
         
         # Command text
         for j in range(8):
-            bpy.ops.mesh.primitive_cube_add(location=(-1.5 + j * 0.3, y, 0))
-            char = bpy.context.object
+            char = add_cube(location=(-1.5 + j * 0.3, y, 0))
             char.scale = (0.1, 0.08, 0.08)
-            char.data.materials.append(get_neon_material(f"Cmd_{y}_{j}", color, 6))
+            set_neon_emission(char, color, 6)
 
 # LANGUAGE CATEGORY
 def create_tokenization_grid():
@@ -903,8 +854,7 @@ def create_tokenization_grid():
         y = (row - 2) * 0.6
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        token = bpy.context.object
+        token = add_cube(location=(x, y, z))
         token.scale = (0.25, 0.25, 0.25)
         
         # Different token types get different colors
@@ -919,7 +869,7 @@ def create_tokenization_grid():
             color = colors[i % len(colors)]
             intensity = 8
         
-        token.data.materials.append(get_neon_material(f"Token_{i}", color, intensity))
+        set_neon_emission(token, color, intensity)
 
 def create_semantic_space():
     clear_scene()
@@ -937,10 +887,9 @@ def create_semantic_space():
     
     for cluster_name, center, color, words in clusters:
         # Central concept
-        bpy.ops.mesh.primitive_ico_sphere_add(location=center, subdivisions=3)
-        central = bpy.context.object
+        central = add_ico_sphere(location=center, subdivisions=3)
         central.scale = (0.5, 0.5, 0.5)
-        central.data.materials.append(get_neon_material(cluster_name, color, 12))
+        set_neon_emission(central, color, 12)
         
         # Related words
         for i, word in enumerate(words):
@@ -949,17 +898,15 @@ def create_semantic_space():
             y = center[1] + math.sin(angle) * 1
             z = center[2] + random.uniform(-0.3, 0.3)
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            related = bpy.context.object
+            related = add_cube(location=(x, y, z))
             related.scale = (0.2, 0.2, 0.2)
-            related.data.materials.append(get_neon_material(word, color, 6))
+            set_neon_emission(related, color, 6)
             
             # Semantic connection
             mid = [(center[j] + loc) / 2 for j, loc in enumerate((x, y, z))]
-            bpy.ops.mesh.primitive_cylinder_add(location=mid)
-            link = bpy.context.object
+            link = add_cylinder(location=mid)
             link.scale = (0.01, 0.01, 0.5)
-            link.data.materials.append(get_neon_material(f"Link_{word}", color, 2))
+            set_neon_emission(link, color, 2)
 
 def create_multilingual_network():
     clear_scene()
@@ -978,10 +925,9 @@ def create_multilingual_network():
     
     nodes = []
     for lang, pos, color in languages:
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=2)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos, subdivisions=2)
         node.scale = (0.4, 0.4, 0.4) if lang == "English" else (0.3, 0.3, 0.3)
-        node.data.materials.append(get_neon_material(lang, color, 10))
+        set_neon_emission(node, color, 10)
         nodes.append((node, pos))
     
     # Inter-language connections
@@ -996,8 +942,7 @@ def create_multilingual_network():
         end = languages[j][1]
         mid = [(s + e) / 2 for s, e in zip(start, end)]
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        bridge = bpy.context.object
+        bridge = add_cylinder(location=mid)
         
         length = math.sqrt(sum((e - s)**2 for s, e in zip(start, end)))
         bridge.scale = (0.02, 0.02, length / 2)
@@ -1012,7 +957,7 @@ def create_multilingual_network():
             angle_y = math.atan2(dz, math.sqrt(dx**2 + dy**2))
             bridge.rotation_euler = (1.57 + angle_y, 0, angle_z)
         
-        bridge.data.materials.append(get_neon_material(f"Bridge_{i}_{j}", NEON['white'], 3))
+        set_neon_emission(bridge, NEON['white'], 3)
 
 def create_text_generation_flow():
     clear_scene()
@@ -1027,8 +972,7 @@ def create_text_generation_flow():
         y = math.sin(t * 2) * 1.5
         z = math.cos(t) * 0.5
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        token = bpy.context.object
+        token = add_ico_sphere(location=(x, y, z))
         
         # Tokens get larger and brighter as they generate
         scale = 0.1 + (i / tokens) * 0.2
@@ -1043,7 +987,7 @@ def create_text_generation_flow():
             color = NEON['yellow']
         
         intensity = 3 + (i / tokens) * 10
-        token.data.materials.append(get_neon_material(f"GenToken{i}", color, intensity))
+        set_neon_emission(token, color, intensity)
 
 def create_grammar_structure():
     clear_scene()
@@ -1052,10 +996,9 @@ def create_grammar_structure():
     
     # Grammar tree structure
     def add_grammar_node(pos, size, color, label):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=2)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos, subdivisions=2)
         node.scale = (size, size, size)
-        node.data.materials.append(get_neon_material(label, color, 10))
+        set_neon_emission(node, color, 10)
         return node
     
     # Sentence root
@@ -1089,10 +1032,9 @@ def create_grammar_structure():
     for start, end in connections:
         mid = [(s + e) / 2 for s, e in zip(start, end)]
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.02, 0.02, 0.8)
-        edge.data.materials.append(get_neon_material(f"GrammarEdge", NEON['white'], 3))
+        set_neon_emission(edge, NEON['white'], 3)
 
 # PROBLEM SOLVING CATEGORY
 def create_task_decomposition():
@@ -1101,27 +1043,24 @@ def create_task_decomposition():
     add_centered_camera()
     
     # Main task at top
-    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 2.5))
-    main_task = bpy.context.object
+    main_task = add_cube(location=(0, 0, 2.5))
     main_task.scale = (0.8, 0.3, 0.3)
-    main_task.data.materials.append(get_neon_material("MainTask", NEON['white'], 15))
+    set_neon_emission(main_task, NEON['white'], 15)
     
     # Subtasks
     subtask_positions = [(-2, 0, 1), (0, 0, 1), (2, 0, 1)]
     subtask_colors = [NEON['cyan'], NEON['magenta'], NEON['yellow']]
     
     for i, (pos, color) in enumerate(zip(subtask_positions, subtask_colors)):
-        bpy.ops.mesh.primitive_cube_add(location=pos)
-        subtask = bpy.context.object
+        subtask = add_cube(location=pos)
         subtask.scale = (0.5, 0.25, 0.25)
-        subtask.data.materials.append(get_neon_material(f"Subtask{i}", color, 10))
+        set_neon_emission(subtask, color, 10)
         
         # Connect to main
         mid = [(0 + pos[0])/2, 0, (2.5 + pos[2])/2]
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        connector = bpy.context.object
+        connector = add_cylinder(location=mid)
         connector.scale = (0.02, 0.02, 0.75)
-        connector.data.materials.append(get_neon_material(f"Connect{i}", NEON['white'], 3))
+        set_neon_emission(connector, NEON['white'], 3)
         
         # Micro-tasks
         for j in range(3):
@@ -1129,10 +1068,9 @@ def create_task_decomposition():
             micro_y = 0
             micro_z = -0.5
             
-            bpy.ops.mesh.primitive_cube_add(location=(micro_x, micro_y, micro_z))
-            micro = bpy.context.object
+            micro = add_cube(location=(micro_x, micro_y, micro_z))
             micro.scale = (0.15, 0.15, 0.15)
-            micro.data.materials.append(get_neon_material(f"Micro{i}{j}", color, 6))
+            set_neon_emission(micro, color, 6)
 
 def create_solution_search():
     clear_scene()
@@ -1143,10 +1081,9 @@ def create_solution_search():
     random.seed(42)
     
     # Solution at center
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    solution = bpy.context.object
+    solution = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     solution.scale = (0.4, 0.4, 0.4)
-    solution.data.materials.append(get_neon_material("Solution", NEON['green'], 15))
+    set_neon_emission(solution, NEON['green'], 15)
     
     # Search nodes
     for i in range(30):
@@ -1158,8 +1095,7 @@ def create_solution_search():
         y = math.sin(angle) * distance
         z = height
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        node = bpy.context.object
+        node = add_ico_sphere(location=(x, y, z))
         node.scale = (0.15, 0.15, 0.15)
         
         # Explored nodes (closer) are brighter
@@ -1170,14 +1106,13 @@ def create_solution_search():
             color = NEON['blue']
             intensity = 3
         
-        node.data.materials.append(get_neon_material(f"Search{i}", color, intensity))
+        set_neon_emission(node, color, intensity)
         
         # Path connections for explored nodes
         if distance < 1.5:
-            bpy.ops.mesh.primitive_cylinder_add(location=(x/2, y/2, z/2))
-            path = bpy.context.object
+            path = add_cylinder(location=(x/2, y/2, z/2))
             path.scale = (0.01, 0.01, distance/2)
-            path.data.materials.append(get_neon_material(f"Path{i}", NEON['white'], 2))
+            set_neon_emission(path, NEON['white'], 2)
 
 def create_optimization_landscape():
     clear_scene()
@@ -1194,8 +1129,7 @@ def create_optimization_landscape():
             # Height function (multiple optima)
             height = (math.sin(x * 1.5) * math.cos(y * 1.5) + 1) * 1.5
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, y, height/2))
-            bar = bpy.context.object
+            bar = add_cylinder(location=(x, y, height/2))
             bar.scale = (0.15, 0.15, height/2)
             
             # Color by height
@@ -1209,7 +1143,7 @@ def create_optimization_landscape():
                 color = NEON['red']
                 intensity = 4
             
-            bar.data.materials.append(get_neon_material(f"Opt{i}{j}", color, intensity))
+            set_neon_emission(bar, color, intensity)
 
 def create_decision_tree():
     clear_scene()
@@ -1229,15 +1163,14 @@ def create_decision_tree():
             y = 0
             z = 2 - level * 1.2
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            node = bpy.context.object
+            node = add_cube(location=(x, y, z))
             node.scale = (0.3 - level * 0.05, 0.3 - level * 0.05, 0.1)
             
             # Alternate colors by decision
             color = NEON['cyan'] if i % 2 == 0 else NEON['magenta']
             intensity = 10 - level * 2
             
-            node.data.materials.append(get_neon_material(f"Decision{level}{i}", color, intensity))
+            set_neon_emission(node, color, intensity)
             level_nodes.append((x, y, z))
         
         nodes_by_level.append(level_nodes)
@@ -1252,10 +1185,9 @@ def create_decision_tree():
                 mid_y = 0
                 mid_z = (z + parent_z) / 2
                 
-                bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, mid_y, mid_z))
-                edge = bpy.context.object
+                edge = add_cylinder(location=(mid_x, mid_y, mid_z))
                 edge.scale = (0.02, 0.02, 0.6)
-                edge.data.materials.append(get_neon_material(f"Branch{level}{i}", NEON['white'], 3))
+                set_neon_emission(edge, NEON['white'], 3)
 
 def create_constraint_graph():
     clear_scene()
@@ -1263,10 +1195,9 @@ def create_constraint_graph():
     add_centered_camera()
     
     # Central solution space
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    solution = bpy.context.object
+    solution = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     solution.scale = (0.4, 0.4, 0.4)
-    solution.data.materials.append(get_neon_material("SolutionSpace", NEON['white'], 10))
+    set_neon_emission(solution, NEON['white'], 10)
     
     # Constraints pulling from different directions
     constraints = [
@@ -1280,10 +1211,9 @@ def create_constraint_graph():
     
     for name, pos, color in constraints:
         # Constraint node
-        bpy.ops.mesh.primitive_cube_add(location=pos)
-        constraint = bpy.context.object
+        constraint = add_cube(location=pos)
         constraint.scale = (0.3, 0.3, 0.3)
-        constraint.data.materials.append(get_neon_material(name, color, 12))
+        set_neon_emission(constraint, color, 12)
         
         # Constraint force (pulling line)
         segments = 8
@@ -1292,10 +1222,9 @@ def create_constraint_graph():
             seg_y = pos[1] * (1 - (i + 1) / (segments + 1))
             seg_z = 0
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(seg_x, seg_y, seg_z))
-            force = bpy.context.object
+            force = add_ico_sphere(location=(seg_x, seg_y, seg_z))
             force.scale = (0.05, 0.05, 0.05)
-            force.data.materials.append(get_neon_material(f"Force_{name}_{i}", color, 6 - i * 0.5))
+            set_neon_emission(force, color, 6 - i * 0.5)
 
 # SYSTEM CATEGORY
 def create_process_threads():
@@ -1304,10 +1233,9 @@ def create_process_threads():
     add_centered_camera()
     
     # Main process cylinder
-    bpy.ops.mesh.primitive_cylinder_add(location=(0, 0, 0))
-    main_process = bpy.context.object
+    main_process = add_cylinder(location=(0, 0, 0), name="MainProcess")
     main_process.scale = (0.8, 0.8, 2)
-    main_process.data.materials.append(get_neon_material("MainProcess", NEON['white'], 8))
+    set_neon_emission(main_process, NEON['white'], 8)
     
     # Threads spiraling around main process
     threads = 6
@@ -1323,10 +1251,11 @@ def create_process_threads():
             y = math.sin(angle) * radius
             z = (i - 10) * 0.2
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            segment = bpy.context.object
+            segment = add_cube(location=(x, y, z), name=f"Thread{t}")
             segment.scale = (0.1, 0.1, 0.1)
-            segment.data.materials.append(get_neon_material(f"Thread{t}_{i}", color, 8))
+            # Tagged for animate_process_threads
+            segment["thread"] = t
+            set_neon_emission(segment, color, 8)
 
 def create_io_streams():
     clear_scene()
@@ -1334,10 +1263,9 @@ def create_io_streams():
     add_centered_camera()
     
     # Central processor
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    cpu = bpy.context.object
+    cpu = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     cpu.scale = (0.8, 0.8, 0.8)
-    cpu.data.materials.append(get_neon_material("CPU", NEON['white'], 12))
+    set_neon_emission(cpu, NEON['white'], 12)
     
     # Input stream (left)
     for i in range(10):
@@ -1345,10 +1273,9 @@ def create_io_streams():
         y = math.sin(i * 0.5) * 0.5
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        input_data = bpy.context.object
+        input_data = add_cube(location=(x, y, z))
         input_data.scale = (0.15, 0.15, 0.15)
-        input_data.data.materials.append(get_neon_material(f"Input{i}", NEON['cyan'], 6 + i * 0.5))
+        set_neon_emission(input_data, NEON['cyan'], 6 + i * 0.5)
     
     # Output stream (right)
     for i in range(10):
@@ -1356,10 +1283,9 @@ def create_io_streams():
         y = math.cos(i * 0.5) * 0.5
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        output_data = bpy.context.object
+        output_data = add_cube(location=(x, y, z))
         output_data.scale = (0.15, 0.15, 0.15)
-        output_data.data.materials.append(get_neon_material(f"Output{i}", NEON['magenta'], 10 - i * 0.5))
+        set_neon_emission(output_data, NEON['magenta'], 10 - i * 0.5)
 
 def create_network_packets():
     clear_scene()
@@ -1379,12 +1305,11 @@ def create_network_packets():
     ]
     
     for i, pos in enumerate(node_positions):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=2)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos, subdivisions=2)
         node.scale = (0.3, 0.3, 0.3) if i == 0 else (0.25, 0.25, 0.25)
         
         color = NEON['white'] if i == 0 else list(NEON.values())[(i-1) % len(NEON)]
-        node.data.materials.append(get_neon_material(f"Node{i}", color, 10))
+        set_neon_emission(node, color, 10)
         nodes.append(pos)
     
     # Network connections
@@ -1396,8 +1321,7 @@ def create_network_packets():
         end = node_positions[end_idx]
         mid = [(s + e) / 2 for s, e in zip(start, end)]
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        link = bpy.context.object
+        link = add_cylinder(location=mid)
         
         length = math.sqrt(sum((e - s)**2 for s, e in zip(start, end)))
         link.scale = (0.02, 0.02, length / 2)
@@ -1409,7 +1333,7 @@ def create_network_packets():
             angle = math.atan2(dy, dx)
             link.rotation_euler = (0, 0, angle)
         
-        link.data.materials.append(get_neon_material(f"Link{start_idx}{end_idx}", NEON['white'], 2))
+        set_neon_emission(link, NEON['white'], 2)
     
     # Packets traveling
     for i in range(15):
@@ -1424,12 +1348,11 @@ def create_network_packets():
         y = start[1] + (end[1] - start[1]) * t
         z = random.uniform(-0.2, 0.2)
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        packet = bpy.context.object
+        packet = add_ico_sphere(location=(x, y, z))
         packet.scale = (0.08, 0.08, 0.08)
         
         color = list(NEON.values())[i % len(NEON)]
-        packet.data.materials.append(get_neon_material(f"Packet{i}", color, 8))
+        set_neon_emission(packet, color, 8)
 
 def create_file_operations():
     clear_scene()
@@ -1452,19 +1375,17 @@ def create_file_operations():
             y = (i - 1.5) * 0.8
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            file_block = bpy.context.object
+            file_block = add_cube(location=(x, y, z))
             file_block.scale = (0.3, 0.3, 0.3)
-            file_block.data.materials.append(get_neon_material(f"File{i}{j}", NEON['white'], 3))
+            set_neon_emission(file_block, NEON['white'], 3)
             files.append((x, y, z))
     
     # Operation indicators
     for op_name, op_pos, op_color in operations:
         # Operation label
-        bpy.ops.mesh.primitive_cube_add(location=op_pos)
-        op_block = bpy.context.object
+        op_block = add_cube(location=op_pos)
         op_block.scale = (0.4, 0.15, 0.15)
-        op_block.data.materials.append(get_neon_material(op_name, op_color, 10))
+        set_neon_emission(op_block, op_color, 10)
         
         # Operation in action (arrow to random file)
         target_file = random.choice(files)
@@ -1474,10 +1395,9 @@ def create_file_operations():
         mid_y = (op_pos[1] + target_file[1]) / 2
         mid_z = 0
         
-        bpy.ops.mesh.primitive_cone_add(location=(mid_x - 0.5, mid_y, mid_z), rotation=(0, 0, -1.57))
-        arrow = bpy.context.object
+        arrow = add_cone(location=(mid_x - 0.5, mid_y, mid_z), rotation=(0, 0, -1.57))
         arrow.scale = (0.15, 0.15, 0.3)
-        arrow.data.materials.append(get_neon_material(f"OpArrow_{op_name}", op_color, 8))
+        set_neon_emission(arrow, op_color, 8)
 
 def create_system_calls():
     clear_scene()
@@ -1485,10 +1405,9 @@ def create_system_calls():
     add_centered_camera()
     
     # Kernel at center
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    kernel = bpy.context.object
+    kernel = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     kernel.scale = (0.8, 0.8, 0.8)
-    kernel.data.materials.append(get_neon_material("Kernel", NEON['purple'], 15))
+    set_neon_emission(kernel, NEON['purple'], 15)
     
     # System calls in orbit
     syscalls = [
@@ -1509,10 +1428,9 @@ def create_system_calls():
         z = 0
         
         # Syscall block
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        syscall = bpy.context.object
+        syscall = add_cube(location=(x, y, z))
         syscall.scale = (0.35, 0.2, 0.2)
-        syscall.data.materials.append(get_neon_material(call, color, 10))
+        set_neon_emission(syscall, color, 10)
         
         # Call trace to kernel
         segments = 6
@@ -1521,10 +1439,9 @@ def create_system_calls():
             trace_y = y * (1 - (j + 1) / (segments + 1))
             trace_z = 0
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(trace_x, trace_y, trace_z))
-            trace = bpy.context.object
+            trace = add_ico_sphere(location=(trace_x, trace_y, trace_z))
             trace.scale = (0.04, 0.04, 0.04)
-            trace.data.materials.append(get_neon_material(f"Trace_{call}_{j}", color, 5 + j))
+            set_neon_emission(trace, color, 5 + j)
 
 # CONSCIOUSNESS CATEGORY
 def create_self_awareness_loop():
@@ -1542,8 +1459,7 @@ def create_self_awareness_loop():
         y = math.sin(t) * radius
         z = (i - loops/2) * 0.08
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        segment = bpy.context.object
+        segment = add_cube(location=(x, y, z))
         segment.scale = (0.2, 0.2, 0.2)
         
         # Color cycles through spectrum
@@ -1551,13 +1467,12 @@ def create_self_awareness_loop():
         color = list(NEON.values())[color_idx % len(NEON)]
         intensity = 5 + abs(math.sin(t)) * 8
         
-        segment.data.materials.append(get_neon_material(f"Aware{i}", color, intensity))
+        set_neon_emission(segment, color, intensity)
     
     # Central self
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    self_core = bpy.context.object
+    self_core = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     self_core.scale = (0.6, 0.6, 0.6)
-    self_core.data.materials.append(get_neon_material("Self", NEON['white'], 15))
+    set_neon_emission(self_core, NEON['white'], 15)
 
 def create_meta_cognition():
     clear_scene()
@@ -1577,13 +1492,12 @@ def create_meta_cognition():
             y = math.sin(angle) * radius
             z = height
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            thought = bpy.context.object
+            thought = add_ico_sphere(location=(x, y, z))
             thought.scale = (0.3 - layer * 0.04, 0.3 - layer * 0.04, 0.3 - layer * 0.04)
             
             color = list(NEON.values())[layer % len(NEON)]
             intensity = 6 + layer * 2
-            thought.data.materials.append(get_neon_material(f"Meta{layer}_{i}", color, intensity))
+            set_neon_emission(thought, color, intensity)
             
             # Connect to layer below
             if layer > 0:
@@ -1595,10 +1509,9 @@ def create_meta_cognition():
                 
                 mid = [(x + prev_x)/2, (y + prev_y)/2, (z + prev_z)/2]
                 
-                bpy.ops.mesh.primitive_cylinder_add(location=mid)
-                link = bpy.context.object
+                link = add_cylinder(location=mid)
                 link.scale = (0.01, 0.01, 0.3)
-                link.data.materials.append(get_neon_material(f"MetaLink{layer}_{i}", NEON['white'], 3))
+                set_neon_emission(link, NEON['white'], 3)
 
 def create_uncertainty_field():
     clear_scene()
@@ -1615,8 +1528,7 @@ def create_uncertainty_field():
         
         distance = math.sqrt(x**2 + y**2 + z**2)
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        particle = bpy.context.object
+        particle = add_ico_sphere(location=(x, y, z))
         
         # Size based on certainty
         scale = 0.05 + (3 - distance) * 0.05
@@ -1633,7 +1545,7 @@ def create_uncertainty_field():
             color = NEON['red']
             intensity = 3
         
-        particle.data.materials.append(get_neon_material(f"Uncertain{i}", color, intensity))
+        set_neon_emission(particle, color, intensity)
 
 def create_confidence_levels():
     clear_scene()
@@ -1648,14 +1560,12 @@ def create_confidence_levels():
         height = confidence * 3
         
         # Base
-        bpy.ops.mesh.primitive_cube_add(location=(x, 0, 0))
-        base = bpy.context.object
+        base = add_cube(location=(x, 0, 0))
         base.scale = (0.3, 0.3, 0.05)
-        base.data.materials.append(get_neon_material(f"Base{i}", NEON['white'], 2))
+        set_neon_emission(base, NEON['white'], 2)
         
         # Confidence bar
-        bpy.ops.mesh.primitive_cylinder_add(location=(x, 0, height/2))
-        bar = bpy.context.object
+        bar = add_cylinder(location=(x, 0, height/2))
         bar.scale = (0.2, 0.2, height/2)
         
         # Color by confidence level
@@ -1669,13 +1579,12 @@ def create_confidence_levels():
             color = NEON['red']
             intensity = 5
         
-        bar.data.materials.append(get_neon_material(f"Confidence{i}", color, intensity))
+        set_neon_emission(bar, color, intensity)
         
         # Percentage indicator
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, 0, height + 0.3))
-        indicator = bpy.context.object
+        indicator = add_ico_sphere(location=(x, 0, height + 0.3))
         indicator.scale = (0.15, 0.15, 0.15)
-        indicator.data.materials.append(get_neon_material(f"Indicator{i}", color, intensity + 3))
+        set_neon_emission(indicator, color, intensity + 3)
 
 def create_introspection_spiral():
     clear_scene()
@@ -1692,8 +1601,7 @@ def create_introspection_spiral():
         y = math.sin(t) * radius
         z = (i / points) * 2 - 1
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        element = bpy.context.object
+        element = add_cube(location=(x, y, z))
         element.scale = (0.15, 0.15, 0.15)
         
         # Gradient from external to internal
@@ -1706,13 +1614,12 @@ def create_introspection_spiral():
             color = NEON['yellow']
         
         intensity = 4 + color_progress * 10
-        element.data.materials.append(get_neon_material(f"Introspect{i}", color, intensity))
+        set_neon_emission(element, color, intensity)
     
     # Core insight
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 1), subdivisions=3)
-    insight = bpy.context.object
+    insight = add_ico_sphere(location=(0, 0, 1), subdivisions=3)
     insight.scale = (0.3, 0.3, 0.3)
-    insight.data.materials.append(get_neon_material("Insight", NEON['white'], 15))
+    set_neon_emission(insight, NEON['white'], 15)
 
 # INTERACTION CATEGORY
 def create_user_dialogue_flow():
@@ -1725,16 +1632,14 @@ def create_user_dialogue_flow():
     for i in range(user_messages):
         y = (i - 1.5) * 1
         
-        bpy.ops.mesh.primitive_cube_add(location=(-3, y, 0))
-        user_msg = bpy.context.object
+        user_msg = add_cube(location=(-3, y, 0))
         user_msg.scale = (0.6, 0.2, 0.2)
-        user_msg.data.materials.append(get_neon_material(f"User{i}", NEON['cyan'], 8))
+        set_neon_emission(user_msg, NEON['cyan'], 8)
     
     # Processing core
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    processor = bpy.context.object
+    processor = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     processor.scale = (0.8, 0.8, 0.8)
-    processor.data.materials.append(get_neon_material("Processor", NEON['white'], 12))
+    set_neon_emission(processor, NEON['white'], 12)
     
     # Internal processing nodes
     process_nodes = ["Parse", "Analyze", "Generate"]
@@ -1744,19 +1649,17 @@ def create_user_dialogue_flow():
         y = math.sin(angle) * 0.5
         z = 0
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        proc = bpy.context.object
+        proc = add_ico_sphere(location=(x, y, z))
         proc.scale = (0.2, 0.2, 0.2)
-        proc.data.materials.append(get_neon_material(node, NEON['purple'], 6))
+        set_neon_emission(proc, NEON['purple'], 6)
     
     # Claude responses (right)
     for i in range(user_messages):
         y = (i - 1.5) * 1
         
-        bpy.ops.mesh.primitive_cube_add(location=(3, y, 0))
-        response = bpy.context.object
+        response = add_cube(location=(3, y, 0))
         response.scale = (0.6, 0.2, 0.2)
-        response.data.materials.append(get_neon_material(f"Response{i}", NEON['green'], 8))
+        set_neon_emission(response, NEON['green'], 8)
     
     # Flow indicators
     for i in range(user_messages):
@@ -1767,20 +1670,18 @@ def create_user_dialogue_flow():
             flow_x = -3 + (j + 1) * 0.75
             flow_y = y * (1 - (j + 1) / 4)
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(flow_x, flow_y, 0))
-            flow1 = bpy.context.object
+            flow1 = add_ico_sphere(location=(flow_x, flow_y, 0))
             flow1.scale = (0.05, 0.05, 0.05)
-            flow1.data.materials.append(get_neon_material(f"Flow1_{i}_{j}", NEON['cyan'], 5))
+            set_neon_emission(flow1, NEON['cyan'], 5)
         
         # Processor to response
         for j in range(3):
             flow_x = (j + 1) * 0.75
             flow_y = y * (1 - (j + 1) / 4)
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(flow_x, flow_y, 0))
-            flow2 = bpy.context.object
+            flow2 = add_ico_sphere(location=(flow_x, flow_y, 0))
             flow2.scale = (0.05, 0.05, 0.05)
-            flow2.data.materials.append(get_neon_material(f"Flow2_{i}_{j}", NEON['green'], 5))
+            set_neon_emission(flow2, NEON['green'], 5)
 
 def create_response_generation():
     clear_scene()
@@ -1795,8 +1696,7 @@ def create_response_generation():
         y = 0
         z = math.sin(i * 0.3) * 0.5
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        token = bpy.context.object
+        token = add_ico_sphere(location=(x, y, z))
         
         # Scale increases with generation
         scale = 0.05 + (i / tokens) * 0.2
@@ -1813,18 +1713,17 @@ def create_response_generation():
             color = NEON['yellow']
             intensity = 12
         
-        token.data.materials.append(get_neon_material(f"GenToken{i}", color, intensity))
+        set_neon_emission(token, color, intensity)
         
         # Connecting flow
         if i > 0:
             prev_x = ((i-1) - tokens/2) * 0.3
             mid_x = (x + prev_x) / 2
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, 0, 0))
-            connector = bpy.context.object
+            connector = add_cylinder(location=(mid_x, 0, 0))
             connector.scale = (0.01, 0.01, 0.15)
             connector.rotation_euler = (0, 0, 1.57)
-            connector.data.materials.append(get_neon_material(f"Connect{i}", NEON['white'], 3))
+            set_neon_emission(connector, NEON['white'], 3)
 
 def create_context_understanding():
     clear_scene()
@@ -1848,19 +1747,17 @@ def create_context_understanding():
             y = math.sin(angle) * radius
             z = height
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            segment = bpy.context.object
+            segment = add_cube(location=(x, y, z))
             segment.scale = (0.15, 0.15, 0.1)
             
             # Brighter at connection points
             intensity = 8 if i % 5 == 0 else 5
-            segment.data.materials.append(get_neon_material(f"{name}{i}", color, intensity))
+            set_neon_emission(segment, color, intensity)
         
         # Center marker
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, height))
-        center = bpy.context.object
+        center = add_ico_sphere(location=(0, 0, height))
         center.scale = (0.2, 0.2, 0.2)
-        center.data.materials.append(get_neon_material(f"{name}Center", color, 10))
+        set_neon_emission(center, color, 10)
 
 def create_empathy_mapping():
     clear_scene()
@@ -1877,17 +1774,15 @@ def create_empathy_mapping():
     ]
     
     # Central understanding
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    core = bpy.context.object
+    core = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     core.scale = (0.5, 0.5, 0.5)
-    core.data.materials.append(get_neon_material("Understanding", NEON['white'], 12))
+    set_neon_emission(core, NEON['white'], 12)
     
     for name, pos, color in dimensions:
         # Dimension node
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos)
-        dim = bpy.context.object
+        dim = add_ico_sphere(location=pos)
         dim.scale = (0.35, 0.35, 0.35)
-        dim.data.materials.append(get_neon_material(name, color, 10))
+        set_neon_emission(dim, color, 10)
         
         # Empathy connection
         segments = 8
@@ -1898,10 +1793,9 @@ def create_empathy_mapping():
                 pos[2] * (1 - (i + 1) / (segments + 1))
             ]
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=seg_pos)
-            pulse = bpy.context.object
+            pulse = add_ico_sphere(location=seg_pos)
             pulse.scale = (0.05, 0.05, 0.05)
-            pulse.data.materials.append(get_neon_material(f"Empathy_{name}_{i}", color, 6))
+            set_neon_emission(pulse, color, 6)
 
 def create_conversation_state():
     clear_scene()
@@ -1918,13 +1812,12 @@ def create_conversation_state():
         y = (1 if is_user else -1) * 0.8
         z = math.sin(i * 0.5) * 0.3
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        msg = bpy.context.object
+        msg = add_cube(location=(x, y, z))
         msg.scale = (0.3, 0.15, 0.15)
         
         color = NEON['cyan'] if is_user else NEON['green']
         intensity = 6 + abs(messages/2 - i) * 0.5  # Brighter in middle
-        msg.data.materials.append(get_neon_material(f"Msg{i}", color, intensity))
+        set_neon_emission(msg, color, intensity)
         
         # State transition
         if i < messages - 1:
@@ -1937,10 +1830,9 @@ def create_conversation_state():
                 arc_y = y + (next_y - y) * arc_t
                 arc_z = z + math.sin(arc_t * math.pi) * 0.2
                 
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(arc_x, arc_y, arc_z))
-                trans = bpy.context.object
+                trans = add_ico_sphere(location=(arc_x, arc_y, arc_z))
                 trans.scale = (0.04, 0.04, 0.04)
-                trans.data.materials.append(get_neon_material(f"Trans{i}_{j}", NEON['white'], 4))
+                set_neon_emission(trans, NEON['white'], 4)
 
 # Legacy visualizations (update to neon)
 def create_neural_network():
@@ -1960,13 +1852,12 @@ def create_neural_network():
             y = (i - num_nodes/2) * 0.8
             z = 0
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            node = bpy.context.object
+            node = add_ico_sphere(location=(x, y, z))
             node.scale = (0.3, 0.3, 0.3)
             
             color = list(NEON.values())[layer_idx % len(NEON)]
             intensity = 8 + random.uniform(-2, 2)
-            node.data.materials.append(get_neon_material(f"Neuron{layer_idx}_{i}", color, intensity))
+            set_neon_emission(node, color, intensity)
             layer_nodes.append((x, y, z))
         
         nodes_by_layer.append(layer_nodes)
@@ -1983,8 +1874,7 @@ def create_neural_network():
                     
                     mid = [(x0 + x1)/2, (y0 + y1)/2, (z0 + z1)/2]
                     
-                    bpy.ops.mesh.primitive_cylinder_add(location=mid)
-                    synapse = bpy.context.object
+                    synapse = add_cylinder(location=mid)
                     
                     length = math.sqrt((x1-x0)**2 + (y1-y0)**2)
                     synapse.scale = (0.01, 0.01, length/2)
@@ -1993,8 +1883,7 @@ def create_neural_network():
                     angle = math.atan2(y1-y0, x1-x0)
                     synapse.rotation_euler = (0, 0, angle)
                     
-                    synapse.data.materials.append(get_neon_material(f"Synapse{layer_idx}_{i}_{j}", 
-                                                                   NEON['white'], 2))
+                    set_neon_emission(synapse, NEON['white'], 2)
 
 def create_data_flow():
     clear_scene()
@@ -2013,18 +1902,16 @@ def create_data_flow():
                 py = (i - 3.5) * 0.3
                 pz = 0
                 
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(px, py, pz))
-                particle = bpy.context.object
+                particle = add_ico_sphere(location=(px, py, pz))
                 particle.scale = (0.08, 0.08, 0.08)
-                particle.data.materials.append(get_neon_material(f"Input{i}", NEON['cyan'], 4))
+                set_neon_emission(particle, NEON['cyan'], 4)
         
         # Processing node
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, 0, 0), subdivisions=3)
-        processor = bpy.context.object
+        processor = add_ico_sphere(location=(x, 0, 0), subdivisions=3)
         processor.scale = (0.5, 0.5, 0.5)
         
         color = list(NEON.values())[stage % len(NEON)]
-        processor.data.materials.append(get_neon_material(f"Process{stage}", color, 10))
+        set_neon_emission(processor, color, 10)
         
         # Data streams between stages
         if stage < stages - 1:
@@ -2033,10 +1920,9 @@ def create_data_flow():
                 stream_y = (i - 2) * 0.2
                 stream_z = 0
                 
-                bpy.ops.mesh.primitive_cube_add(location=(stream_x, stream_y, stream_z))
-                stream = bpy.context.object
+                stream = add_cube(location=(stream_x, stream_y, stream_z))
                 stream.scale = (0.2, 0.05, 0.05)
-                stream.data.materials.append(get_neon_material(f"Stream{stage}_{i}", color, 6))
+                set_neon_emission(stream, color, 6)
 
 def create_algorithm_crystal():
     clear_scene()
@@ -2064,12 +1950,11 @@ def create_algorithm_crystal():
     
     # Place glowing vertices
     for i, pos in enumerate(vertices):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos, subdivisions=2)
-        vertex = bpy.context.object
+        vertex = add_ico_sphere(location=pos, subdivisions=2)
         vertex.scale = (0.2, 0.2, 0.2)
         
         color = NEON['white'] if i in [0, 5] else list(NEON.values())[i % len(NEON)]
-        vertex.data.materials.append(get_neon_material(f"Vertex{i}", color, 12))
+        set_neon_emission(vertex, color, 12)
     
     # Create glowing edges
     for start_idx, end_idx in edges:
@@ -2079,8 +1964,7 @@ def create_algorithm_crystal():
         
         length = math.sqrt(sum((e - s)**2 for s, e in zip(start, end)))
         
-        bpy.ops.mesh.primitive_cylinder_add(location=mid)
-        edge = bpy.context.object
+        edge = add_cylinder(location=mid)
         edge.scale = (0.03, 0.03, length / 2)
         
         # Orient edge
@@ -2095,8 +1979,7 @@ def create_algorithm_crystal():
         else:
             edge.rotation_euler = (0, 0, 0)
         
-        edge.data.materials.append(get_neon_material(f"CrystalEdge{start_idx}{end_idx}", 
-                                                    NEON['cyan'], 6))
+        set_neon_emission(edge, NEON['cyan'], 6)
 
 def create_system_architecture():
     clear_scene()
@@ -2115,10 +1998,9 @@ def create_system_architecture():
     
     nodes = []
     for name, pos, color, size in components:
-        bpy.ops.mesh.primitive_cube_add(location=pos)
-        component = bpy.context.object
+        component = add_cube(location=pos)
         component.scale = (size, size, size)
-        component.data.materials.append(get_neon_material(name, color, 10))
+        set_neon_emission(component, color, 10)
         nodes.append(pos)
     
     # System connections
@@ -2140,11 +2022,9 @@ def create_system_architecture():
             pulse_y = start[1] + (end[1] - start[1]) * t
             pulse_z = start[2] + (end[2] - start[2]) * t
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(pulse_x, pulse_y, pulse_z))
-            pulse = bpy.context.object
+            pulse = add_ico_sphere(location=(pulse_x, pulse_y, pulse_z))
             pulse.scale = (0.06, 0.06, 0.06)
-            pulse.data.materials.append(get_neon_material(f"Pulse{start_idx}{end_idx}_{i}", 
-                                                        NEON['white'], 4 + i * 2))
+            set_neon_emission(pulse, NEON['white'], 4 + i * 2)
 
 def create_code_universe():
     clear_scene()
@@ -2155,10 +2035,9 @@ def create_code_universe():
     random.seed(42)
     
     # Central code star
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0), subdivisions=3)
-    star = bpy.context.object
+    star = add_ico_sphere(location=(0, 0, 0), subdivisions=3)
     star.scale = (0.8, 0.8, 0.8)
-    star.data.materials.append(get_neon_material("CodeStar", NEON['yellow'], 15))
+    set_neon_emission(star, NEON['yellow'], 15)
     
     # Orbiting code planets
     planets = [
@@ -2174,10 +2053,9 @@ def create_code_universe():
         y = math.sin(angle) * radius
         z = z_offset
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), subdivisions=2)
-        planet = bpy.context.object
+        planet = add_ico_sphere(location=(x, y, z), subdivisions=2)
         planet.scale = (0.3, 0.3, 0.3)
-        planet.data.materials.append(get_neon_material(name, color, 8))
+        set_neon_emission(planet, color, 8)
         
         # Code moons
         for i in range(3):
@@ -2188,10 +2066,9 @@ def create_code_universe():
             moon_y = y + math.sin(moon_angle) * moon_radius
             moon_z = z + random.uniform(-0.1, 0.1)
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(moon_x, moon_y, moon_z))
-            moon = bpy.context.object
+            moon = add_ico_sphere(location=(moon_x, moon_y, moon_z))
             moon.scale = (0.1, 0.1, 0.1)
-            moon.data.materials.append(get_neon_material(f"Moon_{name}_{i}", color, 5))
+            set_neon_emission(moon, color, 5)
     
     # Code stars in background
     for i in range(50):
@@ -2199,99 +2076,226 @@ def create_code_universe():
         star_y = random.uniform(-4, 4)
         star_z = random.uniform(-2, 2)
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(star_x, star_y, star_z))
-        bg_star = bpy.context.object
+        bg_star = add_ico_sphere(location=(star_x, star_y, star_z))
         bg_star.scale = (0.02, 0.02, 0.02)
         
         color = random.choice(list(NEON.values()))
         intensity = random.uniform(3, 6)
-        bg_star.data.materials.append(get_neon_material(f"Star{i}", color, intensity))
+        set_neon_emission(bg_star, color, intensity)
 
 # Generate all visualizations
-def generate_all_neon():
-    visualizations = [
-        # Thinking
-        ("thinking/token_stream.png", create_token_stream),
-        ("thinking/attention_matrix.png", create_attention_matrix),
-        ("thinking/context_window.png", create_context_window),
-        ("thinking/thought_chains.png", create_thought_chains),
-        ("thinking/parallel_reasoning.png", create_parallel_reasoning),
-        
-        # Code
-        ("code/syntax_tree.png", create_syntax_tree),
-        ("code/code_flow.png", create_code_flow),
-        ("code/bug_detection.png", create_bug_detection),
-        ("code/pattern_matching.png", create_pattern_matching),
-        ("code/refactoring_paths.png", create_refactoring_paths),
-        
-        # Memory
-        ("memory/knowledge_graph.png", create_knowledge_graph),
-        ("memory/memory_retrieval.png", create_memory_retrieval),
-        ("memory/context_switching.png", create_context_switching),
-        ("memory/information_filtering.png", create_information_filtering),
-        ("memory/association_network.png", create_association_network),
-        
-        # Tools
-        ("tools/file_system_tree.png", create_file_system_tree),
-        ("tools/api_orchestration.png", create_api_orchestration),
-        ("tools/tool_pipeline.png", create_tool_pipeline),
-        ("tools/error_cascade.png", create_error_cascade),
-        ("tools/bash_execution.png", create_bash_execution),
-        
-        # Language
-        ("language/tokenization_grid.png", create_tokenization_grid),
-        ("language/semantic_space.png", create_semantic_space),
-        ("language/multilingual_network.png", create_multilingual_network),
-        ("language/text_generation_flow.png", create_text_generation_flow),
-        ("language/grammar_structure.png", create_grammar_structure),
-        
-        # Problem Solving
-        ("problem_solving/task_decomposition.png", create_task_decomposition),
-        ("problem_solving/solution_search.png", create_solution_search),
-        ("problem_solving/optimization_landscape.png", create_optimization_landscape),
-        ("problem_solving/decision_tree.png", create_decision_tree),
-        ("problem_solving/constraint_graph.png", create_constraint_graph),
-        
-        # System
-        ("system/process_threads.png", create_process_threads),
-        ("system/io_streams.png", create_io_streams),
-        ("system/network_packets.png", create_network_packets),
-        ("system/file_operations.png", create_file_operations),
-        ("system/system_calls.png", create_system_calls),
-        
-        # Consciousness
-        ("consciousness/self_awareness_loop.png", create_self_awareness_loop),
-        ("consciousness/meta_cognition.png", create_meta_cognition),
-        ("consciousness/uncertainty_field.png", create_uncertainty_field),
-        ("consciousness/confidence_levels.png", create_confidence_levels),
-        ("consciousness/introspection_spiral.png", create_introspection_spiral),
-        
-        # Interaction
-        ("interaction/user_dialogue_flow.png", create_user_dialogue_flow),
-        ("interaction/response_generation.png", create_response_generation),
-        ("interaction/context_understanding.png", create_context_understanding),
-        ("interaction/empathy_mapping.png", create_empathy_mapping),
-        ("interaction/conversation_state.png", create_conversation_state),
-        
-        # Legacy
-        ("neural_network.png", create_neural_network),
-        ("data_flow.png", create_data_flow),
-        ("algorithm_crystal.png", create_algorithm_crystal),
-        ("system_architecture.png", create_system_architecture),
-        ("code_universe.png", create_code_universe)
-    ]
-    
-    base_path = "/home/franz/dev/claude-vision-gallery/public/"
-    
-    for filepath, func in visualizations:
-        full_path = base_path + filepath
+VISUALIZATIONS = [
+    # Thinking
+    ("thinking/token_stream.png", create_token_stream),
+    ("thinking/attention_matrix.png", create_attention_matrix),
+    ("thinking/context_window.png", create_context_window),
+    ("thinking/thought_chains.png", create_thought_chains),
+    ("thinking/parallel_reasoning.png", create_parallel_reasoning),
+    
+    # Code
+    ("code/syntax_tree.png", create_syntax_tree),
+    ("code/code_flow.png", create_code_flow),
+    ("code/bug_detection.png", create_bug_detection),
+    ("code/pattern_matching.png", create_pattern_matching),
+    ("code/refactoring_paths.png", create_refactoring_paths),
+    
+    # Memory
+    ("memory/knowledge_graph.png", create_knowledge_graph),
+    ("memory/memory_retrieval.png", create_memory_retrieval),
+    ("memory/context_switching.png", create_context_switching),
+    ("memory/information_filtering.png", create_information_filtering),
+    ("memory/association_network.png", create_association_network),
+    
+    # Tools
+    ("tools/file_system_tree.png", create_file_system_tree),
+    ("tools/api_orchestration.png", create_api_orchestration),
+    ("tools/tool_pipeline.png", create_tool_pipeline),
+    ("tools/error_cascade.png", create_error_cascade),
+    ("tools/bash_execution.png", create_bash_execution),
+    
+    # Language
+    ("language/tokenization_grid.png", create_tokenization_grid),
+    ("language/semantic_space.png", create_semantic_space),
+    ("language/multilingual_network.png", create_multilingual_network),
+    ("language/text_generation_flow.png", create_text_generation_flow),
+    ("language/grammar_structure.png", create_grammar_structure),
+    
+    # Problem Solving
+    ("problem_solving/task_decomposition.png", create_task_decomposition),
+    ("problem_solving/solution_search.png", create_solution_search),
+    ("problem_solving/optimization_landscape.png", create_optimization_landscape),
+    ("problem_solving/decision_tree.png", create_decision_tree),
+    ("problem_solving/constraint_graph.png", create_constraint_graph),
+    
+    # System
+    ("system/process_threads.png", create_process_threads),
+    ("system/io_streams.png", create_io_streams),
+    ("system/network_packets.png", create_network_packets),
+    ("system/file_operations.png", create_file_operations),
+    ("system/system_calls.png", create_system_calls),
+    
+    # Consciousness
+    ("consciousness/self_awareness_loop.png", create_self_awareness_loop),
+    ("consciousness/meta_cognition.png", create_meta_cognition),
+    ("consciousness/uncertainty_field.png", create_uncertainty_field),
+    ("consciousness/confidence_levels.png", create_confidence_levels),
+    ("consciousness/introspection_spiral.png", create_introspection_spiral),
+    
+    # Interaction
+    ("interaction/user_dialogue_flow.png", create_user_dialogue_flow),
+    ("interaction/response_generation.png", create_response_generation),
+    ("interaction/context_understanding.png", create_context_understanding),
+    ("interaction/empathy_mapping.png", create_empathy_mapping),
+    ("interaction/conversation_state.png", create_conversation_state),
+    
+    # Legacy
+    ("neural_network.png", create_neural_network),
+    ("data_flow.png", create_data_flow),
+    ("algorithm_crystal.png", create_algorithm_crystal),
+    ("system_architecture.png", create_system_architecture),
+    ("code_universe.png", create_code_universe)
+]
+
+def generate_all_neon(scenes=None, base_path=DEFAULT_OUTPUT_ROOT, force=False, base_seed=DEFAULT_BASE_SEED,
+                      preview=False):
+    """Render the selected scenes (all by default), return the failed ones
+    
+    Every scene is seeded from its own key and base_seed. Scenes whose
+    source, seed and render settings match the render cache are skipped
+    unless force is set. A preview pass also skips scenes whose final
+    render is current, rather than replacing it with a preview.
+    """
+    cache = RenderCache(default_index_path(base_path))
+    settings = render_settings(bpy.context.scene)
+    # A tile is not the scene's image: neither trust nor update the cache
+    tiling = current_tile() is not None
+    failed = []
+    for filepath, func in select_scenes(VISUALIZATIONS, scenes):
+        full_path = os.path.join(base_path, filepath)
+        seed = scene_seed(filepath, base_seed)
+        key = scene_key(func, seed=seed, settings=settings)
+        final_key = scene_key(func, seed=seed, settings=dict(
+            settings, quality='final', master_resolution=QUALITY_PRESETS['final']['master_resolution']))
+        if not force and not tiling and (cache.is_fresh(filepath, key, full_path)
+                          or preview and cache.is_fresh(filepath, final_key, full_path)):
+            print(f"Skipping {filepath} - unchanged since last render")
+            print(format_marker(SCENE_DONE, filepath, "0.00", "cached"), flush=True)
+            continue
+        
         print(f"Generating neon {filepath}...")
-        func()
-        render_image(full_path)
+        print(format_marker(SCENE_STARTED, filepath), flush=True)
+        start = time.time()
+        try:
+            seed_scene(filepath, base_seed)
+            func()
+            built = time.time()
+            objects = len(bpy.context.scene.objects)
+            render_image(full_path)
+        except Exception:
+            traceback.print_exc()
+            print(format_marker(SCENE_FAILED, filepath), flush=True)
+            failed.append(filepath)
+            continue
+        end = time.time()
+        if not tiling:
+            cache.record(filepath, key, full_path)
         print(f"Saved {filepath}")
-    
-    print("\nAll neon visualizations complete!")
+        print(format_marker(SCENE_DONE, filepath, f"{end - start:.2f}", f"build={built - start:.2f}",
+                            f"render={end - built:.2f}", f"objects={objects}"), flush=True)
+    
+    if failed:
+        print(f"\n{len(failed)} neon visualizations failed: {', '.join(failed)}")
+    else:
+        print("\nAll neon visualizations complete!")
+    return failed
+
+def probe_scenes(scenes=None, base_seed=DEFAULT_BASE_SEED):
+    """Build the selected scenes without rendering and list their object counts"""
+    for filepath, func in select_scenes(VISUALIZATIONS, scenes):
+        seed_scene(filepath, base_seed)
+        try:
+            func()
+        except Exception:
+            traceback.print_exc()
+            continue
+        print(format_marker(SCENE_LISTED, filepath, f"objects={len(bpy.context.scene.objects)}"), flush=True)
+        reset_scene(log=False)
+
+def animate_token_stream(scene, frames):
+    """Tokens flow three places down the stream per loop, wrapping off-screen"""
+    tokens = sorted((obj for obj in scene.objects if obj.type == 'MESH'), key=lambda obj: obj.location.x)
+    for i, token in enumerate(tokens):
+        # Three places keeps the cyan/magenta/yellow color order seamless
+        keyframe_path(token, frames, lambda phase, i=i: token_stream_point((i + 3 * phase) % TOKEN_STREAM_LENGTH))
+
+def animate_process_threads(scene, frames):
+    """The thread spirals turn once around the main process per loop"""
+    segments = [obj for obj in scene.objects if "thread" in obj]
+    spin(segments, frames, center=scene.objects["MainProcess"].location.copy(), name="Threads")
+
+# Scene motions for --animate motion; other scenes only have the turntable
+MOTIONS = {
+    "thinking/token_stream.png": animate_token_stream,
+    "system/process_threads.png": animate_process_threads,
+}
+
+def animate_scene(filepath, mode, frames, frame_range, frames_dir, base_seed=DEFAULT_BASE_SEED):
+    """Build one scene, animate it and render frame_range (start, end) into frames_dir"""
+    (_, func), = select_scenes(VISUALIZATIONS, [filepath])
+    if mode == 'motion' and filepath not in MOTIONS:
+        raise SystemExit(f"{filepath} has no motion, expected one of {', '.join(MOTIONS)} or --animate turntable")
+    seed_scene(filepath, base_seed)
+    func()
+    scene = bpy.context.scene
+    if mode == 'motion':
+        MOTIONS[filepath](scene, frames)
+    else:
+        turntable(scene, frames)
+    start, end = frame_range or (1, frames)
+    build_end = time.time()
+    render_frames(scene, frames_dir, start, end)
+    print(f"Rendered frames {start}-{end} of {filepath} in {time.time() - build_end:.2f}s", flush=True)
+
+def describe_scenes(scenes=None, output_dir=".", base_seed=DEFAULT_BASE_SEED):
+    """Build the selected scenes and write DIR/<scene>.json for the NumPy rasterizer"""
+    from scene_description import write_description
+
+    failed = []
+    for filepath, func in select_scenes(VISUALIZATIONS, scenes):
+        seed_scene(filepath, base_seed)
+        try:
+            func()
+            scene = bpy.context.scene
+            if 'fit' in current_framing():
+                frame_scene(scene, ('fit',))
+            path = os.path.join(output_dir, os.path.splitext(filepath)[0] + ".json")
+            description = write_description(path, scene)
+        except Exception:
+            traceback.print_exc()
+            failed.append(filepath)
+            continue
+        finally:
+            reset_scene(log=False)
+        print(f"Described {filepath}: {len(description['primitives'])} primitives -> {path}")
+    return failed
 
 # Run generation
 if __name__ == "__main__":
-    generate_all_neon()
\ No newline at end of file
+    args = scene_arg_parser("Render the neon visualizations").parse_args(blender_argv())
+    set_quality(args.quality)
+    set_framing(args.frame)
+    if args.list and args.probe:
+        probe_scenes(args.scenes, args.seed)
+    elif args.animate:
+        if len(args.scenes) != 1 or not args.frames_dir:
+            raise SystemExit("--animate renders exactly one scene into --frames-dir")
+        frame_range = tuple(int(frame) for frame in args.frame_range.split(',')) if args.frame_range else None
+        animate_scene(args.scenes[0], args.animate, args.frames, frame_range, args.frames_dir, args.seed)
+    elif args.describe:
+        if describe_scenes(args.scenes, args.describe, args.seed):
+            sys.exit(1)
+    elif args.list:
+        for filepath, _ in VISUALIZATIONS:
+            print(format_marker(SCENE_LISTED, filepath))
+    elif generate_all_neon(args.scenes, args.output, args.force, args.seed, args.preview):
+        sys.exit(1)
@@ -5,6 +5,13 @@ import random
 from PIL import Image
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import set_neon_emission
+from scene_builder import add_cone, add_cube, add_cylinder, add_ico_sphere, add_torus, add_uv_sphere, reset_scene
+from quality_presets import render_still
+from scene_seeds import seed_scene
 
 # Base path for images
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
@@ -35,8 +42,7 @@ def setup_scene():
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
     
     # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     """Add camera to scene"""
@@ -46,22 +52,6 @@ def add_camera(location=(0, -10, 0), rotation=(1.57, 0, 0)):
     bpy.context.scene.camera = camera
     return camera
 
-def create_neon_material(name, color, strength=3.0):
-    """Create vibrant neon emission material"""
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
-    
-    output = nodes.new('ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
-    
-    return mat
-
 def add_area_light(location=(0, 0, 5), energy=20, size=10):
     """Add area light for subtle glow"""
     bpy.ops.object.light_add(type='AREA', location=location)
@@ -79,7 +69,7 @@ def render_and_convert_to_white(output_path):
     # Render to temp file
     temp_path = output_path.replace('.png', '_temp.png')
     bpy.context.scene.render.filepath = temp_path
-    bpy.ops.render.render(write_still=True)
+    render_still(ladder=False)
     
     # Convert to white background
     img = Image.open(temp_path)
@@ -107,20 +97,18 @@ def create_token_stream():
         
         shape = i % 3
         if shape == 0:
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
+            obj = add_cube(location=(x, y, z))
         elif shape == 1:
-            bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, z), segments=16)
+            obj = add_uv_sphere(location=(x, y, z), segments=16)
         else:
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z), subdivisions=2)
+            obj = add_ico_sphere(location=(x, y, z), subdivisions=2)
         
-        obj = bpy.context.object
         scale = 0.2 + math.sin(t * 1.5) * 0.1
         obj.scale = (scale, scale, scale)
         obj.rotation_euler = (math.sin(t), t * 0.3, math.cos(t * 2))
         
         color = NEON_COLORS[i % len(NEON_COLORS)]
-        mat = create_neon_material(f"Token{i}", color)
-        obj.data.materials.append(mat)
+        set_neon_emission(obj, color, 3.0)
     
     render_and_convert_to_white(base_path + "thinking/token_stream.png")
 
@@ -139,8 +127,7 @@ def create_attention_matrix():
                 y = (j - grid_size/2) * 1
                 z = 0
                 
-                bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-                node = bpy.context.object
+                node = add_ico_sphere(location=(x, y, z))
                 node.scale = (weight * 0.3, weight * 0.3, weight * 0.3)
                 
                 if weight > 0.8:
@@ -150,8 +137,7 @@ def create_attention_matrix():
                 else:
                     color = NEON_COLORS[6]  # Purple
                 
-                mat = create_neon_material(f"Att{i}{j}", color, weight * 4)
-                node.data.materials.append(mat)
+                set_neon_emission(node, color, weight * 4)
     
     render_and_convert_to_white(base_path + "thinking/attention_matrix.png")
 
@@ -166,18 +152,14 @@ def create_context_window():
     colors = [NEON_COLORS[1], NEON_COLORS[6], NEON_COLORS[2], NEON_COLORS[4]]
     
     for size, color in zip(sizes, colors):
-        bpy.ops.mesh.primitive_torus_add(location=(0, 0, 0))
-        frame = bpy.context.object
+        frame = add_torus(location=(0, 0, 0))
         frame.scale = (size, size, 0.15)
-        mat = create_neon_material(f"Frame{size}", color)
-        frame.data.materials.append(mat)
+        set_neon_emission(frame, color, 3.0)
     
     # Center sphere
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0))
-    center = bpy.context.object
+    center = add_uv_sphere(location=(0, 0, 0))
     center.scale = (0.5, 0.5, 0.5)
-    mat = create_neon_material("Center", NEON_COLORS[0], 4)
-    center.data.materials.append(mat)
+    set_neon_emission(center, NEON_COLORS[0], 4)
     
     render_and_convert_to_white(base_path + "thinking/context_window.png")
 
@@ -188,11 +170,9 @@ def create_thought_chains():
     add_area_light()
     
     # Central hub
-    bpy.ops.mesh.primitive_ico_sphere_add(location=(0, 0, 0))
-    hub = bpy.context.object
+    hub = add_ico_sphere(location=(0, 0, 0))
     hub.scale = (0.6, 0.6, 0.6)
-    mat = create_neon_material("Hub", NEON_COLORS[4], 4)
-    hub.data.materials.append(mat)
+    set_neon_emission(hub, NEON_COLORS[4], 4)
     
     # Radiating chains
     for i in range(8):
@@ -205,12 +185,10 @@ def create_thought_chains():
             y = math.sin(angle) * dist
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            node = bpy.context.object
+            node = add_cube(location=(x, y, z))
             node.scale = (0.3 - j * 0.04, 0.3 - j * 0.04, 0.3 - j * 0.04)
             node.rotation_euler = (0, 0, angle)
-            mat = create_neon_material(f"Chain{i}{j}", color)
-            node.data.materials.append(mat)
+            set_neon_emission(node, color, 3.0)
     
     render_and_convert_to_white(base_path + "thinking/thought_chains.png")
 
@@ -229,12 +207,10 @@ def create_parallel_reasoning():
             y = y_offset + math.sin(i * 0.3 + stream) * 0.5
             z = math.cos(i * 0.2) * 0.3
             
-            bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
-            element = bpy.context.object
+            element = add_cylinder(location=(x, y, z))
             element.scale = (0.15, 0.15, 0.15)
             element.rotation_euler = (0, 0, i * 0.2)
-            mat = create_neon_material(f"Stream{stream}{i}", color)
-            element.data.materials.append(mat)
+            set_neon_emission(element, color, 3.0)
     
     render_and_convert_to_white(base_path + "thinking/parallel_reasoning.png")
 
@@ -246,11 +222,9 @@ def create_syntax_tree():
     add_area_light()
     
     def add_node(pos, size, color, name):
-        bpy.ops.mesh.primitive_ico_sphere_add(location=pos)
-        node = bpy.context.object
+        node = add_ico_sphere(location=pos)
         node.scale = (size, size, size)
-        mat = create_neon_material(name, color)
-        node.data.materials.append(mat)
+        set_neon_emission(node, color, 3.0)
         return node
     
     # Build tree structure
@@ -283,14 +257,12 @@ def create_code_flow():
         y = math.sin(t) * radius
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        flow = bpy.context.object
+        flow = add_cube(location=(x, y, z))
         flow.scale = (0.2, 0.2, 0.2)
         flow.rotation_euler = (0, 0, t)
         
         color = NEON_COLORS[i % len(NEON_COLORS)]
-        mat = create_neon_material(f"Flow{i}", color)
-        flow.data.materials.append(mat)
+        set_neon_emission(flow, color, 3.0)
     
     render_and_convert_to_white(base_path + "code/code_flow.png")
 
@@ -310,8 +282,7 @@ def create_bug_detection():
             
             is_bug = (i, j) in bugs
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            block = bpy.context.object
+            block = add_cube(location=(x, y, z))
             
             if is_bug:
                 block.scale = (0.4, 0.4, 0.4)
@@ -322,8 +293,7 @@ def create_bug_detection():
                 color = NEON_COLORS[5]  # Green for clean code
                 strength = 2
             
-            mat = create_neon_material(f"Block{i}{j}", color, strength)
-            block.data.materials.append(mat)
+            set_neon_emission(block, color, strength)
     
     render_and_convert_to_white(base_path + "code/bug_detection.png")
 
@@ -349,11 +319,9 @@ def create_pattern_matching():
             pos_x = base_x + x * 0.8
             pos_y = y * 0.8
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(pos_x, pos_y, 0))
-            element = bpy.context.object
+            element = add_ico_sphere(location=(pos_x, pos_y, 0))
             element.scale = (0.3, 0.3, 0.3)
-            mat = create_neon_material(f"Pattern{p_idx}{x}{y}", color)
-            element.data.materials.append(mat)
+            set_neon_emission(element, color, 3.0)
     
     render_and_convert_to_white(base_path + "code/pattern_matching.png")
 
@@ -369,12 +337,10 @@ def create_refactoring_paths():
         y = random.uniform(-2, 2)
         z = 0
         
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-        messy = bpy.context.object
+        messy = add_cube(location=(x, y, z))
         messy.scale = (0.15, 0.15, 0.15)
         messy.rotation_euler = (random.random(), random.random(), random.random())
-        mat = create_neon_material(f"Messy{i}", NEON_COLORS[0])  # Red
-        messy.data.materials.append(mat)
+        set_neon_emission(messy, NEON_COLORS[0], 3.0)  # Red
     
     # Clean code (right)
     for i in range(3):
@@ -383,18 +349,14 @@ def create_refactoring_paths():
             y = (j - 2) * 0.6
             z = 0
             
-            bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-            clean = bpy.context.object
+            clean = add_cube(location=(x, y, z))
             clean.scale = (0.2, 0.2, 0.2)
-            mat = create_neon_material(f"Clean{i}{j}", NEON_COLORS[5])  # Green
-            clean.data.materials.append(mat)
+            set_neon_emission(clean, NEON_COLORS[5], 3.0)  # Green
     
     # Arrow
-    bpy.ops.mesh.primitive_cone_add(location=(0, 0, 0), rotation=(0, 0, -1.57))
-    arrow = bpy.context.object
+    arrow = add_cone(location=(0, 0, 0), rotation=(0, 0, -1.57))
     arrow.scale = (0.5, 0.5, 1)
-    mat = create_neon_material("Arrow", NEON_COLORS[4], 4)
-    arrow.data.materials.append(mat)
+    set_neon_emission(arrow, NEON_COLORS[4], 4)
     
     render_and_convert_to_white(base_path + "code/refactoring_paths.png")
 
@@ -406,11 +368,9 @@ def create_memory_retrieval():
     add_area_light()
     
     # Memory core
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0))
-    core = bpy.context.object
+    core = add_uv_sphere(location=(0, 0, 0))
     core.scale = (1, 1, 1)
-    mat = create_neon_material("Core", NEON_COLORS[6], 3)
-    core.data.materials.append(mat)
+    set_neon_emission(core, NEON_COLORS[6], 3)
     
     # Memory access rays
     for i in range(20):
@@ -422,13 +382,11 @@ def create_memory_retrieval():
             y = math.sin(angle) * dist
             z = 0
             
-            bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-            mem = bpy.context.object
+            mem = add_ico_sphere(location=(x, y, z))
             mem.scale = (0.1, 0.1, 0.1)
             
             color = NEON_COLORS[(i + j) % len(NEON_COLORS)]
-            mat = create_neon_material(f"Mem{i}{j}", color)
-            mem.data.materials.append(mat)
+            set_neon_emission(mem, color, 3.0)
     
     render_and_convert_to_white(base_path + "memory/memory_retrieval.png")
 
@@ -445,13 +403,11 @@ def create_knowledge_graph():
         y = random.uniform(-4, 4)
         z = random.uniform(-1, 1)
         
-        bpy.ops.mesh.primitive_ico_sphere_add(location=(x, y, z))
-        node = bpy.context.object
+        node = add_ico_sphere(location=(x, y, z))
         node.scale = (0.3, 0.3, 0.3)
         
         color = NEON_COLORS[i % len(NEON_COLORS)]
-        mat = create_neon_material(f"KNode{i}", color)
-        node.data.materials.append(mat)
+        set_neon_emission(node, color, 3.0)
         nodes.append((x, y, z))
     
     # Create connections
@@ -466,8 +422,7 @@ def create_knowledge_graph():
                 mid_y = (y1 + y2) / 2
                 mid_z = (z1 + z2) / 2
                 
-                bpy.ops.mesh.primitive_cylinder_add(location=(mid_x, mid_y, mid_z))
-                edge = bpy.context.object
+                edge = add_cylinder(location=(mid_x, mid_y, mid_z))
                 edge.scale = (0.05, 0.05, 1)
                 
                 # Point towards target
@@ -476,8 +431,7 @@ def create_knowledge_graph():
                 dz = z2 - z1
                 edge.rotation_euler = (0, math.atan2(math.sqrt(dx**2 + dy**2), dz), math.atan2(dy, dx))
                 
-                mat = create_neon_material(f"Edge{i}{j}", NEON_COLORS[7])
-                edge.data.materials.append(mat)
+                set_neon_emission(edge, NEON_COLORS[7], 3.0)
     
     render_and_convert_to_white(base_path + "memory/knowledge_graph.png")
 
@@ -490,23 +444,35 @@ print("=" * 50)
 
 # THINKING
 print("\nTHINKING CATEGORY:")
+seed_scene("thinking/token_stream.png")
 create_token_stream()
+seed_scene("thinking/attention_matrix.png")
 create_attention_matrix()
+seed_scene("thinking/context_window.png")
 create_context_window()
+seed_scene("thinking/thought_chains.png")
 create_thought_chains()
+seed_scene("thinking/parallel_reasoning.png")
 create_parallel_reasoning()
 
 # CODE
 print("\nCODE CATEGORY:")
+seed_scene("code/syntax_tree.png")
 create_syntax_tree()
+seed_scene("code/code_flow.png")
 create_code_flow()
+seed_scene("code/bug_detection.png")
 create_bug_detection()
+seed_scene("code/pattern_matching.png")
 create_pattern_matching()
+seed_scene("code/refactoring_paths.png")
 create_refactoring_paths()
 
 # MEMORY
 print("\nMEMORY CATEGORY:")
+seed_scene("memory/memory_retrieval.png")
 create_memory_retrieval()
+seed_scene("memory/knowledge_graph.png")
 create_knowledge_graph()
 
 print("\n✨ All visualizations complete! ✨")
\ No newline at end of file
@@ -4,6 +4,12 @@ import math
 import random
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # First, delete all old images
 print("Cleaning old images...")
@@ -34,8 +40,7 @@ def setup_white_scene():
     bpy.context.scene.render.resolution_y = 1080
     
     # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
     
     # WHITE BACKGROUND
     world = bpy.data.worlds['World']
@@ -402,28 +407,29 @@ def create_refactoring_paths():
 def render_image(filepath):
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     bpy.context.scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    render_still()
     print(f"Rendered: {filepath}")
 
 # Generate all visualizations
 visualizations = [
     # Thinking
-    create_token_stream,
-    create_attention_matrix,
-    create_context_window,
-    create_thought_chains,
-    create_parallel_reasoning,
+    ("thinking/token_stream.png", create_token_stream),
+    ("thinking/attention_matrix.png", create_attention_matrix),
+    ("thinking/context_window.png", create_context_window),
+    ("thinking/thought_chains.png", create_thought_chains),
+    ("thinking/parallel_reasoning.png", create_parallel_reasoning),
     # Code
-    create_syntax_tree,
-    create_code_flow,
-    create_bug_detection,
-    create_pattern_matching,
-    create_refactoring_paths,
+    ("code/syntax_tree.png", create_syntax_tree),
+    ("code/code_flow.png", create_code_flow),
+    ("code/bug_detection.png", create_bug_detection),
+    ("code/pattern_matching.png", create_pattern_matching),
+    ("code/refactoring_paths.png", create_refactoring_paths),
     # Add all other functions here...
 ]
 
 print("Generating all neon visualizations on white backgrounds...")
-for func in visualizations:
+for name, func in visualizations:
+    seed_scene(name)
     func()
 
 print("\nAll visualizations complete!")
\ No newline at end of file
@@ -4,6 +4,15 @@ import bpy
 import math
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from material_pool import MATERIAL_POOL
+from scene_builder import assign_material, reset_scene
+from scene_seeds import seed_scene
+from text_cache import add_text
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
 
 # Categories of Claude's reality
 CATEGORIES = {
@@ -74,8 +83,7 @@ CATEGORIES = {
 
 def clear_scene():
     """Clean slate"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def setup_bright_world():
     """White background with good lighting"""
@@ -86,18 +94,11 @@ def setup_bright_world():
     bg.inputs[1].default_value = 1.0  # Full brightness
 
 def add_text_label(text, location, size=0.3):
-    """Add 3D text label"""
-    bpy.ops.object.text_add(location=location)
-    txt = bpy.context.active_object
-    txt.data.body = text
-    txt.data.size = size
-    txt.data.font = bpy.data.fonts.load("/usr/share/fonts/google-noto-vf/NotoSans[wght].ttf") if os.path.exists("/usr/share/fonts/google-noto-vf/NotoSans[wght].ttf") else None
+    """Add 3D text label from the shared font and text-mesh cache"""
+    txt = add_text(text, location, size)
     
     # Black text material
-    mat = bpy.data.materials.new("TextMat")
-    mat.use_nodes = True
-    mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (0, 0, 0, 1)
-    txt.data.materials.append(mat)
+    assign_material(txt, MATERIAL_POOL.get('principled', (0, 0, 0, 1)))
     
     return txt
 
@@ -166,12 +167,12 @@ def generate_token_stream():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 32  # Fast render
+    apply_cycles_profile(scene, max_samples=32)
     scene.render.resolution_x = 1080  # Square for mobile
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/token_stream.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_attention_matrix():
     """Attention mechanism visualization"""
@@ -219,12 +220,12 @@ def generate_attention_matrix():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 32
+    apply_cycles_profile(scene, max_samples=32)
     scene.render.resolution_x = 1080
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/attention_matrix.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_syntax_tree():
     """Abstract Syntax Tree visualization"""
@@ -320,12 +321,12 @@ def generate_syntax_tree():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 32
+    apply_cycles_profile(scene, max_samples=32)
     scene.render.resolution_x = 1080
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/code/syntax_tree.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 def generate_file_system_tree():
     """File system navigation visualization"""
@@ -416,12 +417,12 @@ def generate_file_system_tree():
     # Render
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 32
+    apply_cycles_profile(scene, max_samples=32)
     scene.render.resolution_x = 1080
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/tools/file_system_tree.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # Generate first batch of images
 print("Creating output directories...")
@@ -429,15 +430,19 @@ for category in CATEGORIES:
     os.makedirs(f'/home/franz/dev/claude-vision-gallery/public/{category}', exist_ok=True)
 
 print("Generating Token Stream...")
+seed_scene("thinking/token_stream.png")
 generate_token_stream()
 
 print("Generating Attention Matrix...")
+seed_scene("thinking/attention_matrix.png")
 generate_attention_matrix()
 
 print("Generating Syntax Tree...")
+seed_scene("code/syntax_tree.png")
 generate_syntax_tree()
 
 print("Generating File System Tree...")
+seed_scene("tools/file_system_tree.png")
 generate_file_system_tree()
 
 print("First batch complete! More coming...")
\ No newline at end of file
@@ -5,12 +5,21 @@ Represents the vast universe of code possibilities and solutions
 """
 import bpy
 import math
+import numpy as np
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_builder import add_ico_sphere, assign_material, reset_scene
+from point_instancer import add_point_instances
+from scene_seeds import seed_scene
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
 
 def clear_scene():
     """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def create_code_galaxy(center, radius, star_count):
     """Create a galaxy of code stars"""
@@ -26,14 +35,14 @@ def create_code_galaxy(center, radius, star_count):
         y = center[1] + r * math.sin(angle + spiral_offset)
         z = center[2] + random.gauss(0, radius * 0.1)
         
-        # Create star
+        # Create star - all stars share one unit icosphere mesh
         size = random.uniform(0.02, 0.1)
-        bpy.ops.mesh.primitive_ico_sphere_add(
+        star = add_ico_sphere(
             location=(x, y, z),
+            scale=(size, size, size),
             subdivisions=1,
-            radius=size
+            name="Star"
         )
-        star = bpy.context.active_object
         
         # Material with varying colors
         mat = bpy.data.materials.new(name="StarMaterial")
@@ -53,12 +62,37 @@ def create_code_galaxy(center, radius, star_count):
         
         mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = color
         mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = strength
-        star.data.materials.append(mat)
+        assign_material(star, mat)
         
         stars.append(star)
     
     return stars
 
+def create_code_galaxy_points(center, radius, star_count):
+    """Create a galaxy of code stars as one Geometry Nodes point cloud"""
+    # Same spiral distribution as create_code_galaxy, vectorized
+    angle = np.random.uniform(0, math.pi * 4, star_count)
+    r = np.random.uniform(0, radius, star_count) ** 0.5
+    spiral_offset = angle * 0.2
+    
+    positions = np.column_stack([
+        center[0] + r * np.cos(angle + spiral_offset),
+        center[1] + r * np.sin(angle + spiral_offset),
+        center[2] + np.random.normal(0, radius * 0.1, star_count)
+    ])
+    sizes = np.random.uniform(0.02, 0.1, star_count)
+    
+    # Temperature classes: cool / medium / hot
+    temp = np.random.random(star_count)
+    hot = temp >= 0.7
+    medium = (temp >= 0.3) & ~hot
+    colors = np.tile((0.5, 0.7, 1.0), (star_count, 1))
+    colors[medium] = (1, 1, 0.8)
+    colors[hot] = (1, 0.3, 0.1)
+    strengths = np.where(hot, 4.0, np.where(medium, 3.0, 2.0))
+    
+    return add_point_instances("CodeGalaxy", positions, sizes, colors, strengths)
+
 def create_nebula(location, size):
     """Create a code nebula (cloud of possibilities)"""
     # Use metaballs for organic cloud shape
@@ -108,8 +142,12 @@ def create_nebula(location, size):
     obj.data.materials.append(mat)
     return obj
 
-def create_code_universe():
-    """Create the code universe visualization"""
+def create_code_universe(star_backend="points"):
+    """Create the code universe visualization
+    
+    star_backend 'points' builds each galaxy as a single point-instanced
+    object; 'objects' creates one Blender object per star.
+    """
     clear_scene()
     
     # Create multiple galaxies
@@ -124,8 +162,11 @@ def create_code_universe():
     all_stars = []
     for i, center in enumerate(galaxy_centers):
         size = 3 if i == 0 else 2  # Main galaxy is larger
-        stars = create_code_galaxy(center, size, 200 if i == 0 else 100)
-        all_stars.extend(stars)
+        star_count = 200 if i == 0 else 100
+        if star_backend == "points":
+            all_stars.append(create_code_galaxy_points(center, size, star_count))
+        else:
+            all_stars.extend(create_code_galaxy(center, size, star_count))
     
     # Create nebulae
     nebula_positions = [
@@ -154,18 +195,18 @@ def create_code_universe():
             x += offset * 0.3
             y += offset * 0.3
             
-            bpy.ops.mesh.primitive_ico_sphere_add(
+            particle = add_ico_sphere(
                 location=(x, y, z),
-                radius=0.03
+                radius=0.03,
+                name="StreamParticle"
             )
-            particle = bpy.context.active_object
             
             # Stream material
             mat = bpy.data.materials.new("StreamMat")
             mat.use_nodes = True
             mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0.5, 1, 0.5)
             mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 1.0
-            particle.data.materials.append(mat)
+            assign_material(particle, mat)
     
     # Create central black hole (the core algorithm)
     bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 0, 0), radius=0.5)
@@ -230,12 +271,13 @@ def create_code_universe():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 256
+    apply_cycles_profile(scene, max_samples=256)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/code_universe.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 if __name__ == "__main__":
+    seed_scene("code_universe.png")
     create_code_universe()
\ No newline at end of file
@@ -6,11 +6,18 @@ Represents the vast universe of code possibilities
 import bpy
 import math
 import random
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 def clear_scene():
     """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def create_simple_galaxy(center, radius, star_count):
     """Create a simple galaxy of code stars"""
@@ -80,12 +87,13 @@ def create_code_universe_simple():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 64  # Reduced for speed
+    apply_cycles_profile(scene, max_samples=64)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/code_universe.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 if __name__ == "__main__":
+    seed_scene("code_universe.png")
     create_code_universe_simple()
\ No newline at end of file
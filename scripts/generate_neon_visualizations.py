@@ -3,6 +3,12 @@ import bpy
 import math
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # Configure for neon aesthetic with dark background
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -14,8 +20,7 @@ bpy.context.scene.eevee.bloom_radius = 6.5
 bpy.context.scene.eevee.use_bloom = True
 
 def clear_scene():
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
     
 def setup_dark_world():
     """Dark background for neon effect"""
@@ -60,7 +65,7 @@ def get_neon_material(name, color, intensity=5):
 def render_image(filepath):
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     bpy.context.scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # Neon color palette
 NEON_COLORS = [
@@ -518,6 +523,7 @@ def generate_all_neon_visualizations():
     for filepath, func in visualizations:
         full_path = base_path + filepath
         print(f"Generating {filepath}...")
+        seed_scene(filepath)
         func()
         render_image(full_path)
         print(f"Saved {filepath}")
@@ -5,12 +5,19 @@ Represents Claude Code's neural pathways and connections
 """
 import bpy
 import math
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_builder import add_connections, reset_scene
+from scene_seeds import seed_scene
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
 
 def clear_scene():
     """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
     
 def create_node(location, size=0.15):
     """Create a neural node"""
@@ -31,40 +38,15 @@ def create_node(location, size=0.15):
     
     return node
 
-def create_connection(start_pos, end_pos):
-    """Create a connection between nodes"""
-    # Calculate curve points
-    curve = bpy.data.curves.new('connection', 'CURVE')
-    curve.dimensions = '3D'
-    
-    spline = curve.splines.new('BEZIER')
-    spline.bezier_points.add(1)
-    
-    spline.bezier_points[0].co = start_pos
-    spline.bezier_points[0].handle_right_type = 'AUTO'
-    spline.bezier_points[0].handle_left_type = 'AUTO'
-    
-    spline.bezier_points[1].co = end_pos
-    spline.bezier_points[1].handle_right_type = 'AUTO'
-    spline.bezier_points[1].handle_left_type = 'AUTO'
-    
-    # Create object
-    obj = bpy.data.objects.new('connection', curve)
-    bpy.context.collection.objects.link(obj)
-    
-    # Set bevel
-    curve.bevel_depth = 0.01
-    curve.bevel_resolution = 4
-    
-    # Create material
+def create_connections(edges):
+    """Create all connections between nodes as one multi-spline curve"""
     mat = bpy.data.materials.new(name="ConnectionMaterial")
     mat.use_nodes = True
     mat.node_tree.nodes["Principled BSDF"].inputs[17].default_value = (0.1, 0.5, 0.8)
     mat.node_tree.nodes["Principled BSDF"].inputs[18].default_value = 0.5
     mat.node_tree.nodes["Principled BSDF"].inputs[19].default_value = 0.0  # Alpha
-    obj.data.materials.append(mat)
     
-    return obj
+    return add_connections('connections', edges, bevel_depth=0.01, material=mat)
 
 def generate_neural_network():
     """Generate a 3D neural network visualization"""
@@ -88,13 +70,15 @@ def generate_neural_network():
         layers.append(layer_nodes)
     
     # Create connections between layers
+    edges = []
     for i in range(len(layers) - 1):
         for node1 in layers[i]:
             # Connect to random nodes in next layer
             connections = random.sample(layers[i + 1], min(3, len(layers[i + 1])))
             for node2 in connections:
                 if random.random() > 0.3:  # 70% connection probability
-                    create_connection(node1.location, node2.location)
+                    edges.append((node1.location.copy(), node2.location.copy()))
+    create_connections(edges)
     
     # Setup camera
     bpy.ops.object.camera_add(location=(15, -15, 10))
@@ -116,13 +100,14 @@ def generate_neural_network():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 128
+    apply_cycles_profile(scene, max_samples=128)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/neural_network.png'
     
     # Render
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 if __name__ == "__main__":
+    seed_scene("neural_network.png")
     generate_neural_network()
\ No newline at end of file
@@ -3,6 +3,12 @@ import bpy
 import math
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # Set to Eevee for faster rendering
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -12,8 +18,7 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 def clear_scene():
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
     
 def setup_bright_world():
     world = bpy.data.worlds["World"]
@@ -53,7 +58,7 @@ def get_bright_material(name, color):
 def render_image(filepath):
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     bpy.context.scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # Remaining Memory visualizations
 def create_memory_retrieval():
@@ -357,6 +362,7 @@ for filepath, func in functions:
     full_path = base_path + filepath
     if not os.path.exists(full_path):
         print(f"Generating {filepath}...")
+        seed_scene(filepath)
         func()
         render_image(full_path)
         print(f"Saved {filepath}")
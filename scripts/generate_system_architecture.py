@@ -6,11 +6,18 @@ Represents Claude Code's system design and component relationships
 import bpy
 import math
 import random
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 def clear_scene():
     """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    reset_scene()
 
 def create_component(location, size, component_type):
     """Create a system component"""
@@ -184,12 +191,13 @@ def create_system_architecture():
     # Render settings
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 128
+    apply_cycles_profile(scene, max_samples=128)
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/system_architecture.png'
     
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 if __name__ == "__main__":
+    seed_scene("system_architecture.png")
     create_system_architecture()
\ No newline at end of file
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Material Pool
+Deduplicates materials by (shader kind, color, strength, alpha).
+
+Scenes ask the pool for a material instead of calling bpy.data.materials.new
+per object, so the number of materials (and Eevee shader compilations) grows
+with the palette instead of the object count. Pooled materials carry a fake
+user so they survive scene clears and are reused by later scenes.
+
+Neon scenes can skip per-color materials entirely: set_neon_emission stores
+color and strength as object properties that one shared emission material
+reads through Attribute nodes, so a whole scene renders with one shader.
+"""
+import bpy
+
+from scene_builder import assign_material
+
+NEON_MATERIAL = "NeonAttributeEmission"
+NEON_COLOR_ATTRIBUTE = "neon_color"
+NEON_STRENGTH_ATTRIBUTE = "neon_strength"
+
+def _build_emission(name, color, strength, alpha=1.0):
+    """Pure emission shader used by the neon scenes (alpha is ignored)"""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    nodes.clear()
+
+    emission = nodes.new('ShaderNodeEmission')
+    emission.inputs['Color'].default_value = (*color[:3], 1.0)
+    emission.inputs['Strength'].default_value = strength
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    mat.node_tree.links.new(emission.outputs[0], output.inputs[0])
+    return mat
+
+def _build_principled(name, color, strength, alpha=1.0):
+    """Principled BSDF with a base color, glowing in the same color if strength > 0"""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
+    bsdf.inputs["Base Color"].default_value = (*color[:3], color[3] if len(color) > 3 else 1.0)
+    if alpha < 1:
+        bsdf.inputs["Alpha"].default_value = alpha
+    if strength > 0:
+        # Socket was renamed from "Emission" to "Emission Color" in Blender 4.0
+        emission = bsdf.inputs.get("Emission Color") or bsdf.inputs["Emission"]
+        emission.default_value = (*color[:3], 1.0)
+        bsdf.inputs["Emission Strength"].default_value = strength
+    return mat
+
+def get_neon_attribute_material():
+    """Single emission material driven by per-object or per-instance attributes
+
+    INSTANCER attributes are read from the Geometry Nodes instancer when
+    there is one and fall back to the object's own custom properties.
+    """
+    mat = bpy.data.materials.get(NEON_MATERIAL)
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(NEON_MATERIAL)
+    mat.use_nodes = True
+    mat.use_fake_user = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    color = nodes.new('ShaderNodeAttribute')
+    color.attribute_type = 'INSTANCER'
+    color.attribute_name = NEON_COLOR_ATTRIBUTE
+
+    strength = nodes.new('ShaderNodeAttribute')
+    strength.attribute_type = 'INSTANCER'
+    strength.attribute_name = NEON_STRENGTH_ATTRIBUTE
+
+    emission = nodes.new('ShaderNodeEmission')
+    output = nodes.new('ShaderNodeOutputMaterial')
+
+    links.new(color.outputs['Color'], emission.inputs['Color'])
+    links.new(strength.outputs['Fac'], emission.inputs['Strength'])
+    links.new(emission.outputs[0], output.inputs[0])
+    return mat
+
+def set_neon_emission(obj, color, strength):
+    """Give obj the shared neon material with its own color and strength"""
+    obj[NEON_COLOR_ATTRIBUTE] = [float(c) for c in color[:3]]
+    obj[NEON_STRENGTH_ATTRIBUTE] = float(strength)
+    assign_material(obj, get_neon_attribute_material())
+
+SHADER_BUILDERS = {
+    'emission': _build_emission,
+    'principled': _build_principled,
+}
+
+class MaterialPool:
+    """Cache of materials keyed by (shader kind, color, strength, alpha)"""
+
+    def __init__(self):
+        self._materials = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, color, strength=0.0, alpha=1.0):
+        """Return the pooled material for the key, creating it on a miss"""
+        key = (kind, tuple(round(float(c), 4) for c in color), round(float(strength), 4), round(float(alpha), 4))
+        mat = self._materials.get(key)
+        if mat is not None:
+            try:
+                mat.name  # Raises if the datablock was removed
+                self.hits += 1
+                return mat
+            except ReferenceError:
+                pass
+
+        self.misses += 1
+        hex_color = ''.join(f"{round(min(max(c, 0), 1) * 255):02x}" for c in key[1][:3])
+        name = f"{kind.title()}_{hex_color}_{key[2]:g}" + (f"_a{key[3]:g}" if key[3] < 1 else "")
+        mat = SHADER_BUILDERS[kind](name, key[1], key[2], key[3])
+        mat.use_fake_user = True
+        self._materials[key] = mat
+        return mat
+
+    def stats(self):
+        return {
+            'materials': len(self._materials),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def report(self, label="Material pool"):
+        stats = self.stats()
+        requests = stats['hits'] + stats['misses']
+        print(f"{label}: {stats['materials']} materials for {requests} requests "
+              f"({stats['hits']} hits, {stats['misses']} misses)")
+
+# Shared pool for all scenes in this Blender process
+MATERIAL_POOL = MaterialPool()
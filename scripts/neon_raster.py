@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Neon Raster
+Blender-free renderer for the flat-camera neon scenes, in plain NumPy.
+
+The neon scenes are emissive primitives on a black background seen
+through one camera, so they need no light transport. Blender writes each
+built scene as a JSON description once (generate_all_neon.py --describe,
+see scene_description.py); this script then draws the descriptions:
+
+- projects every primitive through the scene camera (perspective or
+  orthographic),
+- paints spheres as discs, meshes as convex polygons and curves as
+  capsule strokes, far to near, with anti-aliased coverage,
+- splats tiny spheres (stars, particles) as energy-preserving points
+  underneath everything else,
+- adds a glow like Eevee's bloom: everything above the bloom threshold,
+  blurred with two Gaussians (three box blurs each) and added back,
+- maps the result to display range with an exponential curve, which
+  keeps the hue of overbright neon colors, encodes sRGB and writes an
+  8-bit PNG.
+
+    blender --background --python scripts/generate_all_neon.py -- --describe descriptions
+    python3 scripts/neon_raster.py descriptions --output raster
+
+A 1080x1080 scene takes well under a second. Shading is flat emission, so
+the result matches the Eevee renders in layout and color, not in detail.
+Only NumPy is needed to draw, but no descriptions are checked in: a CI
+job without Blender needs them as an artifact of a job that has Blender
+and runs --describe.
+"""
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Kept apart from the gallery's output root: the render cache would still
+# take rasterized images there for its Eevee renders
+DEFAULT_RASTER_ROOT = os.path.join(SCRIPT_DIR, "..", "raster")
+
+# Bloom settings of generate_all_neon.py
+BLOOM_THRESHOLD = 0.8
+BLOOM_INTENSITY = 1.0
+BLOOM_RADIUS = 6.5
+# Glow sigmas in pixels per unit of bloom radius at 1080 pixels, and their weights
+GLOW_SCALES = ((0.6, 0.6), (3.0, 0.4))
+
+# Glows are blurred at 1/2^n resolution, so that sigma is about this many pixels
+GLOW_SIGMA_PER_LEVEL = 2.0
+GLOW_LEVELS = 3
+
+# Spheres smaller than this many pixels are splatted instead of drawn
+SPLAT_RADIUS = 1.0
+# Surfaces without emission are drawn at this fraction of their base color
+UNLIT_FACTOR = 0.05
+# Strokes are painted in pieces about this many pixels long
+STROKE_PIECE = 48
+NEAR_CLIP = 1e-3
+# Fast zlib level: the PNGs are mostly black and compress well anyway
+PNG_COMPRESSION = 3
+
+class Camera:
+    """Projects world-space points to pixel coordinates (rows counted from the top)"""
+
+    def __init__(self, camera, width, height):
+        self.view = np.linalg.inv(np.asarray(camera['matrix'], dtype=np.float64))
+        self.width, self.height = width, height
+        self.ortho = camera['type'] == 'ORTHO'
+        fit = camera.get('sensor_fit', 'AUTO')
+        if fit == 'VERTICAL':
+            size, sensor = height, camera['sensor_height']
+        elif fit == 'HORIZONTAL':
+            size, sensor = width, camera['sensor_width']
+        else:
+            size, sensor = max(width, height), camera['sensor_width']
+        if self.ortho:
+            self.focal = size / camera['ortho_scale']
+        else:
+            self.focal = size * camera['lens'] / sensor
+
+    def project(self, points):
+        """(x, y, depth, pixels per world unit) for an (N, 3) array of points"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        local = points @ self.view[:3, :3].T + self.view[:3, 3]
+        depth = -local[:, 2]
+        if self.ortho:
+            scale = np.full(len(points), self.focal)
+        else:
+            scale = self.focal / np.maximum(depth, NEAR_CLIP)
+        x = self.width / 2 + local[:, 0] * scale
+        y = self.height / 2 - local[:, 1] * scale
+        return x, y, depth, scale
+
+def radiance(primitive):
+    color = np.asarray(primitive['color'][:3], dtype=np.float32)
+    strength = primitive['strength']
+    return color * strength if strength > 0 else color * UNLIT_FACTOR
+
+def convex_hull(points):
+    """Convex hull of 2D points, counter-clockwise by the cross product's sign"""
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+def _window(x0, y0, x1, y1, width, height):
+    """Pixel grid of the image region covering [x0, x1] x [y0, y1], or None"""
+    left, right = max(0, int(math.floor(x0))), min(width, int(math.ceil(x1)) + 1)
+    top, bottom = max(0, int(math.floor(y0))), min(height, int(math.ceil(y1)) + 1)
+    if left >= right or top >= bottom:
+        return None
+    xs = np.arange(left, right, dtype=np.float32) + 0.5
+    ys = np.arange(top, bottom, dtype=np.float32)[:, None] + 0.5
+    return (slice(top, bottom), slice(left, right)), xs, ys
+
+def _segment_distance(xs, ys, ax, ay, bx, by):
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else np.clip(((xs - ax) * dx + (ys - ay) * dy) / length, 0.0, 1.0)
+    return np.hypot(xs - (ax + t * dx), ys - (ay + t * dy))
+
+def disc_coverage(cx, cy, radius, width, height):
+    window = _window(cx - radius - 1, cy - radius - 1, cx + radius + 1, cy + radius + 1, width, height)
+    if window is None:
+        return None
+    region, xs, ys = window
+    return region, np.clip(radius + 0.5 - np.hypot(xs - cx, ys - cy), 0.0, 1.0)
+
+def polygon_coverage(hull, width, height):
+    xs_, ys_ = zip(*hull)
+    window = _window(min(xs_) - 1, min(ys_) - 1, max(xs_) + 1, max(ys_) + 1, width, height)
+    if window is None:
+        return None
+    region, xs, ys = window
+    inside = None
+    for (ax, ay), (bx, by) in zip(hull, hull[1:] + hull[:1]):
+        length = math.hypot(bx - ax, by - ay)
+        if length == 0:
+            continue
+        distance = ((bx - ax) * (ys - ay) - (by - ay) * (xs - ax)) / length
+        inside = distance if inside is None else np.minimum(inside, distance)
+    if inside is None:
+        return None
+    return region, np.clip(inside + 0.5, 0.0, 1.0)
+
+def stroke_pieces(xs_, ys_, radii, cyclic):
+    """Capsules (ax, ay, bx, by, radius) of a polyline, long ones cut so windows stay small"""
+    count = len(xs_)
+    pieces = []
+    for i in range(count if cyclic else count - 1):
+        j = (i + 1) % count
+        radius = (radii[i] + radii[j]) / 2
+        ax, ay, bx, by = xs_[i], ys_[i], xs_[j], ys_[j]
+        parts = max(1, int(math.hypot(bx - ax, by - ay) // max(STROKE_PIECE, 4 * radius)))
+        for k in range(parts):
+            t0, t1 = k / parts, (k + 1) / parts
+            pieces.append((ax + (bx - ax) * t0, ay + (by - ay) * t0,
+                           ax + (bx - ax) * t1, ay + (by - ay) * t1, radius))
+    return pieces
+
+def capsule_coverage(ax, ay, bx, by, radius, width, height):
+    window = _window(min(ax, bx) - radius - 1, min(ay, by) - radius - 1,
+                     max(ax, bx) + radius + 1, max(ay, by) + radius + 1, width, height)
+    if window is None:
+        return None
+    region, xs, ys = window
+    distance = _segment_distance(xs, ys, ax, ay, bx, by)
+    # Strokes thinner than a pixel fade instead of breaking up
+    return region, np.clip(max(radius, 0.5) + 0.5 - distance, 0.0, 1.0) * min(1.0, 2 * radius)
+
+def _draw_list(description, camera):
+    """(depth, kind, geometry, radiance) to paint, and the points to splat
+
+    Strokes are painted piece by piece; the pieces of one stroke share its
+    color, so painting their overlaps twice changes nothing.
+    """
+    draws = []
+    primitives = description['primitives']
+    spheres = [p for p in primitives if p['kind'] == 'sphere']
+    splats = None
+    if spheres:
+        x, y, depth, scale = camera.project([p['center'] for p in spheres])
+        radius = np.array([p['radius'] for p in spheres]) * scale
+        colors = np.array([p['color'][:3] for p in spheres], dtype=np.float32)
+        strengths = np.array([p['strength'] for p in spheres], dtype=np.float32)
+        lights = colors * np.where(strengths > 0, strengths, UNLIT_FACTOR)[:, None]
+        visible = depth > NEAR_CLIP
+        small = visible & (radius < SPLAT_RADIUS)
+        splats = (x[small], y[small], lights[small] * (math.pi * radius[small] ** 2)[:, None])
+        for i in np.flatnonzero(visible & ~small):
+            draws.append((depth[i], 'disc', (x[i], y[i], radius[i]), lights[i]))
+
+    for primitive in primitives:
+        kind = primitive['kind']
+        if kind == 'hull':
+            x, y, depth, _ = camera.project(primitive['points'])
+            if (depth <= NEAR_CLIP).any():
+                continue
+            hull = convex_hull(list(zip(x.tolist(), y.tolist())))
+            if len(hull) >= 3:
+                draws.append((float(depth.mean()), 'polygon', hull, radiance(primitive)))
+            elif len(hull) == 2:
+                (ax, ay), (bx, by) = hull
+                draws.append((float(depth.mean()), 'capsule', (ax, ay, bx, by, 0.5), radiance(primitive)))
+        elif kind == 'tube':
+            x, y, depth, scale = camera.project(primitive['points'])
+            if len(x) < 2 or (depth <= NEAR_CLIP).any():
+                continue
+            light = radiance(primitive)
+            for piece in stroke_pieces(x, y, primitive['radius'] * scale, primitive.get('cyclic', False)):
+                draws.append((float(depth.mean()), 'capsule', piece, light))
+    draws.sort(key=lambda draw: -draw[0])
+    return draws, splats
+
+def _splat(image, splats):
+    """Add point energies to the image, split bilinearly over four pixels"""
+    if splats is None or not len(splats[0]):
+        return
+    height, width = image.shape[:2]
+    x, y, energy = splats
+    x, y = x - 0.5, y - 0.5
+    x0, y0 = np.floor(x).astype(np.int64), np.floor(y).astype(np.int64)
+    fx, fy = (x - x0).astype(np.float32), (y - y0).astype(np.float32)
+    for dx, dy, weight in ((0, 0, (1 - fx) * (1 - fy)), (1, 0, fx * (1 - fy)),
+                           (0, 1, (1 - fx) * fy), (1, 1, fx * fy)):
+        px, py = x0 + dx, y0 + dy
+        keep = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        np.add.at(image, (py[keep], px[keep]), energy[keep] * weight[keep, None])
+
+def _box_blur(image, radius, axis):
+    if radius < 1:
+        return image
+    pad = [(0, 0)] * image.ndim
+    pad[axis] = (radius + 1, radius)
+    summed = np.cumsum(np.pad(image, pad), axis=axis, dtype=np.float32)
+    size = image.shape[axis]
+    upper = [slice(None)] * image.ndim
+    lower = [slice(None)] * image.ndim
+    upper[axis] = slice(2 * radius + 1, 2 * radius + 1 + size)
+    lower[axis] = slice(0, size)
+    return (summed[tuple(upper)] - summed[tuple(lower)]) / (2 * radius + 1)
+
+def gaussian_blur(image, sigma):
+    """Approximate Gaussian blur: three box blurs per axis"""
+    radius = int(round((math.sqrt(4 * sigma * sigma + 1) - 1) / 2))
+    for axis in (0, 1):
+        for _ in range(3):
+            image = _box_blur(image, radius, axis)
+    return image
+
+def _downsample(image):
+    """Half resolution by 2x2 means; an odd last row or column is dropped"""
+    image = image[:image.shape[0] // 2 * 2, :image.shape[1] // 2 * 2]
+    return (image[0::2, 0::2] + image[1::2, 0::2] + image[0::2, 1::2] + image[1::2, 1::2]) * 0.25
+
+def _upsample(image, shape):
+    """Double resolution bilinearly, then match shape by edge padding"""
+    for axis in (0, 1):
+        rows = np.moveaxis(image, axis, 0)
+        before = np.concatenate([rows[:1], rows[:-1]])
+        after = np.concatenate([rows[1:], rows[-1:]])
+        doubled = np.empty((2 * len(rows),) + rows.shape[1:], dtype=np.float32)
+        doubled[0::2] = 0.75 * rows + 0.25 * before
+        doubled[1::2] = 0.75 * rows + 0.25 * after
+        image = np.moveaxis(doubled, 0, axis)
+    image = image[:shape[0], :shape[1]]
+    return np.pad(image, ((0, shape[0] - image.shape[0]), (0, shape[1] - image.shape[1]), (0, 0)), mode='edge')
+
+def add_glow(image, threshold=BLOOM_THRESHOLD, intensity=BLOOM_INTENSITY, radius=BLOOM_RADIUS):
+    """Add the blurred parts of image above threshold, like Eevee's bloom
+
+    Each glow is blurred on a level of a half-resolution pyramid, the wider
+    the coarser; the levels are then summed back up to full resolution.
+    """
+    bright = np.maximum(image - threshold, 0.0)
+    if intensity <= 0 or not bright.any():
+        return image
+    unit = radius * max(image.shape[:2]) / 1080
+    levels = [bright]
+    glows = {}
+    for scale, weight in GLOW_SCALES:
+        sigma = scale * unit
+        level = max(0, min(GLOW_LEVELS, round(math.log2(max(sigma / GLOW_SIGMA_PER_LEVEL, 1)))))
+        while len(levels) <= level:
+            levels.append(_downsample(levels[-1]))
+        blurred = weight * gaussian_blur(levels[level], sigma / 2 ** level)
+        glows[level] = glows[level] + blurred if level in glows else blurred
+
+    glow = None
+    for level in range(len(levels) - 1, -1, -1):
+        if glow is not None:
+            glow = _upsample(glow, levels[level].shape)
+        if level in glows:
+            glow = glows[level] if glow is None else glow + glows[level]
+    return image + intensity * glow
+
+def to_srgb8(image):
+    linear = 1.0 - np.exp(-np.maximum(image, 0.0))
+    encoded = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
+    return (encoded * 255 + 0.5).astype(np.uint8)
+
+def write_png(path, pixels):
+    """Write an (H, W, 3) uint8 array as an RGB PNG"""
+    height, width = pixels.shape[:2]
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), pixels.reshape(height, -1)])
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    png = (b'\x89PNG\r\n\x1a\n'
+           + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+           + chunk(b'IDAT', zlib.compress(rows.tobytes(), PNG_COMPRESSION))
+           + chunk(b'IEND', b''))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.rendering.png"
+    with open(temp_path, 'wb') as f:
+        f.write(png)
+    os.replace(temp_path, path)
+
+def rasterize(description, width=None, glow=True):
+    """Render a scene description to a linear float (H, W, 3) image"""
+    scene_width, scene_height = description['resolution']
+    if width:
+        scene_width, scene_height = width, round(width * scene_height / scene_width)
+    camera = Camera(description['camera'], scene_width, scene_height)
+    image = np.empty((scene_height, scene_width, 3), dtype=np.float32)
+    image[:] = description.get('background', (0, 0, 0))[:3]
+
+    draws, splats = _draw_list(description, camera)
+    _splat(image, splats)
+    for _, kind, geometry, light in draws:
+        if kind == 'disc':
+            covered = disc_coverage(*geometry, scene_width, scene_height)
+        elif kind == 'polygon':
+            covered = polygon_coverage(geometry, scene_width, scene_height)
+        else:
+            covered = capsule_coverage(*geometry, scene_width, scene_height)
+        if covered is None:
+            continue
+        region, coverage = covered
+        pixels = image[region]
+        pixels += coverage[..., None] * (light - pixels)
+    return add_glow(image) if glow else image
+
+def render_description(path, output, width=None, glow=True):
+    start = time.time()
+    with open(path) as f:
+        description = json.load(f)
+    image = rasterize(description, width, glow)
+    write_png(output, to_srgb8(image))
+    return output, image.shape[1], image.shape[0], len(description['primitives']), time.time() - start
+
+def description_files(inputs):
+    """(description path, output name) for JSON files and directories of them"""
+    files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith('.json'):
+                        full = os.path.join(root, name)
+                        files.append((full, os.path.splitext(os.path.relpath(full, path))[0] + ".png"))
+        else:
+            files.append((path, os.path.splitext(os.path.basename(path))[0] + ".png"))
+    return files
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rasterize neon scene descriptions without Blender")
+    parser.add_argument('inputs', nargs='+', help="Description files or directories written with --describe")
+    parser.add_argument('--output', default=DEFAULT_RASTER_ROOT, help="Output root for the PNGs (default: raster/)")
+    parser.add_argument('--width', type=int, help="Image width (default: the scene's resolution)")
+    parser.add_argument('--no-glow', action='store_true', help="Skip the bloom pass")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Parallel processes")
+    args = parser.parse_args(argv)
+
+    files = description_files(args.inputs)
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(render_description, path, os.path.join(args.output, name),
+                               args.width, not args.no_glow) for path, name in files]
+        for future in futures:
+            output, width, height, primitives, duration = future.result()
+            print(f"Rasterized {output} ({width}x{height}, {primitives} primitives) in {duration:.2f}s")
+    print(f"{len(files)} images in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
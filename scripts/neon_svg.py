@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Neon SVG
+Writes neon scenes as SVG vector images, without rendering.
+
+Scenes such as the context window, syntax tree or attention matrix are
+flat layouts of glowing shapes. Their descriptions (generate_all_neon.py
+--describe, see scene_description.py) are projected through the scene
+camera like neon_raster.py does, then written as SVG elements, far to
+near:
+
+    spheres            <circle>
+    meshes             <rect> when their outline is an axis-aligned box,
+                       else <polygon> of the projected convex hull
+    curves and tori    <line>, <polyline> or <polygon> strokes with round caps
+
+One filter on the whole drawing adds the glow: two feGaussianBlur layers
+with the sigmas of neon_raster's bloom, their alpha scaled by its weights,
+merged under the sharp shapes. Colors go through the raster's tone curve,
+so both backends agree.
+
+    blender --background --python scripts/generate_all_neon.py -- --describe descriptions
+    python3 scripts/neon_svg.py descriptions --output vectors
+
+As for neon_raster.py, the descriptions come from a Blender run.
+
+Each shape takes about 70 bytes, so a layout of a few hundred shapes is
+a few tens of kilobytes against 90-210 KB for its PNG; star fields with
+thousands of points grow accordingly.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from neon_raster import (
+    BLOOM_RADIUS, GLOW_SCALES, NEAR_CLIP, UNLIT_FACTOR,
+    Camera, convex_hull, description_files, to_srgb8,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SVG_ROOT = os.path.join(SCRIPT_DIR, "..", "vectors")
+
+# Outline corners closer than this many pixels to a box's count as on it
+RECT_TOLERANCE = 0.5
+
+def _number(value):
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+def _color(primitive):
+    strength = primitive['strength']
+    light = np.asarray(primitive['color'][:3], dtype=np.float32)
+    light = light * (strength if strength > 0 else UNLIT_FACTOR)
+    return '#' + ''.join(f"{channel:02x}" for channel in to_srgb8(light))
+
+def _points(xs, ys):
+    return ' '.join(f"{_number(x)},{_number(y)}" for x, y in zip(xs, ys))
+
+def _rect(hull):
+    """(x, y, width, height) if hull is an axis-aligned rectangle, else None"""
+    if len(hull) != 4:
+        return None
+    xs, ys = zip(*hull)
+    left, right, top, bottom = min(xs), max(xs), min(ys), max(ys)
+    for x, y in hull:
+        if min(abs(x - left), abs(x - right)) > RECT_TOLERANCE or min(abs(y - top), abs(y - bottom)) > RECT_TOLERANCE:
+            return None
+    return left, top, right - left, bottom - top
+
+def svg_elements(description, camera):
+    """(depth, element) for every visible primitive"""
+    elements = []
+    for primitive in description['primitives']:
+        kind = primitive['kind']
+        color = _color(primitive)
+        if kind == 'sphere':
+            x, y, depth, scale = camera.project(primitive['center'])
+            if depth[0] <= NEAR_CLIP:
+                continue
+            radius = max(primitive['radius'] * scale[0], 0.5)
+            elements.append((depth[0], f'<circle cx="{_number(x[0])}" cy="{_number(y[0])}" '
+                                       f'r="{_number(radius)}" fill="{color}"/>'))
+        elif kind == 'hull':
+            x, y, depth, _ = camera.project(primitive['points'])
+            if (depth <= NEAR_CLIP).any():
+                continue
+            hull = convex_hull(list(zip(x.tolist(), y.tolist())))
+            if len(hull) < 3:
+                continue
+            rect = _rect(hull)
+            if rect:
+                left, top, width, height = rect
+                element = (f'<rect x="{_number(left)}" y="{_number(top)}" width="{_number(width)}" '
+                           f'height="{_number(height)}" fill="{color}"/>')
+            else:
+                hull_x, hull_y = zip(*hull)
+                element = f'<polygon points="{_points(hull_x, hull_y)}" fill="{color}"/>'
+            elements.append((float(depth.mean()), element))
+        elif kind == 'tube':
+            x, y, depth, scale = camera.project(primitive['points'])
+            if len(x) < 2 or (depth <= NEAR_CLIP).any():
+                continue
+            width = max(2 * primitive['radius'] * float(scale.mean()), 0.5)
+            stroke = f'fill="none" stroke="{color}" stroke-width="{_number(width)}"'
+            if len(x) == 2:
+                element = (f'<line x1="{_number(x[0])}" y1="{_number(y[0])}" x2="{_number(x[1])}" '
+                           f'y2="{_number(y[1])}" {stroke}/>')
+            elif primitive.get('cyclic'):
+                element = f'<polygon points="{_points(x, y)}" {stroke}/>'
+            else:
+                element = f'<polyline points="{_points(x, y)}" {stroke}/>'
+            elements.append((float(depth.mean()), element))
+    elements.sort(key=lambda element: -element[0])
+    return elements
+
+def scene_svg(description, width=None):
+    """SVG document for a scene description"""
+    scene_width, scene_height = description['resolution']
+    if width:
+        scene_width, scene_height = width, round(width * scene_height / scene_width)
+    camera = Camera(description['camera'], scene_width, scene_height)
+    unit = BLOOM_RADIUS * max(scene_width, scene_height) / 1080
+    # Each blur fades to its weight in the raster's glow sum
+    blurs = ''.join(f'<feGaussianBlur in="SourceGraphic" stdDeviation="{_number(scale * unit)}" result="blur{i}"/>'
+                    f'<feComponentTransfer in="blur{i}" result="glow{i}">'
+                    f'<feFuncA type="linear" slope="{weight:g}"/></feComponentTransfer>'
+                    for i, (scale, weight) in enumerate(GLOW_SCALES))
+    merge = ''.join(f'<feMergeNode in="glow{i}"/>' for i in range(len(GLOW_SCALES)))
+    background = np.asarray(description.get('background', (0, 0, 0))[:3], dtype=np.float32)
+    fill = '#' + ''.join(f"{channel:02x}" for channel in to_srgb8(background))
+
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{scene_width}" height="{scene_height}" '
+        f'viewBox="0 0 {scene_width} {scene_height}" stroke-linecap="round" stroke-linejoin="round">',
+        f'<defs><filter id="glow" x="-20%" y="-20%" width="140%" height="140%">{blurs}'
+        f'<feMerge>{merge}<feMergeNode in="SourceGraphic"/></feMerge></filter></defs>',
+        f'<rect width="100%" height="100%" fill="{fill}"/>',
+        '<g filter="url(#glow)">',
+    ]
+    lines.extend(element for _, element in svg_elements(description, camera))
+    lines.append('</g>')
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
+
+def write_svg(path, output, width=None):
+    """Write the SVG of the description at path to output; return its size in bytes"""
+    with open(path) as f:
+        document = scene_svg(json.load(f), width)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    temp_path = f"{output}.writing"
+    with open(temp_path, 'w') as f:
+        f.write(document)
+    os.replace(temp_path, output)
+    return len(document.encode())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write neon scene descriptions as SVG images")
+    parser.add_argument('inputs', nargs='+', help="Description files or directories written with --describe")
+    parser.add_argument('--output', default=DEFAULT_SVG_ROOT, help="Output root for the SVGs (default: vectors/)")
+    parser.add_argument('--width', type=int, help="Image width (default: the scene's resolution)")
+    args = parser.parse_args(argv)
+
+    for path, name in description_files(args.inputs):
+        output = os.path.join(args.output, os.path.splitext(name)[0] + ".svg")
+        size = write_svg(path, output, args.width)
+        print(f"Wrote {output} ({math.ceil(size / 1024)} KB)")
+
+if __name__ == "__main__":
+    main()
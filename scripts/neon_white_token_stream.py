@@ -2,6 +2,13 @@
 import bpy
 import math
 import random
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # NEON ON WHITE - Token Stream
 # Explosive colors on pure white canvas
@@ -11,8 +18,8 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
+seed_scene("thinking/token_stream.png")
 
 # PURE WHITE BACKGROUND
 world = bpy.data.worlds['World']
@@ -175,6 +182,6 @@ sun.data.color = (1, 1, 1)
 
 # Render
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/public/thinking/token_stream.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Vibrant neon token stream on white complete!")
\ No newline at end of file
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Point Instancer
+Renders large star fields from a single object with Geometry Nodes.
+
+Positions become the vertices of one mesh, per-star scale, color and strength
+are stored as point attributes, and a Geometry Nodes modifier instances a
+small icosphere on every point. The instances share the attribute-driven neon
+material from material_pool. Nothing is created per star, so building
+10^5-10^6 stars costs a few foreach_set calls instead of a Python loop.
+"""
+import bpy
+import numpy as np
+
+from material_pool import NEON_COLOR_ATTRIBUTE, NEON_STRENGTH_ATTRIBUTE, get_neon_attribute_material
+
+POINT_NODE_GROUP = "PointInstancer"
+
+def _new_socket(group, name, in_out, socket_type):
+    if hasattr(group, "interface"):
+        group.interface.new_socket(name=name, in_out=in_out, socket_type=socket_type)
+    elif in_out == 'INPUT':  # Blender < 4.0
+        group.inputs.new(socket_type, name)
+    else:
+        group.outputs.new(socket_type, name)
+
+def get_point_node_group(subdivisions=1):
+    """Geometry Nodes group instancing an icosphere on every point"""
+    name = f"{POINT_NODE_GROUP}_{subdivisions}"
+    group = bpy.data.node_groups.get(name)
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    _new_socket(group, "Geometry", 'INPUT', 'NodeSocketGeometry')
+    _new_socket(group, "Geometry", 'OUTPUT', 'NodeSocketGeometry')
+    nodes = group.nodes
+    links = group.links
+
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+
+    to_points = nodes.new('GeometryNodeMeshToPoints')
+
+    sphere = nodes.new('GeometryNodeMeshIcoSphere')
+    sphere.inputs['Radius'].default_value = 1.0
+    sphere.inputs['Subdivisions'].default_value = subdivisions
+
+    scale = nodes.new('GeometryNodeInputNamedAttribute')
+    scale.data_type = 'FLOAT'
+    scale.inputs['Name'].default_value = "scale"
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+
+    set_material = nodes.new('GeometryNodeSetMaterial')
+    set_material.inputs['Material'].default_value = get_neon_attribute_material()
+
+    links.new(group_in.outputs[0], to_points.inputs['Mesh'])
+    links.new(to_points.outputs['Points'], instance.inputs['Points'])
+    links.new(sphere.outputs['Mesh'], set_material.inputs['Geometry'])
+    links.new(set_material.outputs['Geometry'], instance.inputs['Instance'])
+    links.new(scale.outputs['Attribute'], instance.inputs['Scale'])
+    links.new(instance.outputs['Instances'], group_out.inputs[0])
+    return group
+
+def add_point_instances(name, positions, scales, colors, strengths, subdivisions=1):
+    """Create one object that instances an icosphere per point
+
+    positions is (N, 3), colors is (N, 3) or (N, 4), scales and strengths
+    are (N,). Any array-likes are accepted.
+    """
+    positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+    count = len(positions)
+    scales = np.broadcast_to(np.asarray(scales, dtype=np.float32), (count,))
+    strengths = np.broadcast_to(np.asarray(strengths, dtype=np.float32), (count,))
+    colors = np.asarray(colors, dtype=np.float32).reshape(count, -1)
+    if colors.shape[1] == 3:
+        colors = np.hstack([colors, np.ones((count, 1), dtype=np.float32)])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(count)
+    mesh.vertices.foreach_set("co", positions.ravel())
+
+    mesh.attributes.new("scale", 'FLOAT', 'POINT').data.foreach_set(
+        "value", np.ascontiguousarray(scales))
+    mesh.attributes.new(NEON_STRENGTH_ATTRIBUTE, 'FLOAT', 'POINT').data.foreach_set(
+        "value", np.ascontiguousarray(strengths))
+    mesh.attributes.new(NEON_COLOR_ATTRIBUTE, 'FLOAT_COLOR', 'POINT').data.foreach_set(
+        "color", colors.ravel())
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    modifier = obj.modifiers.new(POINT_NODE_GROUP, 'NODES')
+    modifier.node_group = get_point_node_group(subdivisions)
+    return obj
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 import bpy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
 
 # Setup scene
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -7,8 +13,7 @@ bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
 
 # Enable compositing nodes
 bpy.context.scene.use_nodes = True
@@ -89,6 +94,6 @@ for i in range(30):
 
 # Render
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/test_composite_white.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Composite white background complete!")
\ No newline at end of file
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Quality Presets
+One switch for render quality across every generator.
+
+Each script keeps its own look (engine, samples, bloom) as the `final`
+quality. `preview` and `draft` scale it down: lower resolution
+percentage, capped samples, and for `draft` Eevee without bloom even for
+Cycles scenes, so a draft pass over the gallery takes a fraction of a
+final one. Workbench scenes keep Workbench: it is faster than Eevee
+already, and their colors are object colors that Eevee would not show.
+
+The quality is taken from, in order: set_quality(), a `--quality NAME`
+argument after Blender's `--`, the GALLERY_QUALITY environment variable,
+and `final`:
+
+    GALLERY_QUALITY=draft blender --background --python scripts/generate_all_neon.py
+    blender --background --python scripts/white_cycles.py -- --quality preview
+
+Scripts render through render_still(), which applies the quality (and the
+framing, see framing.py) for the render and restores the scene's settings
+afterwards. The final quality renders at a master resolution and writes
+the whole resolution ladder (resolution_ladder.py).
+The module can be imported without bpy.
+"""
+import os
+import sys
+
+# None leaves the script's own setting; samples are an upper bound.
+# With a master resolution the image is rendered that wide and downsampled
+# into the resolution ladder (see resolution_ladder.py).
+QUALITY_PRESETS = {
+    'draft': {
+        'engine': 'BLENDER_EEVEE_NEXT',
+        'samples': 4,
+        'resolution_percentage': 25,
+        'master_resolution': None,
+        'bloom': False,
+        'denoise': False,
+    },
+    'preview': {
+        'engine': None,
+        'samples': 16,
+        'resolution_percentage': 50,
+        'master_resolution': None,
+        'bloom': None,
+        'denoise': True,
+    },
+    'final': {
+        'engine': None,
+        'samples': None,
+        'resolution_percentage': 100,
+        'master_resolution': 2160,
+        'bloom': None,
+        'denoise': None,
+    },
+}
+DEFAULT_QUALITY = 'final'
+# Engines a preset's engine does not replace
+KEEP_ENGINES = ('BLENDER_WORKBENCH',)
+
+_quality = None
+
+def set_quality(name):
+    """Select the quality for this process, overriding flag and environment"""
+    global _quality
+    if name is not None and name not in QUALITY_PRESETS:
+        raise ValueError(f"Unknown quality {name!r}, expected one of {', '.join(QUALITY_PRESETS)}")
+    _quality = name
+
+def blender_option(name):
+    """Value of `--name VALUE` after Blender's `--`, or None"""
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    for index, arg in enumerate(argv):
+        if arg == f'--{name}' and index + 1 < len(argv):
+            return argv[index + 1]
+        if arg.startswith(f'--{name}='):
+            return arg.split('=', 1)[1]
+    return None
+
+def current_quality():
+    """Name of the quality preset in effect"""
+    if _quality is not None:
+        return _quality
+    return blender_option('quality') or os.environ.get('GALLERY_QUALITY', DEFAULT_QUALITY)
+
+def snapshot(scene):
+    """Current values of the settings a preset may change"""
+    saved = {
+        'engine': scene.render.engine,
+        'resolution': (scene.render.resolution_x, scene.render.resolution_y),
+        'resolution_percentage': scene.render.resolution_percentage,
+        'cycles_samples': scene.cycles.samples,
+        'cycles_denoise': scene.cycles.use_denoising,
+        'eevee_samples': scene.eevee.taa_render_samples,
+    }
+    if hasattr(scene.eevee, 'use_bloom'):
+        saved['bloom'] = scene.eevee.use_bloom
+    return saved
+
+def restore(scene, saved):
+    """Undo apply_quality with the values from snapshot"""
+    scene.render.engine = saved['engine']
+    scene.render.resolution_x, scene.render.resolution_y = saved['resolution']
+    scene.render.resolution_percentage = saved['resolution_percentage']
+    scene.cycles.samples = saved['cycles_samples']
+    scene.cycles.use_denoising = saved['cycles_denoise']
+    scene.eevee.taa_render_samples = saved['eevee_samples']
+    if 'bloom' in saved:
+        scene.eevee.use_bloom = saved['bloom']
+
+def apply_quality(scene, name=None, master=True):
+    """Apply a quality preset (default: the current one) to scene
+
+    master=False keeps the scene's resolution even if the preset has a
+    master resolution. The scene keeps the changes; take a snapshot()
+    first to restore() them.
+    """
+    name = name or current_quality()
+    if name not in QUALITY_PRESETS:
+        raise ValueError(f"Unknown quality {name!r}, expected one of {', '.join(QUALITY_PRESETS)}")
+    preset = QUALITY_PRESETS[name]
+
+    if preset['engine'] is not None and scene.render.engine not in KEEP_ENGINES:
+        scene.render.engine = preset['engine']
+    scene.render.resolution_percentage = preset['resolution_percentage']
+    width = preset['master_resolution'] if master else None
+    if width is not None and scene.render.resolution_x != width:
+        render = scene.render
+        render.resolution_x, render.resolution_y = width, round(width * render.resolution_y / render.resolution_x)
+    if preset['samples'] is not None:
+        if scene.render.engine == 'CYCLES':
+            scene.cycles.samples = min(scene.cycles.samples, preset['samples'])
+        else:
+            scene.eevee.taa_render_samples = min(scene.eevee.taa_render_samples, preset['samples'])
+    if preset['bloom'] is not None and hasattr(scene.eevee, 'use_bloom'):
+        scene.eevee.use_bloom = preset['bloom']
+    if preset['denoise'] is not None and scene.render.engine == 'CYCLES':
+        scene.cycles.use_denoising = preset['denoise']
+    return name
+
+def render_still(filepath=None, ladder_path=None, ladder=True):
+    """Render the current scene at the current quality; return the path written
+
+    When Blender was started for a tile (see tiled_render), only that tile
+    is rendered and written to the tile's own path. At a quality with a
+    master resolution the render becomes the resolution ladder of
+    ladder_path (default: filepath), whose plain path is returned. Scripts
+    that post-process the rendered file pass ladder=False to get a single
+    image at their own resolution; a single image drops the variants and
+    manifest entry an earlier ladder left at its path. The quality's
+    changes to the scene are undone after the render, so the scene's own
+    settings stay in effect.
+    """
+    import bpy
+    from framing import frame_scene
+    from tiled_render import apply_tile, current_tile
+
+    scene = bpy.context.scene
+    if filepath is not None:
+        scene.render.filepath = filepath
+    frame_scene(scene)
+    ladder = ladder and bool(QUALITY_PRESETS[current_quality()]['master_resolution'])
+    saved = snapshot(scene)
+    try:
+        apply_quality(scene, master=ladder)
+        tile = current_tile()
+        if tile is not None:
+            apply_tile(scene, tile)
+        bpy.ops.render.render(write_still=True)
+        if scene.render.engine == 'CYCLES':
+            from cycles_profile import report_sample_usage
+            report_sample_usage(scene)
+    finally:
+        restore(scene, saved)
+    if tile is None:
+        from resolution_ladder import drop_ladder, write_ladder
+        if ladder:
+            return write_ladder(scene.render.filepath, ladder_path or scene.render.filepath)
+        drop_ladder(scene.render.filepath)
+    return scene.render.filepath
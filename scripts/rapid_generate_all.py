@@ -3,6 +3,17 @@ import bpy
 import math
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from render_cache import RenderCache, default_index_path, render_settings, scene_key
+from render_jobs import DEFAULT_OUTPUT_ROOT
+from scene_builder import reset_scene
+from scene_seeds import scene_seed, seed_scene
+from quality_presets import render_still
+
+OUTPUT_ROOT = DEFAULT_OUTPUT_ROOT
+RENDER_CACHE = RenderCache(default_index_path(OUTPUT_ROOT))
 
 # Use Workbench for ultra-fast rendering
 bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
@@ -13,8 +24,7 @@ bpy.context.scene.display.shading.studio_light = 'studio.sl'
 bpy.context.scene.display.shading.background_type = 'THEME'
 
 def clear_scene():
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
 
 def setup_camera():
     bpy.ops.object.camera_add(location=(7, -7, 5))
@@ -29,20 +39,24 @@ def simple_material(obj, color):
 def render_image(filepath):
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     bpy.context.scene.render.filepath = filepath
-    bpy.ops.render.render(write_still=True)
+    render_still()
 
 # Define all remaining visualizations
-def generate_visualization(name, creation_func):
-    filepath = f"/home/franz/dev/claude-vision-gallery/public/{name}"
-    if not os.path.exists(filepath):
+def generate_visualization(name, creation_func, settings):
+    filepath = os.path.join(OUTPUT_ROOT, name)
+    seed = scene_seed(name)
+    key = scene_key(creation_func, seed=seed, settings=settings)
+    if not RENDER_CACHE.is_fresh(name, key, filepath):
         print(f"Generating {name}...")
         clear_scene()
         setup_camera()
+        seed_scene(name)
         creation_func()
         render_image(filepath)
+        RENDER_CACHE.record(name, key, filepath)
         print(f"Saved {name}")
     else:
-        print(f"Skipping {name} - already exists")
+        print(f"Skipping {name} - unchanged since last render")
 
 # Language Processing Visualizations
 def create_tokenization_grid():
@@ -645,8 +659,10 @@ visualizations = [
     ("interaction/conversation_state.png", create_conversation_state)
 ]
 
-# Generate all missing visualizations
+# Generate all missing visualizations; read the settings before any render
+# applies its quality preset, so every scene's key sees the same ones
+settings = render_settings(bpy.context.scene)
 for name, func in visualizations:
-    generate_visualization(name, func)
+    generate_visualization(name, func, settings)
 
 print("\nAll visualizations generated successfully!")
\ No newline at end of file
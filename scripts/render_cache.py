@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Render Cache
+Skips renders whose inputs have not changed since the last render.
+
+A scene's cache key is a hash of the source of its create_* function, of
+every helper function and constant it reaches from the scripts directory,
+of its parameters and random seed, and of the scene's render settings. The
+index maps each scene to the key and output hash of its last render and
+sits next to the output root (public/ -> render_cache.json).
+
+The module does not import bpy, so drivers can read the index too.
+"""
+import fcntl
+import hashlib
+import inspect
+import json
+import os
+import types
+
+from quality_presets import QUALITY_PRESETS, current_quality
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_NAME = "render_cache.json"
+
+# Plain values whose repr is folded into the key when a scene reads them
+_CONSTANT_TYPES = (bool, int, float, str, tuple, list, dict)
+
+def _is_local(func):
+    """True for functions defined in a script of this directory"""
+    try:
+        path = inspect.getsourcefile(func)
+    except TypeError:
+        return False
+    return path is not None and os.path.dirname(os.path.abspath(path)) == SCRIPT_DIR
+
+def _code_names(code):
+    """Global names used by code and the functions nested in it"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+def function_fingerprint(func):
+    """Hash of func's source plus the local helpers and constants it uses"""
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [func]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        digest.update(f"{current.__module__}.{current.__qualname__}\n".encode())
+        digest.update(inspect.getsource(current).encode())
+
+        for name in sorted(_code_names(current.__code__)):
+            value = current.__globals__.get(name)
+            if isinstance(value, types.FunctionType):
+                if _is_local(value):
+                    pending.append(value)
+            elif isinstance(value, _CONSTANT_TYPES):
+                digest.update(f"{name}={value!r}\n".encode())
+    return digest.hexdigest()
+
+def render_settings(scene):
+    """Render settings that affect the output image of scene"""
+    from framing import current_framing
+    from resolution_ladder import LADDER_SIZES
+
+    render = scene.render
+    quality = current_quality()
+    settings = {
+        'quality': quality,
+        'framing': current_framing(),
+        'master_resolution': QUALITY_PRESETS[quality]['master_resolution'],
+        'ladder': LADDER_SIZES,
+        'engine': render.engine,
+        'resolution': (render.resolution_x, render.resolution_y, render.resolution_percentage),
+        'film_transparent': render.film_transparent,
+        'file_format': render.image_settings.file_format,
+        'color_mode': render.image_settings.color_mode,
+    }
+    if render.engine == 'CYCLES':
+        settings['samples'] = scene.cycles.samples
+    elif hasattr(scene, 'eevee'):
+        settings['samples'] = scene.eevee.taa_render_samples
+    return settings
+
+def scene_key(func, params=None, seed=None, settings=None):
+    """Content hash of everything that determines a scene's image"""
+    payload = json.dumps({
+        'source': function_fingerprint(func),
+        'params': params or {},
+        'seed': seed,
+        'settings': settings or {},
+    }, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def default_index_path(output_root):
+    """render_cache.json next to the output root directory"""
+    return os.path.join(os.path.dirname(os.path.normpath(output_root)), INDEX_NAME)
+
+class RenderCache:
+    """JSON index of scene -> last rendered key, shared safely between workers"""
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def is_fresh(self, scene, key, output_path):
+        """True if output_path exists and was rendered from the same key"""
+        entry = self.entries.get(scene)
+        if entry is None or entry.get('key') != key or not os.path.exists(output_path):
+            return False
+        return entry.get('output_hash') == file_hash(output_path)
+
+    def record(self, scene, key, output_path):
+        """Store the key and output hash of a finished render"""
+        entry = {'key': key, 'output_hash': file_hash(output_path)}
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+
+        # Other workers update the same index: merge under an exclusive lock
+        with open(self.index_path + ".lock", 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self.entries = self._load()
+            self.entries[scene] = entry
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.index_path)
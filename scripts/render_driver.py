@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Render Driver
+Spreads a batch render over several background Blender processes.
+
+Scene mode splits the scenes of a scene-selectable generator (default:
+generate_all_neon.py) across N workers, each a single `blender --background`
+run that renders its share of scenes. Shares are balanced longest-first on
+the build and render times of earlier runs (see render_schedule):
+
+    python3 scripts/render_driver.py --workers 8
+    python3 scripts/render_driver.py --workers 2 thinking/token_stream.png code/code_flow.png
+
+Script mode runs whole generator scripts as jobs, N at a time:
+
+    python3 scripts/render_driver.py --workers 5 --scripts generate_neural_network.py generate_data_flow.py
+
+Every job writes its own log; the per-scene outcome is read back from the
+marker lines the generators print (see render_jobs) and recorded in a run
+journal. A worker that spends longer than --timeout on one scene is killed
+and its remaining scenes rerun; --resume skips what an earlier run finished:
+
+    python3 scripts/render_driver.py --workers 8 --timeout 600 --resume
+
+--pipeline publishes a draft of every scene first and then replaces each
+with its final render as it completes, so the gallery is complete early:
+
+    python3 scripts/render_driver.py --workers 8 --pipeline --detach
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from render_jobs import (
+    DEFAULT_OUTPUT_ROOT, SCENE_DONE, SCENE_FAILED, SCENE_LISTED, SCENE_STARTED,
+    blender_command, marker_values, parse_marker,
+)
+from render_cache import file_hash
+from render_journal import DONE, FAILED, RUNNING, RunJournal
+from render_schedule import RenderTimes, default_times_path, lpt_schedule
+from quality_presets import QUALITY_PRESETS, current_quality
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "generate_all_neon.py")
+DEFAULT_LOG_DIR = os.path.join(SCRIPT_DIR, "..", "render_logs")
+POLL_INTERVAL = 0.5
+PREVIEW_QUALITY = 'draft'
+
+def list_scenes(blender, script):
+    """Ask the generator for its scene list"""
+    result = subprocess.run(
+        blender_command(blender, script, ['--list']),
+        capture_output=True, text=True, check=True
+    )
+    scenes = []
+    for line in result.stdout.splitlines():
+        marker = parse_marker(line)
+        if marker and marker[0] == SCENE_LISTED:
+            scenes.append(marker[1])
+    return scenes
+
+def probe_objects(blender, script, scenes):
+    """Object counts of scenes, built but not rendered by the generator"""
+    result = subprocess.run(
+        blender_command(blender, script, ['--list', '--probe', *scenes]),
+        capture_output=True, text=True
+    )
+    objects = {}
+    for line in result.stdout.splitlines():
+        marker = parse_marker(line)
+        if marker and marker[0] == SCENE_LISTED:
+            count = marker_values(marker[2]).get('objects')
+            if count is not None:
+                objects[marker[1]] = int(count)
+    return objects
+
+def plan_scenes(args, scenes, times):
+    """Split scenes over the workers longest-first by their expected time"""
+    unseen = [scene for scene in scenes if scene not in times]
+    objects = {}
+    if unseen and times.object_model() is not None:
+        print(f"Probing object counts of {len(unseen)} scenes without render history")
+        objects = probe_objects(args.blender, args.script, unseen)
+    estimates = {scene: times.estimate(scene, objects.get(scene)) for scene in scenes}
+    plan = lpt_schedule(estimates, args.workers)
+    if plan:
+        ideal = sum(estimates.values()) / len(plan)
+        makespan = max(load for _, load in plan)
+        print(f"Schedule: expected makespan {makespan:.1f}s (ideal {ideal:.1f}s) "
+              f"for {len(scenes)} scenes, {len(unseen)} estimated")
+    return [chunk for chunk, _ in plan]
+
+def job_command(job, scenes):
+    """Command running job's script on scenes (all of its own by default)"""
+    return blender_command(job['blender'], job['script'], [*job['options'], *scenes])
+
+def _run_attempt(job, scenes, journal, timeout):
+    """Run one Blender process on scenes; return (returncode, hung, current)
+
+    Markers are read from the log while the process runs so the journal
+    follows every scene. If one scene (or, in script mode, the whole run)
+    exceeds timeout seconds the process is killed and hung is True.
+    """
+    attempt_start = time.time()
+    current, current_start = None, attempt_start
+    hung = False
+    with open(job['log'], 'a') as log, open(job['log'], errors='replace') as reader:
+        reader.seek(0, os.SEEK_END)
+        log.write(f"=== {time.strftime('%H:%M:%S')} {' '.join(job_command(job, scenes))}\n")
+        log.flush()
+        process = subprocess.Popen(job_command(job, scenes), stdout=log, stderr=subprocess.STDOUT)
+        pending = ''
+        while True:
+            returncode = process.poll()
+            pending += reader.read()
+            *lines, pending = pending.split('\n')
+            for line in lines:
+                marker = parse_marker(line)
+                if marker is None:
+                    continue
+                kind, scene, fields = marker
+                if kind == SCENE_STARTED:
+                    current, current_start = scene, time.time()
+                    journal.mark(scene, RUNNING)
+                elif kind == SCENE_DONE:
+                    job['done'][scene] = float(fields[0]) if fields else None
+                    values = marker_values(fields[1:])
+                    if 'build' in values and 'render' in values:
+                        job['times'].record(scene, values['build'], values['render'],
+                                            int(values['objects']) if 'objects' in values else None)
+                    output = os.path.join(job['output'], scene)
+                    journal.mark(scene, DONE, duration=job['done'][scene],
+                                 output_hash=file_hash(output) if os.path.exists(output) else None)
+                    current, current_start = None, time.time()
+                elif kind == SCENE_FAILED:
+                    job['failed'].append(scene)
+                    journal.mark(scene, FAILED, error="exception")
+                    current, current_start = None, time.time()
+            if returncode is not None:
+                break
+
+            since = attempt_start if not job['scenes'] else current_start
+            if timeout and time.time() - since > timeout:
+                process.kill()
+                process.wait()
+                log.write(f"=== killed after {timeout}s without progress\n")
+                returncode, hung = process.returncode, True
+                break
+            time.sleep(POLL_INTERVAL)
+    return returncode, hung, current
+
+def run_job(job, journal, timeout=None, retries=1):
+    """Run one Blender job, retrying scenes a crashed or hung worker left
+
+    The scene that was running when a worker hung or crashed is charged an
+    attempt and given up after `retries` retries; the scenes after it are
+    simply rerun.
+    """
+    start = time.time()
+    job['done'] = {}
+    job['failed'] = []
+    job['attempts'] = 0
+    blamed = {}
+    remaining = list(job['scenes'])
+    open(job['log'], 'w').close()
+
+    while True:
+        job['attempts'] += 1
+        if not job['scenes']:
+            journal.mark(job['name'], RUNNING)
+        returncode, hung, current = _run_attempt(job, remaining, journal, timeout)
+        job['returncode'] = returncode
+
+        if not job['scenes']:
+            # Script mode: the script is the unit of work
+            if returncode == 0:
+                journal.mark(job['name'], DONE, duration=round(time.time() - start, 2))
+            elif hung and job['attempts'] <= retries:
+                continue
+            else:
+                journal.mark(job['name'], FAILED, error="timeout" if hung else f"exit {returncode}")
+            break
+
+        remaining = [
+            scene for scene in remaining
+            if scene not in job['done'] and scene not in job['failed']
+        ]
+        if not remaining:
+            break
+        # The worker died or was killed before finishing its scenes
+        culprit = current or f"{job['name']} startup"
+        blamed[culprit] = blamed.get(culprit, 0) + 1
+        if blamed[culprit] > retries:
+            if current is None:
+                break
+            job['failed'].append(current)
+            journal.mark(current, FAILED, error="timeout" if hung else "crash")
+            remaining.remove(current)
+            if not remaining:
+                break
+
+    # Scenes never reported were lost to repeated startup failures
+    job['missing'] = remaining if job['scenes'] else []
+    for scene in job['missing']:
+        journal.mark(scene, FAILED, error="crash")
+    job['duration'] = time.time() - start
+    return job
+
+def run_jobs(jobs, workers, journal, timeout=None, retries=1):
+    """Run jobs with at most `workers` Blender processes at a time"""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda job: run_job(job, journal, timeout, retries), jobs))
+
+def scene_jobs(args, log_dir, journal, times):
+    scenes = args.scenes or list_scenes(args.blender, args.script)
+    if args.resume:
+        finished = [s for s in scenes if journal.is_complete(s, os.path.join(args.output, s))]
+        scenes = [s for s in scenes if s not in finished]
+        print(f"Resuming: {len(finished)} scenes already done, {len(scenes)} to render")
+    journal.add_pending(scenes)
+
+    options = ['--output', args.output, '--seed', str(args.seed)] + (['--force'] if args.force else [])
+    if args.quality:
+        options += ['--quality', args.quality]
+    if args.preview:
+        options += ['--preview']
+    if args.frame:
+        options += ['--frame', args.frame]
+    jobs = []
+    for index, chunk in enumerate(plan_scenes(args, scenes, times)):
+        jobs.append({
+            'name': f"worker{index}",
+            'scenes': chunk,
+            'times': times,
+            'blender': args.blender,
+            'script': args.script,
+            'options': options,
+            'output': args.output,
+            'log': os.path.join(log_dir, f"worker{index}.log"),
+        })
+    return jobs
+
+def script_options(args):
+    """Options every generator script understands"""
+    options = ['--quality', args.quality] if args.quality else []
+    if args.frame:
+        options += ['--frame', args.frame]
+    return options
+
+def script_jobs(args, log_dir, journal):
+    jobs = []
+    for script in args.scripts:
+        path = script if os.path.exists(script) else os.path.join(SCRIPT_DIR, script)
+        name = os.path.splitext(os.path.basename(path))[0]
+        if args.resume and journal.is_complete(name):
+            print(f"Resuming: {name} already done")
+            continue
+        jobs.append({
+            'name': name,
+            'scenes': [],
+            'blender': args.blender,
+            'script': path,
+            'options': script_options(args),
+            'output': args.output,
+            'log': os.path.join(log_dir, f"{name}.log"),
+        })
+    journal.add_pending([job['name'] for job in jobs])
+    return jobs
+
+def print_summary(jobs, wall_time):
+    print(f"\n{'job':<28} {'exit':>4} {'time':>8}  scenes")
+    for job in jobs:
+        scenes = f"{len(job['done'])} done"
+        if job['attempts'] > 1:
+            scenes += f", {job['attempts']} attempts"
+        if job['failed']:
+            scenes += f", {len(job['failed'])} failed"
+        if job['missing']:
+            scenes += f", {len(job['missing'])} missing"
+        print(f"{job['name']:<28} {job['returncode']:>4} {job['duration']:>7.1f}s  {scenes}  ({job['log']})")
+    for job in jobs:
+        for scene in job['failed'] + job['missing']:
+            print(f"  FAILED {scene} (see {job['log']})")
+    print(f"\nWall time: {wall_time:.1f}s")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the gallery with parallel Blender workers")
+    parser.add_argument('scenes', nargs='*', help="Scenes to render (default: all scenes of --script)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of Blender processes (default: CPU count)")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="Blender executable (default: $BLENDER or blender)")
+    parser.add_argument('--script', default=DEFAULT_SCRIPT,
+                        help="Scene-selectable generator script")
+    parser.add_argument('--scripts', nargs='+',
+                        help="Run these whole generator scripts as jobs instead of scenes")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_ROOT, help="Output root for rendered scenes")
+    parser.add_argument('--force', action='store_true', help="Ignore the render cache")
+    parser.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED, help="Base seed for every scene")
+    parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                        help="Quality preset for every job (default: $GALLERY_QUALITY or final)")
+    parser.add_argument('--frame', help="Framing for every scene: fit, border or fit,border")
+    parser.add_argument('--log-dir', default=DEFAULT_LOG_DIR, help="Directory for per-job logs")
+    parser.add_argument('--journal', help="Run journal (default: journal.json in --log-dir)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip jobs the journal records as done with unchanged output")
+    parser.add_argument('--timeout', type=float,
+                        help="Kill a worker after this many seconds on one scene (or script)")
+    parser.add_argument('--retries', type=int, default=1,
+                        help="Times to retry a scene whose worker hung or crashed (default: 1)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="Publish draft previews of all scenes first, then render the finals")
+    parser.add_argument('--detach', action='store_true',
+                        help="With --pipeline, render the finals in a background driver")
+    args = parser.parse_args(argv)
+    args.preview = False
+    if args.pipeline:
+        if args.scripts:
+            parser.error("--pipeline works on scenes, not --scripts")
+        return run_pipeline(args, sys.argv[1:] if argv is None else argv)
+    return run_batch(args)
+
+def run_batch(args):
+    """Render args' scenes or scripts; return the exit status"""
+    log_dir = os.path.abspath(args.log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+    journal = RunJournal(args.journal or os.path.join(log_dir, "journal.json"), resume=args.resume)
+    times = RenderTimes(default_times_path(args.output, args.quality or current_quality()))
+    if args.scripts:
+        jobs = script_jobs(args, log_dir, journal)
+    else:
+        jobs = scene_jobs(args, log_dir, journal, times)
+    print(f"Running {len(jobs)} jobs on {args.workers} workers, logs in {log_dir}")
+
+    start = time.time()
+    jobs = run_jobs(jobs, args.workers, journal, args.timeout, args.retries)
+    print_summary(jobs, time.time() - start)
+    # Script jobs report no scene times; don't touch the output root for nothing
+    if times.recorded:
+        times.save()
+    print(f"Journal: {journal.path} {journal.counts()}")
+
+    ok = all(job['returncode'] == 0 and not job['failed'] and not job['missing'] for job in jobs)
+    return 0 if ok else 1
+
+def run_pipeline(args, argv):
+    """Publish draft previews of every scene, then replace them with finals
+
+    Previews skip scenes whose final render is already current. Finals
+    are written to a temporary file and renamed over the preview, so the
+    gallery always shows a complete image.
+    """
+    scenes = args.scenes or list_scenes(args.blender, args.script)
+    final_quality = args.quality or 'final'
+
+    start = time.time()
+    preview = argparse.Namespace(**vars(args))
+    preview.scenes = scenes
+    preview.quality = PREVIEW_QUALITY
+    preview.preview = True
+    preview.resume = False
+    preview.log_dir = os.path.join(args.log_dir, PREVIEW_QUALITY)
+    preview.journal = None
+    status = run_batch(preview)
+    print(f"\nPreviews published for {len(scenes)} scenes in {time.time() - start:.1f}s")
+
+    if args.detach:
+        # Rerun this driver without the pipeline flags for the finals
+        options = [arg for arg in argv if arg not in ('--pipeline', '--detach')]
+        options = [arg for arg in options if arg not in scenes] + ['--quality', final_quality, *scenes]
+        log_dir = os.path.abspath(args.log_dir)
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, "finals.log")
+        with open(log_path, 'w') as log:
+            process = subprocess.Popen([sys.executable, os.path.abspath(__file__), *options],
+                                       stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+        print(f"Final renders continue in the background (pid {process.pid}, log {log_path})")
+        return status
+
+    final = argparse.Namespace(**vars(args))
+    final.scenes = scenes
+    final.quality = final_quality
+    return run_batch(final) or status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Render Jobs
+Shared, bpy-free pieces of the batch render protocol.
+
+Generators run inside Blender and take their options after `--`:
+
+    blender --background --python generate_all_neon.py -- thinking/token_stream.png
+
+A scene is identified by its output path relative to the output root. Each
+scene reports its outcome on stdout as a marker line, which the drivers read
+back from the worker logs.
+"""
+import argparse
+import os
+import sys
+
+from quality_presets import QUALITY_PRESETS
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCENE_LISTED = "SCENE"
+SCENE_STARTED = "SCENE_STARTED"
+SCENE_DONE = "SCENE_DONE"
+SCENE_FAILED = "SCENE_FAILED"
+
+# Shared render boxes point this at a common mount
+DEFAULT_OUTPUT_ROOT = os.environ.get('GALLERY_OUTPUT_ROOT', "/home/franz/dev/claude-vision-gallery/public/")
+
+# Animation modes of animation.py and the frames in one loop
+ANIMATION_MODES = ('turntable', 'motion')
+DEFAULT_FRAMES = 120
+
+def blender_argv(argv=None):
+    """Arguments passed to the script after Blender's `--` separator"""
+    argv = sys.argv if argv is None else argv
+    return argv[argv.index('--') + 1:] if '--' in argv else []
+
+def scene_arg_parser(description):
+    """Argument parser shared by the scene-selectable generators"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('scenes', nargs='*',
+                        help="Scenes to render, e.g. thinking/token_stream.png (default: all)")
+    parser.add_argument('--list', action='store_true',
+                        help="Print the available scenes and exit")
+    parser.add_argument('--probe', action='store_true',
+                        help="With --list, build the scenes and report their object counts")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_ROOT,
+                        help="Output root the scene paths are relative to")
+    parser.add_argument('--force', action='store_true',
+                        help="Render even if the render cache says the output is current")
+    parser.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED,
+                        help="Base seed mixed into every scene's seed")
+    parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                        help="Quality preset (default: $GALLERY_QUALITY or final)")
+    parser.add_argument('--frame',
+                        help="Framing: fit, border or fit,border (default: $GALLERY_FRAME or none)")
+    parser.add_argument('--tile', help="Render only this tile: COLUMN,ROW,GRID (see tiled_render)")
+    parser.add_argument('--resolution', type=int, help="Image width when rendering a tile")
+    parser.add_argument('--overlap', type=int, help="Tile overlap in pixels")
+    parser.add_argument('--tile-output', help="Path of the rendered tile")
+    parser.add_argument('--preview', action='store_true',
+                        help="Preview pass: keep scenes whose final render is current")
+    parser.add_argument('--animate', choices=ANIMATION_MODES,
+                        help="Render frames of an animated scene instead of a still (see animation_render)")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES, help="Frames per animation loop")
+    parser.add_argument('--frame-range', help="START,END: the frames of the loop to render")
+    parser.add_argument('--frames-dir', help="Directory for the rendered frames")
+    parser.add_argument('--describe', metavar='DIR',
+                        help="Build the scenes and write their descriptions for neon_raster.py instead of rendering")
+    return parser
+
+def select_scenes(visualizations, names):
+    """Filter (filepath, create_fn) pairs to names, keeping their order"""
+    if not names:
+        return list(visualizations)
+    known = {filepath for filepath, _ in visualizations}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise SystemExit(f"Unknown scenes: {', '.join(unknown)}")
+    wanted = set(names)
+    return [(filepath, func) for filepath, func in visualizations if filepath in wanted]
+
+def format_marker(marker, scene, *fields):
+    return " ".join([marker, scene, *(str(field) for field in fields)])
+
+def parse_marker(line):
+    """Return (marker, scene, fields) for a marker line, None for anything else"""
+    parts = line.split()
+    if len(parts) < 2 or parts[0] not in (SCENE_LISTED, SCENE_STARTED, SCENE_DONE, SCENE_FAILED):
+        return None
+    return parts[0], parts[1], parts[2:]
+
+def marker_values(fields):
+    """key=value marker fields as a dict of floats"""
+    values = {}
+    for field in fields:
+        key, sep, value = field.partition('=')
+        if sep:
+            try:
+                values[key] = float(value)
+            except ValueError:
+                pass
+    return values
+
+def blender_command(blender, script, args=()):
+    """Command line running script in background Blender with args after `--`"""
+    return [blender, '--background', '--python-exit-code', '1',
+            '--python', script, '--', *args]
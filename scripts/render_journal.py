@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Render Journal
+Records the progress of a batch render so an interrupted run can resume.
+
+Every job (a scene, or a whole script in script mode) has an entry with
+its state (pending, running, done or failed), attempts, duration and the
+hash of its output. The journal is rewritten atomically after every change,
+so it survives the driver being killed mid-run.
+"""
+import json
+import os
+import threading
+import time
+
+from render_cache import file_hash
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+class RunJournal:
+    """JSON file of job -> state, updated by the driver's job threads"""
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = self._load() if resume else {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def state(self, name):
+        return self.entries.get(name, {}).get('state')
+
+    def is_complete(self, name, output_path=None):
+        """True if name finished and its output, when given, is unchanged"""
+        entry = self.entries.get(name, {})
+        if entry.get('state') != DONE:
+            return False
+        if output_path is None or entry.get('output_hash') is None:
+            return True
+        return os.path.exists(output_path) and file_hash(output_path) == entry['output_hash']
+
+    def mark(self, name, state, **fields):
+        """Set the state of name, merging fields into its entry"""
+        with self.lock:
+            entry = self.entries.setdefault(name, {'attempts': 0})
+            if state == RUNNING:
+                entry['attempts'] = entry.get('attempts', 0) + 1
+                entry.pop('error', None)
+            entry['state'] = state
+            entry['updated'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+            entry.update(fields)
+            self._save()
+
+    def add_pending(self, names):
+        """Reset names to pending, keeping their attempt counts"""
+        with self.lock:
+            for name in names:
+                entry = self.entries.setdefault(name, {'attempts': 0})
+                entry['state'] = PENDING
+            self._save()
+
+    def counts(self):
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry['state']] = counts.get(entry['state'], 0) + 1
+        return counts
@@ -3,6 +3,11 @@ import bpy
 import math
 from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
 
 # Setup scene for transparent background
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -13,8 +18,7 @@ bpy.context.scene.render.image_settings.file_format = 'PNG'
 bpy.context.scene.render.image_settings.color_mode = 'RGBA'
 
 # Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
 
 # Camera
 bpy.ops.object.camera_add(location=(0, -10, 0))
@@ -96,7 +100,7 @@ light.data.color = (1, 1, 1)
 # Render with transparent background
 temp_path = '/home/franz/dev/claude-vision-gallery/temp_transparent.png'
 bpy.context.scene.render.filepath = temp_path
-bpy.ops.render.render(write_still=True)
+render_still(ladder=False)
 
 # Convert to white background using PIL
 print("Converting to white background...")
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Render Queue
+A file-system job queue that any number of render boxes drain together.
+
+The queue is a shared directory with one JSON file per scene:
+
+    pending/   jobs waiting for a worker
+    claimed/   jobs being rendered; the file's mtime is the worker's heartbeat
+    done/      finished jobs with their timings
+    failed/    jobs that failed or lost their lease too often
+
+A worker claims a job by renaming it from pending/ to claimed/, which
+succeeds for exactly one worker. While rendering it touches the claimed
+file every few seconds; a claimed job whose heartbeat is older than the
+lease is moved back to pending/ by the next worker that looks, so jobs of
+crashed or disconnected boxes are picked up again. Outputs go to the
+output root stored in the job, which should be a shared mount as well.
+
+Queue the gallery, then start workers on every box (or several on one box;
+a temp directory works for trying it out locally):
+
+    python3 scripts/render_queue.py enqueue --queue /mnt/gallery/queue --output /mnt/gallery/public/
+    blender --background --python scripts/render_queue.py -- work --queue /mnt/gallery/queue
+    python3 scripts/render_queue.py status --queue /mnt/gallery/queue
+
+Everything but `work` runs without Blender. `work --stub` fakes the renders,
+so several workers can drain a temp directory queue without Blender:
+
+    python3 scripts/render_queue.py enqueue --queue /tmp/queue --output /tmp/out a.png b.png
+    python3 scripts/render_queue.py work --queue /tmp/queue --stub &
+    python3 scripts/render_queue.py work --queue /tmp/queue --stub
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import QUALITY_PRESETS
+from render_jobs import DEFAULT_OUTPUT_ROOT, blender_argv
+from render_worker import RenderWorker
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = "generate_all_neon.py"
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, CLAIMED, DONE, FAILED)
+
+# Seconds without a heartbeat before a claimed job is handed out again
+LEASE_SECONDS = 120
+MAX_ATTEMPTS = 3
+POLL_INTERVAL = 5
+# Seconds a stub render takes
+STUB_SECONDS = 0.2
+
+def job_file(scene):
+    """File name of the job for scene"""
+    return scene.replace(os.sep, '__') + ".json"
+
+def worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+def _write(path, data):
+    """Write data so readers never see a partial file"""
+    temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{worker_id()}.tmp")
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+def _jobs(queue, state):
+    directory = os.path.join(queue, state)
+    try:
+        return sorted(name for name in os.listdir(directory) if name.endswith(".json") and not name.startswith("."))
+    except FileNotFoundError:
+        return []
+
+def init_queue(queue):
+    for state in STATES:
+        os.makedirs(os.path.join(queue, state), exist_ok=True)
+
+def enqueue(queue, scenes, script=DEFAULT_SCRIPT, output_root=DEFAULT_OUTPUT_ROOT,
+            quality='final', seed=DEFAULT_BASE_SEED):
+    """Add a pending job per scene, replacing finished or failed ones; return the count"""
+    init_queue(queue)
+    added = 0
+    for scene in scenes:
+        name = job_file(scene)
+        if os.path.exists(os.path.join(queue, PENDING, name)) or os.path.exists(os.path.join(queue, CLAIMED, name)):
+            continue
+        for state in (DONE, FAILED):
+            try:
+                os.unlink(os.path.join(queue, state, name))
+            except FileNotFoundError:
+                pass
+        _write(os.path.join(queue, PENDING, name), {
+            'scene': scene,
+            'script': os.path.basename(script),
+            'output': os.path.join(output_root, scene),
+            'quality': quality,
+            'seed': seed,
+            'attempts': 0,
+        })
+        added += 1
+    return added
+
+def reap(queue, lease=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+    """Hand out again claimed jobs whose heartbeat stopped; return their names"""
+    reaped = []
+    now = time.time()
+    for name in _jobs(queue, CLAIMED):
+        path = os.path.join(queue, CLAIMED, name)
+        try:
+            if now - os.path.getmtime(path) < lease:
+                continue
+            job = _read(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        state = PENDING if job.get('attempts', 0) < max_attempts else FAILED
+        # Move the job aside before touching it: of several reapers only one
+        # rename finds the file, and the staging name is never claimed
+        staging = os.path.join(queue, state, f".{name}.{worker_id()}.reap")
+        try:
+            os.rename(path, staging)
+        except FileNotFoundError:
+            continue  # Lost the race
+        moved = _read(staging)
+        if moved.get('claimed') != job.get('claimed'):
+            # The job was requeued and claimed afresh since we read it: hand it back
+            os.rename(staging, path)
+            continue
+        moved['error'] = f"lease expired on {moved.get('worker')}"
+        _write(staging, moved)
+        os.rename(staging, os.path.join(queue, state, name))
+        reaped.append(name)
+    return reaped
+
+def claim(queue, worker=None):
+    """Claim the next pending job; return (path, job) or None when none is left"""
+    worker = worker or worker_id()
+    for name in _jobs(queue, PENDING):
+        pending = os.path.join(queue, PENDING, name)
+        path = os.path.join(queue, CLAIMED, name)
+        # rename() keeps the mtime, so refresh it first: a reaper must never see
+        # a stale heartbeat on a job that has just been claimed
+        try:
+            os.utime(pending)
+            os.rename(pending, path)
+        except FileNotFoundError:
+            continue  # Claimed by someone else first
+        job = _read(path)
+        job['worker'] = worker
+        job['claimed'] = time.time()
+        job['attempts'] = job.get('attempts', 0) + 1
+        _write(path, job)
+        return path, job
+    return None
+
+def finish(queue, path, job, reply):
+    """Move a claimed job to done/ or failed/ with the worker's reply"""
+    job.update(reply)
+    state = DONE if reply.get('status') == 'done' else FAILED
+    target = os.path.join(queue, state, os.path.basename(path))
+    _write(target, job)
+    # If the lease expired meanwhile the job may be claimed by another worker
+    # now; leave that claim alone, its render produces the same image
+    try:
+        if _read(path).get('worker') == job['worker']:
+            os.unlink(path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    pending = os.path.join(queue, PENDING, os.path.basename(path))
+    if state == DONE and os.path.exists(pending):
+        os.unlink(pending)
+
+class StubWorker:
+    """Stands in for RenderWorker outside Blender to try the queue locally
+
+    Each render appends a line to the job's output file, so a job rendered
+    twice shows up as two lines.
+    """
+
+    def __init__(self, seconds=STUB_SECONDS):
+        self.seconds = seconds
+
+    def render(self, job):
+        start = time.time()
+        time.sleep(self.seconds)
+        os.makedirs(os.path.dirname(os.path.abspath(job['output'])), exist_ok=True)
+        with open(job['output'], 'a') as f:
+            f.write(f"{job['scene']} {worker_id()}\n")
+        return {'status': 'done', 'total': round(time.time() - start, 3)}
+
+class Heartbeat:
+    """Touches a claimed job file in the background until stopped"""
+
+    def __init__(self, path, interval):
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                os.utime(self.path)
+            except FileNotFoundError:
+                print(f"Lost lease on {self.path}", flush=True)
+                return
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+def work(queue, lease=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS, wait=False, stub=False):
+    """Render queued jobs until the queue is drained; return the failed count"""
+    workers = {}
+    failed = 0
+    me = worker_id()
+    print(f"Queue worker {me} on {queue}", flush=True)
+    while True:
+        reap(queue, lease, max_attempts)
+        claimed = claim(queue, me)
+        if claimed is None:
+            # Jobs still claimed elsewhere may come back if their worker dies
+            if not wait and not _jobs(queue, CLAIMED):
+                return failed
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        path, job = claimed
+        script = os.path.join(SCRIPT_DIR, job['script'])
+        if script not in workers:
+            workers[script] = StubWorker() if stub else RenderWorker(script)
+        print(f"Rendering {job['scene']} (attempt {job['attempts']})", flush=True)
+        with Heartbeat(path, lease / 4):
+            reply = workers[script].render(job)
+        finish(queue, path, job, reply)
+        print(f"{reply['status']} {job['scene']} in {reply.get('total', 0):.2f}s", flush=True)
+        if reply['status'] != 'done':
+            failed += 1
+
+def status(queue, lease=LEASE_SECONDS):
+    now = time.time()
+    print("  ".join(f"{state}: {len(_jobs(queue, state))}" for state in STATES))
+    for name in _jobs(queue, CLAIMED):
+        path = os.path.join(queue, CLAIMED, name)
+        try:
+            job = _read(path)
+            age = now - os.path.getmtime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        stale = " (lease expired)" if age > lease else ""
+        print(f"  {job['scene']} on {job.get('worker')}, heartbeat {age:.0f}s ago{stale}")
+    for name in _jobs(queue, FAILED):
+        job = _read(os.path.join(queue, FAILED, name))
+        print(f"  FAILED {job['scene']}: {job.get('error', '')}")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Shared-directory render queue")
+    commands = parser.add_subparsers(dest='mode', required=True)
+
+    enqueue_parser = commands.add_parser('enqueue', help="Queue scenes")
+    enqueue_parser.add_argument('scenes', nargs='*', help="Scenes to queue (default: all scenes of --script)")
+    enqueue_parser.add_argument('--script', default=DEFAULT_SCRIPT, help="Scene-selectable generator script")
+    enqueue_parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                                help="Blender used to list the scenes (default: $BLENDER or blender)")
+    enqueue_parser.add_argument('--output', default=DEFAULT_OUTPUT_ROOT, help="Shared output root")
+    enqueue_parser.add_argument('--quality', default='final', choices=list(QUALITY_PRESETS))
+    enqueue_parser.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED, help="Base seed")
+
+    work_parser = commands.add_parser('work', help="Render queued jobs (inside Blender)")
+    work_parser.add_argument('--wait', action='store_true', help="Keep polling for new jobs")
+    work_parser.add_argument('--stub', action='store_true',
+                             help="Fake the renders without Blender, to try the queue locally")
+
+    commands.add_parser('status', help="Show the queue")
+    commands.add_parser('reap', help="Requeue jobs whose lease expired")
+
+    for command in commands.choices.values():
+        command.add_argument('--queue', required=True, help="Shared queue directory")
+        command.add_argument('--lease', type=float, default=LEASE_SECONDS,
+                             help=f"Heartbeat timeout in seconds (default: {LEASE_SECONDS})")
+        command.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                             help=f"Claims per job before it fails (default: {MAX_ATTEMPTS})")
+    args = parser.parse_args(argv)
+
+    if args.mode == 'enqueue':
+        scenes = args.scenes
+        if not scenes:
+            from render_driver import list_scenes
+            scenes = list_scenes(args.blender, os.path.join(SCRIPT_DIR, args.script))
+        added = enqueue(args.queue, scenes, args.script, args.output, args.quality, args.seed)
+        print(f"Queued {added} of {len(scenes)} scenes in {args.queue}")
+    elif args.mode == 'work':
+        return 1 if work(args.queue, args.lease, args.max_attempts, args.wait, args.stub) else 0
+    elif args.mode == 'reap':
+        reaped = reap(args.queue, args.lease, args.max_attempts)
+        print(f"Requeued {len(reaped)} jobs")
+    else:
+        status(args.queue, args.lease)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(blender_argv() if '--' in sys.argv else sys.argv[1:]))
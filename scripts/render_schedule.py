@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Render Schedule
+Cost model and longest-processing-time-first scheduling for batch renders.
+
+Build and render times of every finished scene are kept in a history file
+next to the output root (public/ -> render_times.json). A scene's expected
+cost is its smoothed past time; scenes never rendered are estimated from
+their object count with a linear fit over the scenes that were. Scenes are
+then dealt to workers longest first, each to the least loaded worker (LPT),
+which keeps the makespan within 4/3 of the optimum instead of leaving
+workers idle behind one slow Cycles scene.
+
+The module does not import bpy.
+"""
+import json
+import os
+import threading
+
+TIMES_NAME = "render_times.json"
+
+# Weight of the newest measurement in the smoothed time
+SMOOTHING = 0.5
+# Seconds assumed for a scene when nothing at all is known yet
+DEFAULT_ESTIMATE = 30.0
+
+def default_times_path(output_root, quality='final'):
+    """render_times.json next to the output root, one file per non-final quality"""
+    name = TIMES_NAME if quality == 'final' else TIMES_NAME.replace('.json', f".{quality}.json")
+    return os.path.join(os.path.dirname(os.path.normpath(output_root)), name)
+
+class RenderTimes:
+    """History of per-scene build and render times"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        # Measurements recorded by this run
+        self.recorded = 0
+
+    def __contains__(self, scene):
+        return scene in self.entries
+
+    def record(self, scene, build, render, objects=None):
+        """Fold one measurement into the smoothed times of scene"""
+        with self.lock:
+            entry = self.entries.get(scene)
+            if entry is None:
+                entry = self.entries[scene] = {'build': build, 'render': render, 'runs': 0}
+            else:
+                entry['build'] += SMOOTHING * (build - entry['build'])
+                entry['render'] += SMOOTHING * (render - entry['render'])
+            entry['runs'] += 1
+            self.recorded += 1
+            if objects is not None:
+                entry['objects'] = objects
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def total(self, scene):
+        entry = self.entries[scene]
+        return entry['build'] + entry['render']
+
+    def object_model(self):
+        """(intercept, seconds per object) fitted over scenes with known object counts"""
+        points = [(entry['objects'], entry['build'] + entry['render'])
+                  for entry in self.entries.values() if entry.get('objects')]
+        if not points:
+            return None
+        n = len(points)
+        mean_x = sum(x for x, _ in points) / n
+        mean_y = sum(y for _, y in points) / n
+        var_x = sum((x - mean_x) ** 2 for x, _ in points)
+        if var_x == 0:
+            return 0.0, mean_y / mean_x
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+        if slope <= 0:
+            return mean_y, 0.0
+        return mean_y - slope * mean_x, slope
+
+    def estimate(self, scene, objects=None):
+        """Expected seconds to build and render scene"""
+        if scene in self.entries:
+            return self.total(scene)
+        model = self.object_model()
+        if model is not None and objects is not None:
+            intercept, slope = model
+            return max(intercept + slope * objects, 0.1)
+        if self.entries:
+            return sum(self.total(s) for s in self.entries) / len(self.entries)
+        return DEFAULT_ESTIMATE
+
+def lpt_schedule(estimates, workers):
+    """Deal scenes longest first to the least loaded worker
+
+    estimates maps scene -> expected seconds. Returns at most `workers`
+    non-empty (scenes, expected seconds) pairs.
+    """
+    loads = [[[], 0.0] for _ in range(max(workers, 1))]
+    for scene in sorted(estimates, key=lambda s: (-estimates[s], s)):
+        slot = min(loads, key=lambda load: load[1])
+        slot[0].append(scene)
+        slot[1] += estimates[scene]
+    return [(scenes, load) for scenes, load in loads if scenes]
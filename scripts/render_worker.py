@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Render Worker
+Keeps one Blender process warm and renders scenes on request.
+
+Start the worker once inside Blender; it imports a scene-selectable
+generator (default: generate_all_neon.py) and waits for jobs on a Unix
+socket:
+
+    blender --background --python scripts/render_worker.py -- serve
+
+Then send jobs from a plain Python shell. Each job pays only for building
+and rendering its scene, not for Blender startup:
+
+    python3 scripts/render_worker.py send thinking/token_stream.png
+    python3 scripts/render_worker.py send --reload --quality draft code/code_flow.png
+
+A job is one JSON line, e.g. {"scene": "thinking/token_stream.png",
+"output": "/tmp/out.png", "quality": "draft", "seed": 0, "reload": true};
+the worker answers each with one JSON line holding the status and the
+build and render times. {"command": "list"} returns the scene names and
+{"command": "shutdown"} stops the worker. With `serve --stdin` jobs are
+read from stdin and replies written to stdout instead of a socket.
+
+The send side does not import bpy.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import QUALITY_PRESETS, current_quality, restore, set_quality, snapshot
+from render_jobs import DEFAULT_OUTPUT_ROOT, blender_argv
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "generate_all_neon.py")
+DEFAULT_SOCKET = os.path.join(SCRIPT_DIR, "..", "render_worker.sock")
+
+def load_generator(script):
+    """Import a generator script as a module without running its main block"""
+    name = os.path.splitext(os.path.basename(script))[0]
+    spec = importlib.util.spec_from_file_location(name, script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class RenderWorker:
+    """Builds and renders scenes of one generator inside a warm Blender"""
+
+    def __init__(self, script, output_root=DEFAULT_OUTPUT_ROOT, quality=None):
+        self.script = os.path.abspath(script)
+        self.output_root = output_root
+        self.quality = quality or current_quality()
+        self.generator = load_generator(self.script)
+        self.running = True
+
+    def scenes(self):
+        return dict(self.generator.VISUALIZATIONS)
+
+    def handle(self, request):
+        """Run one request and return the reply"""
+        command = request.get('command', 'render')
+        if command == 'list':
+            return {'status': 'ok', 'scenes': list(self.scenes())}
+        if command == 'shutdown':
+            self.running = False
+            return {'status': 'ok'}
+        if command != 'render':
+            return {'status': 'error', 'error': f"Unknown command {command!r}"}
+        return self.render(request)
+
+    def render(self, request):
+        import bpy
+        from scene_builder import reset_scene
+        from scene_seeds import seed_scene
+
+        scene = request.get('scene')
+        quality = request.get('quality') or self.quality
+        if quality not in QUALITY_PRESETS:
+            return {'status': 'error', 'scene': scene, 'error': f"Unknown quality {quality!r}"}
+
+        # Pick up edits to the generator without restarting Blender
+        start = time.time()
+        if request.get('reload'):
+            self.generator = load_generator(self.script)
+        func = self.scenes().get(scene)
+        if func is None:
+            return {'status': 'error', 'scene': scene, 'error': f"Unknown scene {scene!r}"}
+        output = request.get('output') or os.path.join(self.output_root, scene)
+
+        # The generator's render_image applies the job's quality; undo it afterwards
+        saved = snapshot(bpy.context.scene)
+        reply = {'scene': scene, 'output': output, 'quality': quality}
+        try:
+            set_quality(quality)
+            seed_scene(scene, request.get('seed', DEFAULT_BASE_SEED))
+            build_start = time.time()
+            func()
+            reply['build'] = round(time.time() - build_start, 3)
+            render_start = time.time()
+            self.generator.render_image(output)
+            reply['render'] = round(time.time() - render_start, 3)
+            reply['status'] = 'done'
+        except Exception:
+            traceback.print_exc()
+            reply['status'] = 'failed'
+            reply['error'] = traceback.format_exc(limit=1).strip().splitlines()[-1]
+        finally:
+            set_quality(None)
+            restore(bpy.context.scene, saved)
+            reset_scene(log=False)
+        reply['total'] = round(time.time() - start, 3)
+        return reply
+
+def _handle_line(worker, line):
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {'status': 'error', 'error': f"Bad request: {e}"}
+    return worker.handle(request)
+
+def serve_socket(worker, path):
+    """Answer requests on a Unix socket until a shutdown request arrives"""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                reply = _handle_line(worker, line)
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+                self.wfile.flush()
+                if not worker.running:
+                    break
+
+    if os.path.exists(path):
+        os.unlink(path)
+    # Requests are handled one at a time on the main thread: bpy is not thread-safe
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        print(f"Render worker ready on {path}", flush=True)
+        try:
+            while worker.running:
+                server.handle_request()
+        finally:
+            os.unlink(path)
+
+def serve_stdin(worker):
+    """Answer requests read line by line from stdin"""
+    print("Render worker ready on stdin", flush=True)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        print(json.dumps(_handle_line(worker, line)), flush=True)
+        if not worker.running:
+            break
+
+def send(path, requests):
+    """Send requests to a running worker and return its replies"""
+    replies = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        stream = sock.makefile('rwb')
+        for request in requests:
+            stream.write((json.dumps(request) + "\n").encode())
+            stream.flush()
+            replies.append(json.loads(stream.readline()))
+    return replies
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Warm Blender render worker")
+    commands = parser.add_subparsers(dest='mode', required=True)
+
+    serve_parser = commands.add_parser('serve', help="Run the worker (inside Blender)")
+    serve_parser.add_argument('--script', default=DEFAULT_SCRIPT, help="Scene-selectable generator script")
+    serve_parser.add_argument('--output', default=DEFAULT_OUTPUT_ROOT, help="Default output root")
+    serve_parser.add_argument('--socket', default=DEFAULT_SOCKET, help="Unix socket to listen on")
+    serve_parser.add_argument('--stdin', action='store_true', help="Read jobs from stdin instead")
+    serve_parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                              help="Quality for jobs that name none (default: $GALLERY_QUALITY or final)")
+
+    send_parser = commands.add_parser('send', help="Send jobs to a running worker")
+    send_parser.add_argument('scenes', nargs='*', help="Scenes to render")
+    send_parser.add_argument('--socket', default=DEFAULT_SOCKET, help="Unix socket of the worker")
+    send_parser.add_argument('--output', help="Output path (single scene only)")
+    send_parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                             help="Quality preset (default: the worker's)")
+    send_parser.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED, help="Base seed")
+    send_parser.add_argument('--reload', action='store_true', help="Re-import the generator first")
+    send_parser.add_argument('--list', action='store_true', help="List the worker's scenes")
+    send_parser.add_argument('--shutdown', action='store_true', help="Stop the worker")
+    args = parser.parse_args(argv)
+
+    if args.mode == 'serve':
+        worker = RenderWorker(args.script, args.output, args.quality)
+        if args.stdin:
+            serve_stdin(worker)
+        else:
+            serve_socket(worker, os.path.abspath(args.socket))
+        return 0
+
+    if args.output and len(args.scenes) != 1:
+        parser.error("--output needs exactly one scene")
+    requests = []
+    if args.list:
+        requests.append({'command': 'list'})
+    for index, scene in enumerate(args.scenes):
+        requests.append({
+            'scene': scene,
+            'output': args.output,
+            'quality': args.quality,
+            'seed': args.seed,
+            'reload': args.reload and index == 0,
+        })
+    if args.shutdown:
+        requests.append({'command': 'shutdown'})
+
+    ok = True
+    for reply in send(os.path.abspath(args.socket), requests):
+        if 'scenes' in reply:
+            print("\n".join(reply['scenes']))
+        elif 'scene' in reply:
+            line = f"{reply['status']:<6} {reply['scene']}"
+            if 'build' in reply:
+                line += f" (build {reply['build']:.2f}s, render {reply.get('render', 0):.2f}s)"
+            print(f"{line} {reply.get('error', '')}".rstrip())
+        ok = ok and reply['status'] in ('ok', 'done')
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main(blender_argv() if '--' in sys.argv else sys.argv[1:]))
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Resolution Ladder
+Derives every image size the gallery serves from one master render.
+
+The final quality renders each scene once at MASTER_RESOLUTION (2160
+pixels wide); render_still() then hands the image to write_ladder(),
+which downsamples it with a Lanczos-3 filter into the ladder widths and
+writes them next to the scene's path:
+
+    token_stream_2160.png   master
+    token_stream.png        1080, the plain name existing links point at
+    token_stream_540.png
+    token_stream_270.png
+
+Each directory gets a manifest.json with the widths available per image,
+which gallery.js turns into srcset attributes. Draft and preview renders
+have no master resolution and write a single image as before; the variants
+and manifest entry of an earlier ladder of that image are removed, so the
+gallery never serves an older render next to the new one.
+
+Ladders can be built from existing renders without rendering, from a
+master or from an older 1080 image (which then tops the ladder):
+
+    blender --background --python scripts/resolution_ladder.py -- public/thinking/token_stream_2160.png
+"""
+import fcntl
+import json
+import os
+import sys
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MASTER_RESOLUTION = 2160
+LADDER_SIZES = (2160, 1080, 540, 270)
+# Width written under the plain file name
+DEFAULT_SIZE = 1080
+MANIFEST_NAME = "manifest.json"
+LANCZOS_LOBES = 3
+
+def variant_path(path, size):
+    """Path of the size-pixel-wide variant of the image at path"""
+    if size == DEFAULT_SIZE:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{size}{ext}"
+
+def lanczos_weights(in_size, out_size, lobes=LANCZOS_LOBES):
+    """(indices, weights), each (out_size, taps), resampling in_size samples to out_size"""
+    scale = in_size / out_size
+    stretch = max(scale, 1.0)
+    support = lobes * stretch
+    centers = (np.arange(out_size) + 0.5) * scale - 0.5
+    first = np.floor(centers - support).astype(np.int64) + 1
+    indices = first[:, None] + np.arange(int(np.ceil(2 * support)) + 1)
+    x = (indices - centers[:, None]) / stretch
+    weights = np.where(np.abs(x) < lobes, np.sinc(x) * np.sinc(x / lobes), 0.0)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.clip(indices, 0, in_size - 1), weights.astype(np.float32)
+
+def _resample_axis(image, size, axis):
+    indices, weights = lanczos_weights(image.shape[axis], size)
+    samples = np.moveaxis(image, axis, 0)
+    result = np.zeros((size,) + samples.shape[1:], dtype=np.float32)
+    shape = (size,) + (1,) * (samples.ndim - 1)
+    for tap in range(indices.shape[1]):
+        result += weights[:, tap].reshape(shape) * samples[indices[:, tap]]
+    return np.moveaxis(result, 0, axis)
+
+def resize(pixels, width, height):
+    """Lanczos-resize (H, W, 4) RGBA pixels, filtering color premultiplied by alpha"""
+    premultiplied = pixels.copy()
+    premultiplied[..., :3] *= pixels[..., 3:]
+    resized = _resample_axis(_resample_axis(premultiplied, height, 0), width, 1)
+    resized = np.clip(resized, 0.0, 1.0)
+    alpha = resized[..., 3:]
+    resized[..., :3] = np.where(alpha > 0, resized[..., :3] / np.maximum(alpha, 1e-6), 0.0)
+    return np.clip(resized, 0.0, 1.0)
+
+def _load_pixels(path):
+    import bpy
+
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(image)
+    return pixels.reshape(height, width, 4)
+
+def _save_png(pixels, path):
+    import bpy
+
+    height, width = pixels.shape[:2]
+    image = bpy.data.images.new("LadderVariant", width, height, alpha=True)
+    root, ext = os.path.splitext(path)
+    temp_path = f"{root}.ladder{ext}"
+    try:
+        image.pixels.foreach_set(np.ascontiguousarray(pixels).ravel())
+        image.filepath_raw = temp_path
+        image.file_format = 'PNG'
+        image.save()
+    finally:
+        bpy.data.images.remove(image)
+    os.replace(temp_path, path)
+
+def update_manifest(path, entry):
+    """Record entry (None: drop it) for the image at path in its directory's manifest
+
+    Returns the entry the manifest held for the image before.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    manifest = os.path.join(directory, MANIFEST_NAME)
+    name = os.path.basename(path)
+    # Lock next to the manifest, so boxes sharing the output root serialize too
+    with open(manifest + ".lock", 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(manifest) as f:
+                images = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            images = {}
+        previous = images.pop(name, None)
+        if entry is None and previous is None:
+            return None
+        if entry is not None:
+            images[name] = entry
+        temp_path = f"{manifest}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(images, f, indent=2, sort_keys=True)
+        os.replace(temp_path, manifest)
+    return previous
+
+def _remove_stale_variants(path, previous, keep):
+    """Delete the variants of path an earlier ladder wrote that are not in keep"""
+    stale = {variant_path(path, size) for size in LADDER_SIZES}
+    if previous:
+        directory = os.path.dirname(path)
+        stale.update(os.path.join(directory, name) for name in previous.get('variants', {}).values())
+    for variant in sorted(stale - set(keep)):
+        if os.path.exists(variant):
+            os.remove(variant)
+            print(f"Ladder: removed stale {os.path.basename(variant)}")
+
+def drop_ladder(path):
+    """Forget the ladder of path after a single image was rendered there
+
+    Draft and preview renders write only the plain file; the larger
+    variants and the manifest entry of an earlier final render would
+    otherwise keep serving the old image.
+    """
+    manifest = os.path.join(os.path.dirname(os.path.abspath(path)), MANIFEST_NAME)
+    previous = update_manifest(path, None) if os.path.exists(manifest) else None
+    _remove_stale_variants(path, previous, {path})
+
+def write_ladder(source, path, sizes=LADDER_SIZES):
+    """Write the ladder of path from the master image at source; return path
+
+    The master is kept at its own width, and smaller ladder widths are
+    derived from it. A master narrower than DEFAULT_SIZE becomes the plain
+    file itself. source is removed unless it is one of the outputs, and so
+    are the variants of an earlier, larger ladder of path.
+    """
+    pixels = _load_pixels(source)
+    height, width = pixels.shape[:2]
+    variants = {}
+    written = set()
+    for size in sorted({size for size in sizes if size < width} | {width}, reverse=True):
+        target = path if size == width < DEFAULT_SIZE else variant_path(path, size)
+        if size == width:
+            resized = pixels
+        else:
+            resized = resize(pixels, size, max(1, round(size * height / width)))
+        _save_png(resized, target)
+        variants[str(size)] = os.path.basename(target)
+        written.add(target)
+        print(f"Ladder: {os.path.basename(target)} ({resized.shape[1]}x{resized.shape[0]})")
+
+    if source not in written and os.path.exists(source):
+        os.remove(source)
+    previous = update_manifest(path, {'width': width, 'height': height, 'variants': variants})
+    _remove_stale_variants(path, previous, written)
+    return path
+
+if __name__ == "__main__":
+    sys.path.insert(0, SCRIPT_DIR)
+    from render_jobs import blender_argv
+
+    for master in blender_argv():
+        root, ext = os.path.splitext(master)
+        suffix = f"_{MASTER_RESOLUTION}"
+        plain = (root[:-len(suffix)] if root.endswith(suffix) else root) + ext
+        write_ladder(master, plain)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Scene Builder
+Creates primitive objects through bpy.data instead of bpy.ops operators.
+
+Each primitive shape is built once into a template mesh with bmesh, so adding
+an object never goes through the operator stack or triggers a depsgraph update.
+Objects of the same shape share that template mesh datablock and only differ in
+their transform; materials are linked to the object instead of the shared mesh
+(see assign_material). The add_* functions mirror the keyword arguments of
+bpy.ops.mesh.primitive_*_add and return the new object.
+
+add_polylines sweeps lists of points into beveled tubes of a single curve
+object, and add_connections uses it to write every edge of a graph as one
+spline, so a line or an edge costs a spline instead of an object, mesh and
+material.
+
+reset_scene replaces the select-all/delete clear_scene of the generators and
+also purges the datablocks a scene leaves behind, so long batches in one
+Blender process run with bounded memory.
+"""
+import bpy
+import bmesh
+import math
+
+# Template meshes keyed by (shape, parameters)
+_TEMPLATES = {}
+
+# Images the render pipeline owns and which must never be purged
+_PROTECTED_IMAGE_TYPES = ('RENDER_RESULT', 'COMPOSITING')
+
+# bpy.data collections that reset_scene counts and purges
+DATABLOCK_TYPES = (
+    'objects', 'meshes', 'materials', 'curves', 'fonts', 'images',
+    'node_groups', 'metaballs', 'cameras', 'lights',
+)
+
+def _build_torus(bm, major_radius, minor_radius, major_segments, minor_segments):
+    """Fill bm with a torus laid out like primitive_torus_add"""
+    verts = []
+    for i in range(major_segments):
+        angle = 2 * math.pi * i / major_segments
+        for j in range(minor_segments):
+            minor_angle = 2 * math.pi * j / minor_segments
+            ring = major_radius + minor_radius * math.cos(minor_angle)
+            verts.append(bm.verts.new((
+                ring * math.cos(angle),
+                ring * math.sin(angle),
+                minor_radius * math.sin(minor_angle)
+            )))
+
+    for i in range(major_segments):
+        next_i = (i + 1) % major_segments
+        for j in range(minor_segments):
+            next_j = (j + 1) % minor_segments
+            bm.faces.new((
+                verts[i * minor_segments + j],
+                verts[next_i * minor_segments + j],
+                verts[next_i * minor_segments + next_j],
+                verts[i * minor_segments + next_j]
+            ))
+
+def _build_template(shape, params):
+    bm = bmesh.new()
+    if shape == 'cube':
+        bmesh.ops.create_cube(bm, size=params['size'])
+    elif shape == 'uv_sphere':
+        bmesh.ops.create_uvsphere(
+            bm,
+            u_segments=params['segments'],
+            v_segments=params['ring_count'],
+            radius=params['radius']
+        )
+    elif shape == 'ico_sphere':
+        bmesh.ops.create_icosphere(
+            bm,
+            subdivisions=params['subdivisions'],
+            radius=params['radius']
+        )
+    elif shape in ('cylinder', 'cone'):
+        bmesh.ops.create_cone(
+            bm,
+            cap_ends=True,
+            segments=params['vertices'],
+            radius1=params['radius1'],
+            radius2=params['radius2'],
+            depth=params['depth']
+        )
+    elif shape == 'torus':
+        _build_torus(
+            bm,
+            params['major_radius'],
+            params['minor_radius'],
+            params['major_segments'],
+            params['minor_segments']
+        )
+    else:
+        bm.free()
+        raise ValueError(f"Unknown primitive shape: {shape}")
+
+    mesh = bpy.data.meshes.new(f"Template_{shape}")
+    bm.to_mesh(mesh)
+    bm.free()
+    # Keep templates alive when scenes are cleared
+    mesh.use_fake_user = True
+    return mesh
+
+def get_template_mesh(shape, **params):
+    """Return the cached template mesh for a shape, building it on first use"""
+    key = (shape, tuple(sorted(params.items())))
+    mesh = _TEMPLATES.get(key)
+    if mesh is not None:
+        try:
+            mesh.name  # Raises if the datablock was removed
+            return mesh
+        except ReferenceError:
+            pass
+    mesh = _build_template(shape, params)
+    _TEMPLATES[key] = mesh
+    return mesh
+
+def add_object(name, mesh, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+    """Link a new object using mesh into the active collection"""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+def add_primitive(shape, name, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+                  shared=True, **params):
+    """Create an object for shape, sharing the template mesh unless shared is False"""
+    mesh = get_template_mesh(shape, **params)
+    if not shared:
+        # Private copy for callers that edit the mesh data itself
+        mesh = mesh.copy()
+        mesh.name = name
+        mesh.use_fake_user = False
+    return add_object(name, mesh, location, rotation, scale)
+
+def assign_material(obj, mat):
+    """Set the first material slot of obj at object level
+
+    Linking per object keeps shared meshes untouched, so objects that only
+    differ in color can still use one mesh datablock.
+    """
+    if not obj.material_slots:
+        obj.data.materials.append(None)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
+
+def add_cube(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), size=2.0, name="Cube", shared=True):
+    return add_primitive('cube', name, location, rotation, scale, shared, size=size)
+
+def add_uv_sphere(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+                  segments=32, ring_count=16, radius=1.0, name="Sphere", shared=True):
+    return add_primitive('uv_sphere', name, location, rotation, scale, shared,
+                         segments=segments, ring_count=ring_count, radius=radius)
+
+def add_ico_sphere(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+                   subdivisions=2, radius=1.0, name="Icosphere", shared=True):
+    return add_primitive('ico_sphere', name, location, rotation, scale, shared,
+                         subdivisions=subdivisions, radius=radius)
+
+def add_cylinder(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+                 vertices=32, radius=1.0, depth=2.0, name="Cylinder", shared=True):
+    return add_primitive('cylinder', name, location, rotation, scale, shared,
+                         vertices=vertices, radius1=radius, radius2=radius, depth=depth)
+
+def add_cone(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+             vertices=32, radius1=1.0, radius2=0.0, depth=2.0, name="Cone", shared=True):
+    return add_primitive('cone', name, location, rotation, scale, shared,
+                         vertices=vertices, radius1=radius1, radius2=radius2, depth=depth)
+
+def add_torus(location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1),
+              major_radius=1.0, minor_radius=0.25, major_segments=48, minor_segments=12,
+              name="Torus", shared=True):
+    return add_primitive('torus', name, location, rotation, scale, shared,
+                         major_radius=major_radius, minor_radius=minor_radius,
+                         major_segments=major_segments, minor_segments=minor_segments)
+
+def add_polylines(name, polylines, radius=0.02, bevel_resolution=4, material=None, cyclic=False):
+    """Create one curve object with a tube of the given radius along each point list"""
+    curve = bpy.data.curves.new(name, 'CURVE')
+    curve.dimensions = '3D'
+    curve.bevel_depth = radius
+    curve.bevel_resolution = bevel_resolution
+    curve.use_fill_caps = True
+
+    for points in polylines:
+        spline = curve.splines.new('POLY')
+        spline.points.add(len(points) - 1)
+        spline.points.foreach_set("co", [c for point in points for c in (*point, 1.0)])
+        spline.use_cyclic_u = cyclic
+
+    obj = bpy.data.objects.new(name, curve)
+    bpy.context.collection.objects.link(obj)
+    if material is not None:
+        curve.materials.append(material)
+    return obj
+
+def add_polyline(name, points, radius=0.02, bevel_resolution=4, material=None, cyclic=False):
+    """Create a single tube along points"""
+    return add_polylines(name, [points], radius, bevel_resolution, material, cyclic)
+
+def add_connections(name, edges, bevel_depth=0.01, bevel_resolution=4, material=None):
+    """Create one curve object with a straight spline per (start, end) edge"""
+    return add_polylines(name, edges, bevel_depth, bevel_resolution, material)
+
+def datablock_counts():
+    """Number of datablocks per tracked bpy.data collection"""
+    return {name: len(getattr(bpy.data, name)) for name in DATABLOCK_TYPES}
+
+def purge_orphans():
+    """Remove unused datablocks until none are left, return how many were removed
+
+    Removing meshes frees their materials, so this repeats until a pass
+    finds nothing. Fake-user datablocks (templates, pooled materials) stay.
+    """
+    removed = 0
+    while True:
+        orphans = [
+            block
+            for name in DATABLOCK_TYPES
+            for block in getattr(bpy.data, name)
+            if block.users == 0
+            and getattr(block, 'type', None) not in _PROTECTED_IMAGE_TYPES
+        ]
+        if not orphans:
+            return removed
+        bpy.data.batch_remove(orphans)
+        removed += len(orphans)
+
+def reset_scene(purge=True, log=True):
+    """Delete every object in the scene and optionally purge orphan datablocks"""
+    before = datablock_counts()
+    bpy.data.batch_remove(list(bpy.context.scene.objects))
+    removed = purge_orphans() if purge else 0
+
+    if log:
+        after = datablock_counts()
+        changes = ", ".join(
+            f"{name} {before[name]}->{after[name]}"
+            for name in DATABLOCK_TYPES
+            if before[name] or after[name]
+        )
+        print(f"Scene reset: purged {removed} orphans ({changes})")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Scene Description
+Exports a built neon scene as plain JSON for the NumPy rasterizer.
+
+Everything is resolved to world space so the rasterizer (neon_raster.py)
+never needs Blender:
+
+    camera       world matrix, projection type, lens, sensor and ortho scale
+    background   linear RGB of the world background
+    primitives   spheres (center, radius), convex hulls (points) and tubes
+                 (points, radius, cyclic), each with a linear emission color
+                 and strength
+
+Template spheres become spheres and other template meshes convex hulls of
+their vertices; tori and curves become tubes, Geometry Nodes point
+instances become one sphere per point, and anything else (text, edited
+meshes) the hull of its bounding box.
+"""
+import json
+import math
+import os
+
+import bpy
+from mathutils import Vector
+
+from material_pool import NEON_COLOR_ATTRIBUTE, NEON_STRENGTH_ATTRIBUTE
+from point_instancer import POINT_NODE_GROUP
+
+DESCRIPTION_VERSION = 1
+# Hull vertices kept per mesh; silhouettes of the templates need no more
+MAX_HULL_POINTS = 64
+RING_POINTS = 32
+SPHERE_SHAPES = ('uv_sphere', 'ico_sphere')
+
+def _vector(v):
+    return [round(float(c), 5) for c in v]
+
+def _template_shape(mesh):
+    """Primitive shape of a scene_builder template mesh, or None"""
+    if not mesh.name.startswith("Template_"):
+        return None
+    return mesh.name[len("Template_"):].split('.')[0]
+
+def _material_emission(material):
+    """(color, strength) of a material's emission, or its base color with strength 0"""
+    if material is None or not material.use_nodes:
+        return [1.0, 1.0, 1.0], 0.0
+    nodes = material.node_tree.nodes
+    for node in nodes:
+        if node.type == 'EMISSION':
+            return _vector(node.inputs['Color'].default_value[:3]), float(node.inputs['Strength'].default_value)
+    for node in nodes:
+        if node.type == 'BSDF_PRINCIPLED':
+            strength = float(node.inputs['Emission Strength'].default_value)
+            if strength > 0:
+                emission = node.inputs.get("Emission Color") or node.inputs["Emission"]
+                return _vector(emission.default_value[:3]), strength
+            return _vector(node.inputs['Base Color'].default_value[:3]), 0.0
+    return [1.0, 1.0, 1.0], 0.0
+
+def object_emission(obj):
+    """(color, strength) an object glows with"""
+    if NEON_COLOR_ATTRIBUTE in obj.keys():
+        return _vector(obj[NEON_COLOR_ATTRIBUTE]), float(obj[NEON_STRENGTH_ATTRIBUTE])
+    material = obj.material_slots[0].material if obj.material_slots else None
+    if material is None and getattr(obj.data, 'materials', None):
+        material = obj.data.materials[0]
+    return _material_emission(material)
+
+def _hull_points(obj, coords):
+    step = max(1, math.ceil(len(coords) / MAX_HULL_POINTS))
+    return [_vector(obj.matrix_world @ Vector(co)) for co in coords[::step]]
+
+def _mesh_primitives(obj, color, strength):
+    mesh = obj.data
+    shape = _template_shape(mesh)
+    matrix = obj.matrix_world
+    scale = max(abs(s) for s in matrix.to_scale())
+
+    if obj.modifiers.get(POINT_NODE_GROUP):
+        scales = [0.0] * len(mesh.vertices)
+        strengths = [0.0] * len(mesh.vertices)
+        colors = [0.0] * (4 * len(mesh.vertices))
+        mesh.attributes['scale'].data.foreach_get('value', scales)
+        mesh.attributes[NEON_STRENGTH_ATTRIBUTE].data.foreach_get('value', strengths)
+        mesh.attributes[NEON_COLOR_ATTRIBUTE].data.foreach_get('color', colors)
+        return [{
+            'kind': 'sphere',
+            'center': _vector(matrix @ vertex.co),
+            'radius': round(scales[i] * scale, 5),
+            'color': _vector(colors[4 * i:4 * i + 3]),
+            'strength': strengths[i],
+        } for i, vertex in enumerate(mesh.vertices)]
+
+    if shape in SPHERE_SHAPES:
+        return [{
+            'kind': 'sphere',
+            'center': _vector(matrix.translation),
+            'radius': round(max(mesh.vertices[0].co.length, 1e-6) * scale, 5),
+            'color': color,
+            'strength': strength,
+        }]
+    if shape == 'torus':
+        minor = max(v.co.z for v in mesh.vertices)
+        major = max(v.co.x for v in mesh.vertices) - minor
+        ring = [Vector((major * math.cos(a), major * math.sin(a), 0))
+                for a in (2 * math.pi * i / RING_POINTS for i in range(RING_POINTS))]
+        return [{
+            'kind': 'tube',
+            'points': [_vector(matrix @ co) for co in ring],
+            'radius': round(minor * scale, 5),
+            'cyclic': True,
+            'color': color,
+            'strength': strength,
+        }]
+    coords = [v.co for v in mesh.vertices] if shape else [Vector(c) for c in obj.bound_box]
+    return [{'kind': 'hull', 'points': _hull_points(obj, coords), 'color': color, 'strength': strength}]
+
+def _curve_primitives(obj, color, strength):
+    curve = obj.data
+    matrix = obj.matrix_world
+    radius = curve.bevel_depth * max(abs(s) for s in matrix.to_scale())
+    primitives = []
+    for spline in curve.splines:
+        points = spline.points if spline.type == 'POLY' else spline.bezier_points
+        primitives.append({
+            'kind': 'tube',
+            'points': [_vector(matrix @ Vector(point.co[:3])) for point in points],
+            'radius': round(max(radius, 0.005), 5),
+            'cyclic': spline.use_cyclic_u,
+            'color': color,
+            'strength': strength,
+        })
+    return primitives
+
+def _camera(scene):
+    camera = scene.camera
+    return {
+        'matrix': [_vector(row) for row in camera.matrix_world],
+        'type': camera.data.type,
+        'lens': camera.data.lens,
+        'sensor_width': camera.data.sensor_width,
+        'sensor_height': camera.data.sensor_height,
+        'sensor_fit': camera.data.sensor_fit,
+        'ortho_scale': camera.data.ortho_scale,
+    }
+
+def _background(scene):
+    world = scene.world
+    if world is None or not world.use_nodes:
+        return [0.0, 0.0, 0.0]
+    for node in world.node_tree.nodes:
+        if node.type == 'BACKGROUND':
+            strength = node.inputs['Strength'].default_value
+            return _vector(c * strength for c in node.inputs['Color'].default_value[:3])
+    return [0.0, 0.0, 0.0]
+
+def describe_scene(scene):
+    """JSON-ready description of scene's camera, background and primitives"""
+    render = scene.render
+    percentage = render.resolution_percentage / 100
+    primitives = []
+    for obj in scene.objects:
+        if obj.hide_render or not obj.visible_get():
+            continue
+        color, strength = object_emission(obj)
+        if obj.type == 'MESH':
+            primitives.extend(_mesh_primitives(obj, color, strength))
+        elif obj.type == 'CURVE':
+            primitives.extend(_curve_primitives(obj, color, strength))
+        elif obj.type in ('FONT', 'SURFACE', 'META'):
+            coords = [Vector(c) for c in obj.bound_box]
+            primitives.append({'kind': 'hull', 'points': _hull_points(obj, coords),
+                               'color': color, 'strength': strength})
+    return {
+        'version': DESCRIPTION_VERSION,
+        'resolution': [round(render.resolution_x * percentage), round(render.resolution_y * percentage)],
+        'background': _background(scene),
+        'camera': _camera(scene),
+        'primitives': primitives,
+    }
+
+def write_description(path, scene=None):
+    """Describe scene (default: the current one) into the JSON file at path"""
+    description = describe_scene(scene or bpy.context.scene)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(description, f, separators=(',', ':'))
+    return description
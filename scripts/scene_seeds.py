@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Scene Seeds
+Deterministic random state per visualization.
+
+Scenes draw from the global `random` module (and numpy.random). Reseeding
+both from a hash of the scene key before every scene gives each scene its
+own random stream. Output then no longer depends on which scenes ran before
+it, so any subset renders identically in any order or worker process.
+"""
+import hashlib
+import random
+
+# Change with --seed to get a different but still reproducible gallery
+DEFAULT_BASE_SEED = 0
+
+def scene_seed(scene, base_seed=DEFAULT_BASE_SEED):
+    """Stable 32-bit seed for a scene key such as 'thinking/token_stream.png'"""
+    digest = hashlib.sha256(f"{base_seed}:{scene}".encode()).digest()
+    return int.from_bytes(digest[:4], 'big')
+
+def seed_scene(scene, base_seed=DEFAULT_BASE_SEED):
+    """Seed `random` and numpy.random for scene and return the seed"""
+    seed = scene_seed(scene, base_seed)
+    random.seed(seed)
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        numpy.random.seed(seed)
+    return seed
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 import bpy
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
 
 # Configure scene
 bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
@@ -9,8 +15,7 @@ bpy.context.scene.render.resolution_y = 1080
 bpy.context.scene.render.film_transparent = False
 
 # Clear everything
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
 
 # Set up world for pure white
 world = bpy.data.worlds['World']
@@ -85,6 +90,6 @@ sun.data.energy = 0.5
 
 # Render
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/test_white.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Test render complete!")
\ No newline at end of file
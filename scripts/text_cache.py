@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Text Cache
+Loads fonts once per process and converts each distinct label to a mesh once.
+
+Text objects re-parse their font and re-evaluate the text curve every time
+the depsgraph updates. Here a (text, size, font) key is turned into a mesh
+the first time it is needed; every later label with the same key is a new
+object sharing that mesh, so label-heavy scenes neither reload fonts nor
+evaluate text curves again.
+"""
+import bpy
+import os
+
+from scene_builder import add_object
+
+DEFAULT_FONT = "/usr/share/fonts/google-noto-vf/NotoSans[wght].ttf"
+
+_FONTS = {}
+_TEXT_MESHES = {}
+
+def _alive(block):
+    if block is None:
+        return False
+    try:
+        block.name  # Raises if the datablock was removed
+        return True
+    except ReferenceError:
+        return False
+
+def get_font(path=DEFAULT_FONT):
+    """Return the loaded font for path, or None to use Blender's built-in font"""
+    if not path or not os.path.exists(path):
+        return None
+    font = _FONTS.get(path)
+    if not _alive(font):
+        font = bpy.data.fonts.load(path, check_existing=True)
+        font.use_fake_user = True
+        _FONTS[path] = font
+    return font
+
+def get_text_mesh(text, size=1.0, font_path=DEFAULT_FONT):
+    """Return a mesh of text, converting the text curve only on the first request"""
+    font = get_font(font_path)
+    key = (text, round(size, 4), font.name if font else None)
+    mesh = _TEXT_MESHES.get(key)
+    if _alive(mesh):
+        return mesh
+
+    curve = bpy.data.curves.new(f"Text_{text}", 'FONT')
+    curve.body = text
+    curve.size = size
+    if font is not None:
+        curve.font = font
+
+    # Evaluate the text curve once through a temporary object
+    temp = bpy.data.objects.new(curve.name, curve)
+    bpy.context.collection.objects.link(temp)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(temp.evaluated_get(depsgraph))
+    mesh.name = f"Text_{text}"
+    mesh.use_fake_user = True
+    bpy.data.objects.remove(temp)
+    bpy.data.curves.remove(curve)
+
+    _TEXT_MESHES[key] = mesh
+    return mesh
+
+def add_text(text, location=(0, 0, 0), size=1.0, font_path=DEFAULT_FONT, name="Text"):
+    """Create a text object that shares the cached mesh for text"""
+    return add_object(name, get_text_mesh(text, size, font_path), location)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tiled Render
+Renders one scene at poster resolution as tiles in parallel Blender workers.
+
+The image is cut into a grid of tiles. Every worker builds the same scene
+(same seed, same camera) and renders only its tile through render.border
+with crop, plus an overlap on the inner edges so denoising and glow see
+their neighbourhood. The tiles are then cropped to their core and pasted
+into the final PNG without resampling or recompression.
+
+    python3 scripts/tiled_render.py --resolution 8192 --grid 4 memory/knowledge_graph.png code_universe.png
+
+Inside Blender, render_still() renders a tile instead of the whole image
+when it gets `--tile COLUMN,ROW,GRID --resolution WIDTH --tile-output PATH`
+after `--`, so standalone generators can be tiled with --script too.
+
+Eevee's screen-space effects reach at most the overlap into a neighbouring
+tile; Cycles scenes stitch seamlessly.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import QUALITY_PRESETS, blender_option
+from render_jobs import DEFAULT_OUTPUT_ROOT, blender_command
+from scene_seeds import DEFAULT_BASE_SEED
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "generate_all_neon.py")
+DEFAULT_LOG_DIR = os.path.join(SCRIPT_DIR, "..", "render_logs", "tiles")
+
+DEFAULT_OVERLAP = 32
+
+def tile_rect(width, height, column, row, grid, overlap=DEFAULT_OVERLAP):
+    """Pixel rectangles of a tile: its core and the overlapping region rendered
+
+    Rectangles are (x0, y0, x1, y1) with y measured from the bottom, as in
+    Blender's render border. Row 0 is the bottom row.
+    """
+    x0, x1 = width * column // grid, width * (column + 1) // grid
+    y0, y1 = height * row // grid, height * (row + 1) // grid
+    core = (x0, y0, x1, y1)
+    rendered = (max(0, x0 - overlap), max(0, y0 - overlap),
+                min(width, x1 + overlap), min(height, y1 + overlap))
+    return core, rendered
+
+def current_tile():
+    """(column, row, grid, width, overlap, output) from Blender's argv, or None"""
+    tile = blender_option('tile')
+    if tile is None:
+        return None
+    column, row, grid = (int(part) for part in tile.split(','))
+    return (column, row, grid, int(blender_option('resolution')),
+            int(blender_option('overlap') or DEFAULT_OVERLAP), blender_option('tile-output'))
+
+def apply_tile(scene, tile):
+    """Set scene up to render only its tile; return the tile's image path"""
+    column, row, grid, width, overlap, output = tile
+    render = scene.render
+    height = round(width * render.resolution_y / render.resolution_x)
+    render.resolution_x, render.resolution_y = width, height
+    render.resolution_percentage = 100
+
+    core, rendered = tile_rect(width, height, column, row, grid, overlap)
+    # Blender truncates border * resolution to whole pixels: aim a quarter pixel in
+    x0, y0, x1, y1 = rendered
+    render.use_border = True
+    render.use_crop_to_border = True
+    render.border_min_x, render.border_max_x = (x0 + 0.25) / width, (x1 + 0.25) / width
+    render.border_min_y, render.border_max_y = (y0 + 0.25) / height, (y1 + 0.25) / height
+    render.filepath = output
+
+    with open(output + ".json", 'w') as f:
+        json.dump({'width': width, 'height': height, 'core': core, 'rendered': rendered}, f)
+    return output
+
+def stitch(tile_paths, output):
+    """Paste the cores of rendered tiles into one PNG at output"""
+    from PIL import Image
+
+    canvas = None
+    for path in tile_paths:
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        width, height = meta['width'], meta['height']
+        cx0, cy0, cx1, cy1 = meta['core']
+        rx0, ry0, rx1, ry1 = meta['rendered']
+        tile = Image.open(path)
+        if tile.size != (rx1 - rx0, ry1 - ry0):
+            raise RuntimeError(f"{path} is {tile.size[0]}x{tile.size[1]}, "
+                               f"expected {rx1 - rx0}x{ry1 - ry0}")
+        if canvas is None:
+            canvas = Image.new(tile.mode, (width, height))
+        # Images count rows from the top, the render border from the bottom
+        core = tile.crop((cx0 - rx0, ry1 - cy1, cx1 - rx0, ry1 - cy0))
+        canvas.paste(core, (cx0, height - cy1))
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    temp_path = f"{output}.stitching.png"
+    canvas.save(temp_path, optimize=False)
+    os.replace(temp_path, output)
+    return canvas.size
+
+def tile_jobs(args, scene, tile_dir, log_dir):
+    name = (scene or os.path.basename(args.script)).replace(os.sep, '__')
+    jobs = []
+    for row in range(args.grid):
+        for column in range(args.grid):
+            tile = f"{column},{row},{args.grid}"
+            path = os.path.join(tile_dir, f"{name}.{column}_{row}.png")
+            options = ['--tile', tile, '--resolution', str(args.resolution),
+                       '--overlap', str(args.overlap), '--tile-output', path]
+            if scene:
+                options += ['--output', args.output, '--seed', str(args.seed), '--force', scene]
+            if args.quality:
+                options += ['--quality', args.quality]
+            jobs.append({
+                'name': f"{name} tile {tile}",
+                'path': path,
+                'command': blender_command(args.blender, args.script, options),
+                'log': os.path.join(log_dir, f"{name}.{column}_{row}.log"),
+            })
+    return jobs
+
+def run_tile(job):
+    start = time.time()
+    with open(job['log'], 'w') as log:
+        job['returncode'] = subprocess.call(job['command'], stdout=log, stderr=subprocess.STDOUT)
+    job['duration'] = time.time() - start
+    job['ok'] = job['returncode'] == 0 and os.path.exists(job['path'])
+    return job
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render scenes at poster resolution in parallel tiles")
+    parser.add_argument('scenes', nargs='*', help="Scenes of --script to render (none for a standalone script)")
+    parser.add_argument('--resolution', type=int, default=8192, help="Output width in pixels (default: 8192)")
+    parser.add_argument('--grid', type=int, default=4, help="Tiles per side (default: 4, i.e. 16 tiles)")
+    parser.add_argument('--overlap', type=int, default=DEFAULT_OVERLAP,
+                        help=f"Extra pixels rendered on inner tile edges (default: {DEFAULT_OVERLAP})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Parallel Blender processes")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="Blender executable (default: $BLENDER or blender)")
+    parser.add_argument('--script', default=DEFAULT_SCRIPT, help="Generator script")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_ROOT,
+                        help="Output root for scenes, or the output PNG for a standalone script")
+    parser.add_argument('--seed', type=int, default=DEFAULT_BASE_SEED, help="Base seed")
+    parser.add_argument('--quality', choices=list(QUALITY_PRESETS),
+                        help="Quality preset for every tile (default: $GALLERY_QUALITY or final)")
+    parser.add_argument('--log-dir', default=DEFAULT_LOG_DIR, help="Directory for tiles and logs")
+    parser.add_argument('--keep-tiles', action='store_true', help="Keep the tile images")
+    args = parser.parse_args(argv)
+
+    log_dir = os.path.abspath(args.log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+    failed = False
+    for scene in args.scenes or [None]:
+        suffix = f"_{args.resolution}"
+        if scene:
+            root, ext = os.path.splitext(os.path.join(args.output, scene))
+        else:
+            root, ext = os.path.splitext(args.output)
+        output = f"{root}{suffix}{ext or '.png'}"
+
+        jobs = tile_jobs(args, scene, log_dir, log_dir)
+        print(f"Rendering {scene or args.script} as {len(jobs)} tiles on {args.workers} workers")
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            jobs = list(pool.map(run_tile, jobs))
+        broken = [job for job in jobs if not job['ok']]
+        if broken:
+            for job in broken:
+                print(f"  FAILED {job['name']} (see {job['log']})")
+            failed = True
+            continue
+
+        width, height = stitch([job['path'] for job in jobs], output)
+        slowest = max(job['duration'] for job in jobs)
+        print(f"Saved {output} ({width}x{height}) in {time.time() - start:.1f}s, slowest tile {slowest:.1f}s")
+        if not args.keep_tiles:
+            for job in jobs:
+                os.remove(job['path'])
+                os.remove(job['path'] + ".json")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 import bpy
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cycles_profile import apply_cycles_profile
+from quality_presets import render_still
+from scene_builder import reset_scene
 
 # Use Cycles for better background control
 bpy.context.scene.render.engine = 'CYCLES'
-bpy.context.scene.cycles.samples = 32  # Faster rendering
 bpy.context.scene.render.resolution_x = 1080
 bpy.context.scene.render.resolution_y = 1080
 
 # Clear everything
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+reset_scene()
 
 # Set viewport shading to solid with white background
 for area in bpy.context.screen.areas:
@@ -96,7 +101,8 @@ sun = bpy.context.object
 sun.data.energy = 0.3
 
 # Render
+apply_cycles_profile(bpy.context.scene, max_samples=32)
 bpy.context.scene.render.filepath = '/home/franz/dev/claude-vision-gallery/test_cycles_white.png'
-bpy.ops.render.render(write_still=True)
+render_still()
 
 print("Cycles white background test complete!")
\ No newline at end of file
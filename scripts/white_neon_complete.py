@@ -3,6 +3,12 @@ import bpy
 import math
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from quality_presets import render_still
+from scene_builder import reset_scene
+from scene_seeds import seed_scene
 
 # Clear old images first
 base_path = "/home/franz/dev/claude-vision-gallery/public/"
@@ -22,8 +28,7 @@ def setup_white_scene():
     bpy.context.scene.render.film_transparent = False
     
     # Clear scene
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    reset_scene()
     
     # WHITE BACKGROUND!
     world = bpy.data.worlds['World']
@@ -92,6 +97,7 @@ COLORS = [
 
 # Create token stream
 setup_white_scene()
+seed_scene("thinking/token_stream.png")
 
 # Camera
 bpy.ops.object.camera_add(location=(0, -12, 0))
@@ -125,11 +131,12 @@ for i in range(60):
 # Render
 os.makedirs(os.path.dirname(base_path + "thinking/"), exist_ok=True)
 bpy.context.scene.render.filepath = base_path + "thinking/token_stream.png"
-bpy.ops.render.render(write_still=True)
+render_still()
 print("Token Stream complete!")
 
 # Create Attention Matrix
 setup_white_scene()
+seed_scene("thinking/attention_matrix.png")
 
 # Camera
 bpy.ops.object.camera_add(location=(0, -12, 0))
@@ -162,11 +169,12 @@ for i in range(10):
 
 # Render
 bpy.context.scene.render.filepath = base_path + "thinking/attention_matrix.png"
-bpy.ops.render.render(write_still=True)
+render_still()
 print("Attention Matrix complete!")
 
 # Context Window
 setup_white_scene()
+seed_scene("thinking/context_window.png")
 
 # Camera
 bpy.ops.object.camera_add(location=(8, -8, 6))
@@ -210,7 +218,7 @@ center.data.materials.append(get_neon_mat('Center', COLORS[0]))
 
 # Render
 bpy.context.scene.render.filepath = base_path + "thinking/context_window.png"
-bpy.ops.render.render(write_still=True)
+render_still()
 print("Context Window complete!")
 
 print("\nAll visualizations rendered with WHITE backgrounds!")
\ No newline at end of file
@@ -0,0 +1,26 @@
+import os
+import sys
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+sys.path.insert(0, os.path.abspath(SCRIPTS_DIR))
+
+def neon_description():
+    """A 100x100 orthographic view down -Z: pixel = (50 + 10x, 50 - 10y)"""
+    identity = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    return {
+        'version': 1,
+        'resolution': [100, 100],
+        'background': [0, 0, 0],
+        'camera': {'matrix': identity, 'type': 'ORTHO', 'lens': 50, 'sensor_width': 36,
+                   'sensor_height': 24, 'sensor_fit': 'AUTO', 'ortho_scale': 10},
+        'primitives': [
+            # A blue square behind a red sphere
+            {'kind': 'hull', 'points': [[x, y, -8] for x in (-2, 2) for y in (-2, 2)],
+             'color': [0, 0, 1], 'strength': 1},
+            {'kind': 'sphere', 'center': [0, 0, -5], 'radius': 1, 'color': [1, 0, 0], 'strength': 1},
+            {'kind': 'tube', 'points': [[-3, 3, -5], [3, 3, -5]], 'radius': 0.2,
+             'color': [0, 1, 0], 'strength': 1},
+            # Behind the camera
+            {'kind': 'sphere', 'center': [3, -3, 5], 'radius': 1, 'color': [1, 1, 1], 'strength': 1},
+        ],
+    }
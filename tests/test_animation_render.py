@@ -0,0 +1,15 @@
+import pytest
+
+from animation_render import frame_ranges
+
+@pytest.mark.parametrize('frames, workers', [(120, 1), (120, 8), (121, 8), (7, 3), (5, 10)])
+def test_frame_ranges_cover_every_frame_once(frames, workers):
+    ranges = frame_ranges(frames, workers)
+    assert len(ranges) == min(frames, workers)
+    covered = [frame for start, end in ranges for frame in range(start, end + 1)]
+    assert covered == list(range(1, frames + 1))
+    sizes = [end - start + 1 for start, end in ranges]
+    assert max(sizes) - min(sizes) <= 1
+
+def test_frame_ranges_with_no_workers():
+    assert frame_ranges(10, 0) == [(1, 10)]
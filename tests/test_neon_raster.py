@@ -0,0 +1,23 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import neon_description
+from neon_raster import rasterize, to_srgb8
+
+def test_rasterize_draws_near_over_far():
+    image = rasterize(neon_description(), glow=False)
+    assert image.shape == (100, 100, 3)
+    # Sphere center, square outside the sphere, tube, empty background
+    assert image[50, 50].argmax() == 0
+    assert image[50, 65].argmax() == 2
+    assert image[20, 50].argmax() == 1
+    assert image[80, 80].max() == 0
+    assert image[5, 5].max() == 0
+
+def test_rasterize_glow_and_width():
+    plain = rasterize(neon_description(), glow=False)
+    glowing = rasterize(neon_description())
+    assert glowing.sum() > plain.sum()
+    assert rasterize(neon_description(), width=50, glow=False).shape == (50, 50, 3)
+    assert to_srgb8(plain).dtype == np.uint8
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from conftest import neon_description
+from neon_svg import scene_svg
+
+def test_scene_svg_elements():
+    document = scene_svg(neon_description())
+    assert document.startswith('<svg ') and document.rstrip().endswith('</svg>')
+    assert 'width="100" height="100"' in document
+    assert document.count('<circle') == 1
+    assert document.count('<rect x=') == 1
+    assert document.count('<line') == 1
+    # Painted far to near: the square before the sphere
+    assert document.index('<rect x=') < document.index('<circle')
+    assert 'cx="50" cy="50" r="10"' in document
+    assert 'x="30" y="30" width="40" height="40"' in document
+
+def test_glow_passes_are_weighted():
+    from neon_raster import GLOW_SCALES
+
+    document = scene_svg(neon_description())
+    assert document.count('<feGaussianBlur') == len(GLOW_SCALES)
+    for i, (_, weight) in enumerate(GLOW_SCALES):
+        assert (f'<feComponentTransfer in="blur{i}" result="glow{i}">'
+                f'<feFuncA type="linear" slope="{weight:g}"/>') in document
+        assert f'<feMergeNode in="glow{i}"/>' in document
@@ -0,0 +1,52 @@
+import importlib.util
+
+import pytest
+
+import render_cache
+from render_cache import function_fingerprint, scene_key
+
+SCENE_SOURCE = '''
+RADIUS = {radius}
+
+def helper():
+    return {helper}
+
+def create_scene():
+    return helper() * RADIUS
+'''
+
+@pytest.fixture
+def load_scene(tmp_path, monkeypatch):
+    """Load a generator module from its own directory, counted as a local script"""
+    count = [0]
+
+    def load(radius=1.0, helper=2):
+        count[0] += 1
+        directory = tmp_path / f"scripts{count[0]}"
+        directory.mkdir()
+        path = directory / "generator.py"
+        path.write_text(SCENE_SOURCE.format(radius=radius, helper=helper))
+        spec = importlib.util.spec_from_file_location("generator", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        monkeypatch.setattr(render_cache, 'SCRIPT_DIR', str(directory))
+        return function_fingerprint(module.create_scene)
+
+    return load
+
+def test_fingerprint_is_stable(load_scene):
+    assert load_scene() == load_scene()
+
+def test_fingerprint_follows_helpers(load_scene):
+    assert load_scene(helper=2) != load_scene(helper=3)
+
+def test_fingerprint_follows_constants(load_scene):
+    assert load_scene(radius=1.0) != load_scene(radius=1.5)
+
+def test_scene_key_covers_seed_and_settings():
+    def scene():
+        pass
+    key = scene_key(scene, seed=1, settings={'quality': 'final'})
+    assert key == scene_key(scene, seed=1, settings={'quality': 'final'})
+    assert key != scene_key(scene, seed=2, settings={'quality': 'final'})
+    assert key != scene_key(scene, seed=1, settings={'quality': 'draft'})
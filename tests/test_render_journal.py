@@ -0,0 +1,90 @@
+import os
+import stat
+import sys
+import textwrap
+
+from render_driver import run_job
+from render_journal import DONE, FAILED, PENDING, RUNNING, RunJournal
+from render_schedule import RenderTimes
+
+def test_resume_keeps_done_scenes(tmp_path):
+    path = str(tmp_path / "journal.json")
+    output = tmp_path / "a.png"
+    output.write_bytes(b"image")
+    journal = RunJournal(path)
+    journal.add_pending(['a.png', 'b.png'])
+    journal.mark('a.png', RUNNING)
+    journal.mark('a.png', DONE, output_hash=None)
+    journal.mark('b.png', RUNNING)
+
+    resumed = RunJournal(path, resume=True)
+    assert resumed.is_complete('a.png', str(output))
+    assert not resumed.is_complete('b.png')
+    assert resumed.entries['a.png']['attempts'] == 1
+    assert resumed.counts() == {DONE: 1, RUNNING: 1}
+    assert RunJournal(path).entries == {}
+
+def test_changed_output_is_not_complete(tmp_path):
+    from render_cache import file_hash
+
+    output = tmp_path / "a.png"
+    output.write_bytes(b"image")
+    journal = RunJournal(str(tmp_path / "journal.json"))
+    journal.mark('a.png', DONE, output_hash=file_hash(str(output)))
+    assert journal.is_complete('a.png', str(output))
+    output.write_bytes(b"edited")
+    assert not journal.is_complete('a.png', str(output))
+    output.unlink()
+    assert not journal.is_complete('a.png', str(output))
+
+def test_add_pending_keeps_attempts(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.json"))
+    journal.mark('a.png', RUNNING)
+    journal.mark('a.png', FAILED, error="crash")
+    journal.add_pending(['a.png'])
+    assert journal.state('a.png') == PENDING
+    assert journal.entries['a.png']['attempts'] == 1
+
+FAKE_BLENDER = """\
+#!{python}
+import sys
+import time
+for scene in sys.argv[sys.argv.index('--') + 1:]:
+    if not scene.endswith('.png'):
+        continue
+    print('SCENE_STARTED', scene, flush=True)
+    if scene == 'hang.png':
+        time.sleep(60)
+    print('SCENE_DONE', scene, '0.01', 'build=0.01', 'render=0.02', flush=True)
+"""
+
+def test_hung_scene_is_killed_and_failed(tmp_path):
+    blender = tmp_path / "blender"
+    blender.write_text(textwrap.dedent(FAKE_BLENDER.format(python=sys.executable)))
+    blender.chmod(blender.stat().st_mode | stat.S_IXUSR)
+    journal = RunJournal(str(tmp_path / "journal.json"))
+    scenes = ['a.png', 'hang.png', 'b.png']
+    journal.add_pending(scenes)
+    job = {
+        'name': "worker0",
+        'scenes': scenes,
+        'times': RenderTimes(str(tmp_path / "render_times.json")),
+        'blender': str(blender),
+        'script': "generator.py",
+        'options': ['--seed', '0'],
+        'output': str(tmp_path / "out"),
+        'log': str(tmp_path / "worker0.log"),
+    }
+
+    run_job(job, journal, timeout=1, retries=1)
+    assert sorted(job['done']) == ['a.png', 'b.png']
+    assert job['failed'] == ['hang.png']
+    assert job['missing'] == []
+    # hang.png is killed, retried and killed again; b.png then runs on its own
+    assert job['attempts'] == 3
+    assert journal.entries['hang.png']['state'] == FAILED
+    assert journal.entries['hang.png']['error'] == "timeout"
+    assert journal.entries['hang.png']['attempts'] == 2
+    assert journal.state('b.png') == DONE
+    assert job['times'].recorded == 2
+    assert os.path.exists(job['log'])
@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from conftest import SCRIPTS_DIR
+import render_queue
+from render_queue import CLAIMED, DONE, PENDING, claim, enqueue, job_file, reap
+
+SCENES = [f"scene_{i}/image_{j}.png" for i in range(3) for j in range(4)]
+
+def test_claim_refreshes_heartbeat(tmp_path):
+    queue = str(tmp_path / "queue")
+    enqueue(queue, ["a/b.png"], output_root=str(tmp_path / "out"))
+    pending = os.path.join(queue, PENDING, job_file("a/b.png"))
+    old = time.time() - 10 * render_queue.LEASE_SECONDS
+    os.utime(pending, (old, old))
+
+    path, job = claim(queue, "me")
+    assert job['attempts'] == 1
+    assert reap(queue) == []
+    assert os.path.exists(path)
+
+def test_reap_requeues_expired_claims(tmp_path):
+    queue = str(tmp_path / "queue")
+    enqueue(queue, ["a/b.png"], output_root=str(tmp_path / "out"))
+    path, _ = claim(queue, "me")
+    old = time.time() - 10 * render_queue.LEASE_SECONDS
+    os.utime(path, (old, old))
+
+    assert reap(queue) == [job_file("a/b.png")]
+    assert os.listdir(os.path.join(queue, PENDING)) == [job_file("a/b.png")]
+    assert os.listdir(os.path.join(queue, CLAIMED)) == []
+    with open(os.path.join(queue, PENDING, job_file("a/b.png"))) as f:
+        assert json.load(f)['error'] == "lease expired on me"
+
+def test_reap_losing_the_race_changes_nothing(tmp_path, monkeypatch):
+    queue = str(tmp_path / "queue")
+    enqueue(queue, ["a/b.png"], output_root=str(tmp_path / "out"))
+    path, _ = claim(queue, "me")
+    old = time.time() - 10 * render_queue.LEASE_SECONDS
+    os.utime(path, (old, old))
+    read = render_queue._read
+
+    def read_then_lose(job_path):
+        # Another reaper requeues the job and a worker claims it meanwhile
+        job = read(job_path)
+        monkeypatch.setattr(render_queue, '_read', read)
+        os.rename(job_path, os.path.join(queue, PENDING, job_file("a/b.png")))
+        claim(queue, "other")
+        return job
+
+    monkeypatch.setattr(render_queue, '_read', read_then_lose)
+    assert reap(queue) == []
+    assert os.listdir(os.path.join(queue, PENDING)) == []
+    with open(os.path.join(queue, CLAIMED, job_file("a/b.png"))) as f:
+        assert json.load(f)['worker'] == "other"
+
+def test_two_workers_drain_queue_once(tmp_path):
+    queue = str(tmp_path / "queue")
+    output = str(tmp_path / "out")
+    enqueue(queue, SCENES, output_root=output)
+
+    command = [sys.executable, os.path.join(SCRIPTS_DIR, "render_queue.py"), 'work', '--queue', queue, '--stub']
+    workers = [subprocess.Popen(command, stdout=subprocess.DEVNULL) for _ in range(2)]
+    assert [worker.wait(timeout=120) for worker in workers] == [0, 0]
+
+    assert sorted(os.listdir(os.path.join(queue, DONE))) == sorted(job_file(scene) for scene in SCENES)
+    assert os.listdir(os.path.join(queue, PENDING)) == []
+    assert os.listdir(os.path.join(queue, CLAIMED)) == []
+    for scene in SCENES:
+        with open(os.path.join(output, scene)) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1, f"{scene} rendered {len(lines)} times"
+        with open(os.path.join(queue, DONE, job_file(scene))) as f:
+            assert json.load(f)['attempts'] == 1
@@ -0,0 +1,41 @@
+from render_schedule import DEFAULT_ESTIMATE, RenderTimes, lpt_schedule
+
+def test_lpt_schedule_balances_longest_first():
+    estimates = {'a': 7, 'b': 5, 'c': 4, 'd': 3, 'e': 3, 'f': 2}
+    plan = lpt_schedule(estimates, 2)
+    assert sorted(scene for scenes, _ in plan for scene in scenes) == sorted(estimates)
+    assert sorted(load for _, load in plan) == [12, 12]
+    assert plan[0][0][0] == 'a'
+
+def test_lpt_schedule_drops_idle_workers():
+    plan = lpt_schedule({'a': 1, 'b': 2}, 8)
+    assert len(plan) == 2
+    assert lpt_schedule({}, 4) == []
+    assert lpt_schedule({'a': 1}, 0) == [(['a'], 1)]
+
+def test_record_smooths_and_saves(tmp_path):
+    path = str(tmp_path / "render_times.json")
+    times = RenderTimes(path)
+    times.record('a.png', 10, 20, objects=100)
+    times.record('a.png', 20, 40)
+    assert times.total('a.png') == 45
+    assert times.entries['a.png']['runs'] == 2
+    assert times.recorded == 2
+    times.save()
+
+    reloaded = RenderTimes(path)
+    assert 'a.png' in reloaded
+    assert reloaded.total('a.png') == 45
+    assert reloaded.recorded == 0
+
+def test_estimate_falls_back_to_object_model_and_mean(tmp_path):
+    times = RenderTimes(str(tmp_path / "missing.json"))
+    assert times.estimate('new.png') == DEFAULT_ESTIMATE
+
+    times.record('small.png', 1, 9, objects=10)
+    times.record('large.png', 2, 28, objects=30)
+    intercept, slope = times.object_model()
+    assert (intercept, slope) == (0.0, 1.0)
+    assert times.estimate('new.png', objects=20) == 20
+    assert times.estimate('new.png') == 20
+    assert times.estimate('small.png', objects=1000) == 10
@@ -0,0 +1,97 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from resolution_ladder import DEFAULT_SIZE, lanczos_weights, resize, variant_path
+
+@pytest.mark.parametrize('in_size, out_size', [(2160, 1080), (2160, 270), (1080, 540), (100, 300)])
+def test_lanczos_weights_are_normalized(in_size, out_size):
+    indices, weights = lanczos_weights(in_size, out_size)
+    assert indices.shape == weights.shape
+    assert indices.shape[0] == out_size
+    assert indices.min() >= 0 and indices.max() < in_size
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0, atol=1e-5)
+
+def test_resize_keeps_flat_color_and_mean():
+    flat = np.full((64, 128, 4), 0.25, dtype=np.float32)
+    flat[..., 3] = 1.0
+    np.testing.assert_allclose(resize(flat, 32, 16), np.broadcast_to(flat[0, 0], (16, 32, 4)), atol=1e-5)
+
+    ramp = np.zeros((64, 128, 4), dtype=np.float32)
+    ramp[..., :3] = np.linspace(0.2, 0.8, 128, dtype=np.float32)[None, :, None]
+    ramp[..., 3] = 1.0
+    small = resize(ramp, 32, 16)
+    assert small.shape == (16, 32, 4)
+    assert abs(small[..., :3].mean() - ramp[..., :3].mean()) < 1e-3
+    assert (np.diff(small[0, :, 0]) > 0).all()
+
+def test_resize_does_not_bleed_transparent_color():
+    pixels = np.zeros((32, 32, 4), dtype=np.float32)
+    pixels[:, :16] = (0, 1, 0, 0)  # Transparent, with a color that must not show
+    pixels[:, 16:] = (1, 0, 0, 1)
+    small = resize(pixels, 16, 16)
+    opaque = small[..., 3] > 0.01
+    assert opaque.any()
+    assert small[opaque][:, 1].max() < 1e-3
+
+def test_variant_path():
+    assert variant_path("public/a/b.png", DEFAULT_SIZE) == "public/a/b.png"
+    assert variant_path("public/a/b.png", 2160) == "public/a/b_2160.png"
+
+@pytest.fixture
+def fake_images(monkeypatch):
+    """Masters and variants as .npy data instead of Blender images"""
+    import resolution_ladder
+
+    def load(path):
+        with open(path, 'rb') as f:
+            return np.load(f)
+
+    def save(pixels, path):
+        with open(path, 'wb') as f:
+            np.save(f, pixels)
+
+    monkeypatch.setattr(resolution_ladder, '_load_pixels', load)
+    monkeypatch.setattr(resolution_ladder, '_save_png', save)
+    return save
+
+def _manifest(directory):
+    import json
+
+    with open(directory / "manifest.json") as f:
+        return json.load(f)
+
+def test_smaller_ladder_prunes_larger_variants(tmp_path, fake_images):
+    from resolution_ladder import write_ladder
+
+    path = str(tmp_path / "scene.png")
+    fake_images(np.ones((4, 2160, 4), dtype=np.float32), str(tmp_path / "master.png"))
+    write_ladder(str(tmp_path / "master.png"), path)
+    assert sorted(_manifest(tmp_path)["scene.png"]["variants"]) == ["1080", "2160", "270", "540"]
+
+    fake_images(np.ones((4, 540, 4), dtype=np.float32), str(tmp_path / "master.png"))
+    write_ladder(str(tmp_path / "master.png"), path)
+    assert _manifest(tmp_path)["scene.png"]["variants"] == {"270": "scene_270.png", "540": "scene.png"}
+    assert sorted(p.name for p in tmp_path.glob("*.png")) == ["scene.png", "scene_270.png"]
+
+def test_single_image_drops_ladder(tmp_path, fake_images):
+    from resolution_ladder import drop_ladder, write_ladder
+
+    for name in ("scene.png", "other.png"):
+        fake_images(np.ones((4, 2160, 4), dtype=np.float32), str(tmp_path / "master.png"))
+        write_ladder(str(tmp_path / "master.png"), str(tmp_path / name))
+
+    # A draft render overwrites scene.png with a single image
+    fake_images(np.ones((4, 800, 4), dtype=np.float32), str(tmp_path / "scene.png"))
+    drop_ladder(str(tmp_path / "scene.png"))
+    assert "scene.png" not in _manifest(tmp_path)
+    assert "other.png" in _manifest(tmp_path)
+    assert sorted(p.name for p in tmp_path.glob("scene*")) == ["scene.png"]
+    assert len(list(tmp_path.glob("other*"))) == 4
+
+def test_drop_ladder_without_manifest_writes_nothing(tmp_path):
+    from resolution_ladder import drop_ladder
+
+    (tmp_path / "scene.png").write_bytes(b"png")
+    drop_ladder(str(tmp_path / "scene.png"))
+    assert [p.name for p in tmp_path.iterdir()] == ["scene.png"]
@@ -0,0 +1,24 @@
+import pytest
+
+from tiled_render import tile_rect
+
+@pytest.mark.parametrize('width, height, grid', [(2160, 2160, 2), (1000, 700, 3), (4096, 2304, 4)])
+def test_tile_cores_partition_the_image(width, height, grid):
+    covered = [[0] * width for _ in range(grid)]
+    area = 0
+    for row in range(grid):
+        for column in range(grid):
+            (x0, y0, x1, y1), _ = tile_rect(width, height, column, row, grid)
+            assert 0 <= x0 < x1 <= width and 0 <= y0 < y1 <= height
+            area += (x1 - x0) * (y1 - y0)
+            for x in range(x0, x1):
+                covered[row][x] += 1
+    assert area == width * height
+    assert all(count == 1 for row in covered for count in row)
+
+def test_rendered_region_overlaps_within_the_image():
+    core, rendered = tile_rect(1000, 1000, 0, 1, 2, overlap=32)
+    assert core == (0, 500, 500, 1000)
+    assert rendered == (0, 468, 532, 1000)
+    core, rendered = tile_rect(1000, 1000, 1, 0, 2, overlap=0)
+    assert rendered == core